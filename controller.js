@@ -101,7 +101,7 @@ const app = Vue.createApp({
     computed: {
         vehicleLinks() {
             result = [];
-            for (const [name, vehicle] of Object.entries(allVehicles)) {
+            for (const [name, vehicle] of Object.entries(publishedVehicles())) {
                 result.push({
                     name: vehicle.displayName,
                     target: { name: "vehicle", params: { vehicleName: name }}
@@ -608,7 +608,7 @@ const router = VueRouter.createRouter({
             path: "/customize/:serialized",
             redirect: to => {
                 const vehicleName = deserializeV1VehicleName(to.params.serialized);
-                if (!(vehicleName in allVehicles)) {
+                if (!(vehicleName in publishedVehicles())) {
                     return { name: "grid" }
                 }
 
@@ -624,7 +624,7 @@ const router = VueRouter.createRouter({
         {
 			path: "/ships/:vehicleName",
             redirect: to => {
-                if (!(to.params.vehicleName in allVehicles)) {
+                if (!(to.params.vehicleName in publishedVehicles())) {
                     return { name: "grid" }
                 }
 
@@ -640,6 +640,23 @@ const router = VueRouter.createRouter({
 });
 app.use(router);
 
+// Vehicles loaded from shards are only the ones the first page needed, so fetch the ones another page needs before
+// showing it. Saved loadouts are read again, since those of vehicles that weren't loaded couldn't be read before.
+router.beforeEach((to) => {
+    if (typeof shardManifest == "undefined") {
+        return;
+    }
+
+    const needed = to.params.vehicleName ? [to.params.vehicleName] : Object.keys(shardManifest.vehicles);
+    const missing = needed.filter(n => n in shardManifest.vehicles && !(n in allVehicles));
+    if (missing.length) {
+        return fetchVehicleShards(missing).then(vehicles => {
+            addVehicles(vehicles);
+            loadoutStorage.read();
+        });
+    }
+});
+
 const gaTrackingId = "UA-117108133-1";
 router.afterEach((to, from) => {
     gtag("config", gaTrackingId, {"page_path": to.path, "page_title": to.name});
@@ -0,0 +1 @@
+const binaryDataFiles = {};
\ No newline at end of file
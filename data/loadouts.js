@@ -0,0 +1 @@
+const loadoutTables = {"portNames": [], "itemNames": [], "vehicles": {}, "items": {}};
\ No newline at end of file
@@ -0,0 +1 @@
+const portIndex = {"Door": {"": {"1": {"": ["DRAK_Corsair_Docking_Collar", "DRAK_Corsair_Elevator_Door_Ext_Lower", "DRAK_Corsair_Elevator_Door_Ext_Upper", "DoorDefault", "DoorDefaultPowered", "DoorDefaultRoomConnector", "Door_Double_AEGS_1", "Door_Double_AEGS_2", "Door_Double_BlastDoor_AEGS", "Door_Double_Lift_AEGS", "Door_EscapePods_AEGS", "Door_Ship_Ladder", "Door_Single_AEGS_1", "Door_Single_AEGS_2", "Door_Single_AEGS_3", "Door_Single_BlastDoor_AEGS", "Door_Single_Cmpt_AEGS", "Elevator_Levski_Door", "Ht_D_Int_Door_Double_A", "Lowtech_Truck_Shaft_Door_Double_A", "Lt_B_Roomlg_Door_Double_A", "Lt_B_Roomsm_B_Door_Double_A", "Lt_B_Roomsm_B_Door_Single_A", "Lt_B_Roomsm_Door_Double_A", "Lt_Door_Double_A", "Lt_Door_Single_A", "Hangar_Door_Levski", "Hangar_Door_Front_Large_A", "Hangar_Door_Front_Medium_A", "Hangar_Door_Front_Sml_A", "Hangar_Door_WhiteBox", "Hangar_Door_Whitebox_Top", "Hangar_door_top_large_a", "Hangar_door_top_medium_a", "Hangar_door_top_sml_a", "Hangar_door_top_xl_a", "Ht_C_Hab_Door_Single", "Ht_D_Int_Door_Double_B", "Ht_D_Int_Door_Double_C", "Ht_Shuttle_Doors", "Lowtech_Truck_Shaft_Door_Double_Elev", "Lt_A_Lorville_CBD_Door_Double", "Lt_B_Hab_Door_Single", "Lt_B_Roomlg_Door_Double_A_Prison", "Lt_B_Roomlg_WindowShutter_Bespoke", "Lt_B_Roomsm_Door_Double_B", "Lt_B_Roomsm_Door_Double_C", "Lt_Door_Double_A_KareahContraband", "Maintenance_Wallpanel_Door", "Maintenance_Wallpanel_Top", "RSI_Const_PH_Cargo_Elevator", "RSI_Phoenix_Door_Comp_Left", "RSI_Phoenix_Door_Comp_Left_Tail", "RSI_Phoenix_Door_Comp_Right", "RSI_Phoenix_Door_Comp_Right_Tail", "RSI_Phoenix_Door_HotTub", "Util_a_hangar_walkway_hatch_001_a", "VentDoor_ext_hatch_a", "VentDoor_int_hatch_a", "VentHatch_Lt_B_Floor_a", "ht_D_Int_Door_Double_Glass_A", "prison_auto_door_a", "ORIG_100i_Cover_Back", "ORIG_600i_TV", "MISC_Freelancer_Base_Kitchen_Door", "MISC_Freelancer_Base_Toilet_Door", "A18_Door_ioNorth_Entrance", "CRUS_Star_Runner_Cargo_Hold_Lift", "CRUS_Star_Runner_Door_Bathroom", "CRUS_Star_Runner_Door_Secret_Cargo", "CRUS_Star_Runner_Engineering_Sub_Level_Door", "CRUS_Star_Runner_Recreation_Table_Hatch", "CRUS_Star_Runner_Sublevel_Hatch", "Col_A_Ext_Garage_Door_A", "Col_A_Underfloor_Hatch_A", "Col_a_Int_Door_Single_A", "Col_a_Int_Door_Single_B", "CollisionTestDoor", "DRAK_Vulture_Door_Bathroom", "DoorDefaultTemplate_ControlPanel_Screen", "DoorDefaultTemplate_NoControlPanel", "DoorDefaultTemplate_Pumpable", "DoorDefaultTemplate_RequiresFPSConsumableHackingChip", "DoorDefaultTemplate_SystemicKeypad", "Door_Double_AEGS_3", "Door_Double_AEGS_4", "Door_Double_ANVL_Valkyrie_Cockpit", "Door_Double_Astroa_Glass", "Door_Double_Hngr_Business", "Door_Double_Hngr_Deluxe_Hub", "Door_Double_Hngr_Discount_Special", "Door_Double_Hngr_Pirate_Bay", "Door_Double_Hngr_Special_Exit", "Door_Double_NewDeal", "Door_Double_RSI_1", "Door_Double_RSI_2", "Door_Hangar_AEGS_1", "Door_MMHC", "Door_Ship_AEGS_Hammerhead_Bridge", "Door_Ship_AEGS_Hammerhead_Elevator_Cargo", "Door_Ship_AEGS_Hammerhead_Elevator_Interior", "Door_Ship_AEGS_Hammerhead_Elevator_Left", "Door_Ship_AEGS_Hammerhead_Engineering", "Door_Ship_AEGS_Reclaimer_Elevator_Ladder_Lift", "Door_Ship_Automatic", "Door_Ship_Exterior", "Door_Ship_ORIG_890_Cargo_Elevator", "Door_Ship_ORIG_890_Hangar_Elevator", "Door_Single_AEGS_4", "Door_Single_AEGS_5", "Door_Single_AEGS_6", "Door_Single_AEGS_7", "Door_Single_AEGS_Airlock", "Door_Single_AEGS_Avenger", "Door_Single_AEGS_Corridor_1", "Door_Single_AEGS_Corridor_2", "Door_Single_AEGS_Locked", "Door_Single_AEGS_Toilet", "Door_Single_Hab", "Door_Single_Hngr_Business", "Door_Single_Hngr_Business_Reverse", "Door_Single_Hngr_Discount_Master", "Door_Single_MISC_1", "Door_Single_MISC_2", "Door_Single_MISC_3", "Door_Single_MISC_4_Male", "Door_Single_ORIG_890J_Entrance", "Door_Single_Stanton_Customs", "Drlct_Habs_Door_Airlock_A", "Elevato_Business_Hangar_Door", "ElevatorDoorDefault_890Jump", "ElevatorDoorDefault_AEGS_Idris_Bridge", "ElevatorDoorDefault_AEGS_Idris_Cargo", "ElevatorDoorDefault_ANVL_Carrack", "ElevatorDoorDefault_Area18_AstroArmada", "ElevatorDoorDefault_Area18_Casaba", "ElevatorDoorDefault_Area18_CubbyBlast", "ElevatorDoorDefault_Area18_DumpersDepot", "ElevatorDoorDefault_Area18_GLoc", "ElevatorDoorDefault_Area18_TDD", "ElevatorDoorDefault_EmergencyDropOff", "ElevatorDoorDefault_MISC_Hull_C", "ElevatorDoorDefault_MISC_Hull_C_Platform", "ElevatorDoor_LightLinked", "Elevator_AEGS_Javelin_Bridge_Floor_01", "Elevator_AEGS_Javelin_Bridge_Floor_02", "Elevator_AEGS_Javelin_Bridge_Floor_03", "Elevator_Asteroid_Hangar_Door", "Elevator_Asteroid_Pirate_Door", "Elevator_Door_HighTech_Util", "Elevator_Hangar_Business_Door", "Elevator_Hangar_Deluxe_Door", "Elevator_Levski_Door_A", "Elevator_Lt_B_Roomlg_Door_Double_A", "Elevator_Lt_B_Roomlg_Door_Double_Elevator", "Elevator_Lt_B_Roomlg_ElevatorAddon_Interior_Door", "DoorDefaultTemplate_Pumpable_InstancedValues", "Elevator_Levski_Door_A_NoConnector", "AEGS_Vanguard_Locker", "ANVL_Carrack_Avionics_Case_Floor", "ANVL_Carrack_Avionics_Case_Wall", "ANVL_Carrack_Fuel_Case_Wall", "ANVL_Carrack_LifeSupport_Case_Wall", "ANVL_Carrack_PowerPlant_Case_Wall", "ANVL_Carrack_QT_Case_Wall", "ANVL_Carrack_Radar_Case_Wall", "ANVL_Carrack_Suit_Locker_Wall", "ARGO_MOLE_Locker", "CRUS_Star_Runner_Door_A_2m", "CRUS_Star_Runner_Door_A_4m", "DRAK_Corsair_Automatic_Door", "Door_Automatic_Hospital", "Door_Ship_Automatic_890Jump", "Door_Ship_Automatic_Advanced", "Door_Ship_Automatic_Advanced_Reclaimer_Lift", "Door_Ship_Automatic_BANU_Defender_Left", "Door_Ship_Automatic_CNOU_Mustang_Beta", "Door_Ship_Automatic_CNOU_Nomad", "Door_Ship_Automatic_DRAK_Cutlass", "Door_Ship_Automatic_DRAK_Vulture", "Door_Ship_Automatic_Hull_C_Tunnel_Rear", "Door_Ship_Automatic_RSI_Ursa", "Door_Ship_Automatic_Vanguard_Cockpit", "Door_Ship_Automatic_Windowed", "ORIG_100i_Cooler_Door_Left", "ORIG_100i_Cooler_Door_Right", "ORIG_100i_Jump_Door", "ORIG_100i_Radar_Door", "ElevatorDoorDefault_890Jump_A", "ElevatorDoorDefault_890Jump_B", "ElevatorDoorDefault_890Jump_Spa", "ElevatorDoorDefault_890Jump_Turret", "Door_Double_ANVL_Valkyrie_MainDeck", "CNOU_Nomad_Component_Power", "DRAK_Corsair_Ground_Refueling_Port", "DRAK_Corsair_Automatic_Door_Elevator_Rails", "DRAK_Corsair_Automatic_Door_Thin", "DoorDefaultTemplate_DoorEmptyInteractionPanel_DoorControl_9x16_Small_HiddenControls", "Door_Single_Orison_Medroom", "Door_Ship_Exterior_Damage", "Door_Ship_Exterior_Elevator", "Door_Ship_Exterior_Large", "Door_Ship_Exterior_MultiStage", "AEGS_Redeemer_Ramp", "ANVL_Carrack_Doors", "ANVL_Valkyrie_Door_Right", "ARGO_RAFT_Doors", "DRAK_Cutlass_Red_Airlock_Door", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Black_Left", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Black_Right", "Door_Ship_Ext_Dmg_MISC_Prospector_Rear", "Door_Ship_Exterior_400i_Docking_Collar", "Door_Ship_Exterior_400i_Entrance_Lift", "Door_Ship_Exterior_400i_Exterior_Door", "Door_Ship_Exterior_AEGS_Hammerhead_Cargo", "Door_Ship_Exterior_AEGS_Reclaimer_Airlock", "Door_Ship_Exterior_AEGS_Reclaimer_Cargo_Door", "Door_Ship_Exterior_AEGS_Reclaimer_Drone_Door", "Door_Ship_Exterior_AEGS_Reclaimer_Ladder_Lift", "Door_Ship_Exterior_AEGS_Reclaimer_Salvage_Lift", "Door_Ship_Exterior_AEGS_Retaliator", "Door_Ship_Exterior_AEGS_Retaliator_Elevator_Left", "Door_Ship_Exterior_ANVL_Hawk_Bounty_Pod", "Door_Ship_Exterior_ARGO_Cargo_Rear", "Door_Ship_Exterior_ARGO_MOLE_Elevator", "Door_Ship_Exterior_ARGO_RAFT_Lift_Door", "Door_Ship_Exterior_ARGO_Transport_Rear", "Door_Ship_Exterior_Airlock_MISC_Freelancer", "Door_Ship_Exterior_CRUS_Star_Runner_Rear_Ramp", "Door_Ship_Exterior_CRUS_Starlifter", "Door_Ship_Exterior_DRAK_Corsair_Docking_Door", "Door_Ship_Exterior_DRAK_Corsair_Elevator_Shaft_Int", "Door_Ship_Exterior_DRAK_Vulture_Cargo", "Door_Ship_Exterior_Damage_Ramptech", "Door_Ship_Exterior_Deploy", "Door_Ship_Exterior_Hull_C_Exterior_Door", "Door_Ship_Exterior_Idris_ARGO", "Door_Ship_Exterior_Idris_Front", "Door_Ship_Exterior_Idris_Turret_Cover", "Door_Ship_Exterior_Javelin_EscapePod", "Door_Ship_Exterior_Javelin_Hangar", "Door_Ship_Exterior_MISC_Fury_Blastshield", "Door_Ship_Exterior_MISC_Starfarer_Airlock", "Door_Ship_Exterior_MISC_Starfarer_Catwalk", "Door_Ship_Exterior_ORIG_600i_Droplift", "Door_Ship_Exterior_ORIG_600i_Elevator_Door", "Door_Ship_Exterior_ORIG_600i_Garage_Door", "Door_Ship_Exterior_RSI_Bengal_Aux", "Door_Ship_Exterior_RSI_Bengal_Front", "Door_Ship_Exterior_RSI_Bengal_Rear", "ESPR_Prowler_Door_Drop", "ORIG_100i_CargoDoor", "ORIG_100i_Door", "RSI_Constellation_Airlock", "RSI_Lynx_SideDoor", "RSI_Ursa_SideDoor", "Door_Ship_Exterior_Idris_ARGO_Locked", "Door_Ship_Automatic_BANU_Defender_Right", "Maintenance_Wallpanel_Bottom", "ANVL_Ballista_Side_Entrance", "ANVL_Centurion_Side_Entrance", "ANVL_Spartan_Rear_Entrance", "ANVL_Spartan_Side_Left_Entrance", "ANVL_Terrapin_Ramp", "BANU_Defender_Door_Exterior", "DRAK_Caterpillar_FrontElevator", "DRAK_Caterpillar_MainElevator", "DRAK_Caterpillar_SideElevator", "DRAK_Corsair_Door_Ramp", "DRAK_Cutter_Ramp", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Black_Rear", "Door_Ship_Exterior_AEGS_Avenger_Rear", "Door_Ship_Exterior_AEGS_Vanguard", "Door_Ship_Exterior_AEGS_Vanguard_Hoplite", "Door_Ship_Exterior_CNOU_Nomad", "Door_Ship_Exterior_CNOU_Nomad_Cargo_Bed", "Door_Ship_Exterior_Herald_Ladder_Attachable", "Door_Ship_Exterior_MISC_Freelancer", "Door_Ship_Exterior_ORIG_890Jump_Hangar", "Door_Ship_Exterior_RSI_Lynx_Fuelport", "Door_Ship_Exterior_Starfarer", "Door_Ship_Exterior_Starfarer_Ramp_Attachable", "ESPR_Prowler_Door_Ladder_Int", "ESPR_Prowler_Door_Rear_Ramp", "Hull_C_Front_Lift", "MISC_Reliant_Ramp", "ORIG_300i_CargoBay_Front", "ORIG_300i_CargoBay_Rear", "ORIG_400i_Entrance_Ramp", "ORIG_400i_Lift_Cargo", "ORIG_400i_Lift_Garage", "RSI_Constellation_CargoBay", "RSI_Constellation_Elevator", "RSI_Mantis_Door_Lift", "RSI_Ursa_Ramp", "TMBL_Cyclone_Ramp", "TMBL_Nova_Ramp", "DRAK_Corsair_Door_Ramp_Portal2_Trigger", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Black_Rear_Mercy", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Blue_Rear", "Door_Ship_Ext_Dmg_DRAK_Cutlass_Red_Rear", "Door_Ship_Automatic_890Jump_SpaGlass", "Door_Ship_Automatic_890Jump_Suite_A", "Door_Ship_Automatic_DRAK_Cutlass_Blue_Double", "Door_Ship_Automatic_DRAK_Cutlass_Red_Double", "Door_Ship_Exterior_ORIG_600i_Garage_Door_Exec", "Door_Single_MISC_2_White", "Door_Ship_Exterior_Airlock_MISC_Freelancer_MAX_Derelict", "Door_Ship_Automatic_Advanced_Fixed", "Door_Ship_Automatic_Advanced_Interaction_Highlight", "Door_Ship_Automatic_Advanced_Locked", "Door_Ship_Automatic_Advanced_ORIG_100i_Cooler_Door_Left", "Door_Ship_Automatic_Advanced_ORIG_100i_Cooler_Door_Right", "Door_Ship_Automatic_Advanced_ORIG_100i_Jump_Door", "Door_Ship_Automatic_Advanced_ORIG_100i_Radar_Door", "Door_Ship_Automatic_Advanced_Phoenix", "Door_Ship_Automatic_Advanced_Security", "Door_Ship_Automatic_Breached", "Door_Ship_Automatic_Advanced_Windowed", "Door_Ship_Exterior_ARGO_Cargo_Left", "Door_Ship_Exterior_ARGO_Cargo_Rear_MIL", "Door_Ship_Exterior_ARGO_Cargo_Right", "Door_Single_MISC_4_Female", "Door_Ship_AEGS_Hammerhead_Elevator_Right", "ElevatorDoor_LightLinked_x3", "ElevatorDoor_LightLinked_x4", "ElevatorDoor_LightLinked_x6", "Door_Double_AEGS_1_Bridge", "ANVL_Carrack_Antennas", "ANVL_Carrack_Docking_Door", "ANVL_Carrack_Door_Hangar", "ANVL_Carrack_Main_Ramp", "ANVL_Carrack_Pod_Door", "ANVL_Carrack_eva_door", "Door_Ship_Exterior_AEGS_Reclaimer_DockCollar", "Door_Ship_Exterior_AEGS_Retaliator_Dockring", "RSI_Constellation_Elevator_Aquila", "RSI_Constellation_Elevator_Phoenix", "RSI_Constellation_Elevator_Pirate", "DRAK_Cutlass_Blue_Airlock_Door", "DRAK_Cutlass_Red_Airlock_Door_Right", "DRAK_Cutlass_Red_Airlock_Ext_Hatch", "DRAK_Cutlass_Red_Airlock_Sleeve", "Door_Ship_Exterior_AEGS_Reclaimer_Elevator_Shaft_Int_Invisible", "Door_Ship_Exterior_DRAK_Corsair_Elevator_Shaft_Int_Roof", "ANVL_Spartan_Side_Right_Entrance", "Door_Ship_Exterior_Starfarer_Derelict", "Door_Ship_Exterior_Starfarer_XenoGenerator", "Door_Ship_Exterior_AEGS_Retaliator_Elevator_Right", "Door_Ship_Exterior_ARGO_Cargo_Left_MIL", "DRAK_Cutlass_Blue_Airlock_Sleeve", "Door_Ship_Exterior_Idris_Front_Left", "Door_Ship_Exterior_Idris_Front_Locked", "Door_Ship_Exterior_Idris_Front_Right", "AEGS_Bed_Bunk_Shutter_Bottom", "AEGS_Bed_Bunk_Shutter_Top", "Door_Ship_Exterior_CRUS_Starlifter_Elevator_Door", "Door_Ship_Exterior_CRUS_Starlifter_Front_Ramp", "Door_Ship_Exterior_CRUS_Starlifter_Rear_Ramp", "TMBL_Cyclone_Ramp_Locked", "Col_A_Underfloor_Hatch_A_Cuttable", "CRUS_Star_Runner_Sublevel_Hatch_Hab", "CRUS_Star_Runner_Sublevel_Hatch_ServerRoom", "Door_Ship_Exterior_ARGO_Cargo_Right_MIL", "AEGS_Vanguard_Locker_Guns", "Door_Ship_Automatic_Advanced_400i_Personal_Storage", "Door_Ship_Automatic_Advanced_Fixed_Javelin_Airlock_Interior_FW", "Door_Ship_Automatic_Advanced_Fixed_Lynx_WeaponLocker", "Door_Ship_Automatic_Advanced_Fixed_RSI_Lynx_Cockpit", "AEGS_Bed_Bunk_Shutter_Bottom_PLayer_Bespoke", "Door_Ship_Exterior_Idris_Rear", "RSI_Constellation_Airlock_Left", "RSI_Constellation_Airlock_Right", "ARGO_RAFT_Docking_Door", "Door_Ship_Exterior_ARGO_MOLE_Elevator_Door", "Door_Ship_Exterior_Javelin_Hangar_Invulnerable", "Door_Ship_Exterior_AEGS_Hammerhead_Left", "Door_Ship_Exterior_AEGS_Hammerhead_Right", "Door_Ship_Exterior_Javelin_EscapePod_02", "Door_Ship_Exterior_Javelin_EscapePod_03", "Door_Ship_Exterior_Javelin_EscapePod_04", "Door_Ship_Exterior_Javelin_EscapePod_05", "Door_Ship_Exterior_Javelin_EscapePod_Bridge", "Door_Ship_Automatic_Advanced_400i_Captain_Storage_B", "Door_Ship_Automatic_Advanced_400i_Captain_Storage_T", "DRAK_Caterpillar_SideElevator_Room1_Left", "DRAK_Caterpillar_SideElevator_Room1_Right", "DRAK_Caterpillar_SideElevator_Room2_Left", "DRAK_Caterpillar_SideElevator_Room2_Right", "DRAK_Caterpillar_SideElevator_Room3_Left", "DRAK_Caterpillar_SideElevator_Room3_Right", "DRAK_Caterpillar_SideElevator_Room4_Left", "DRAK_Caterpillar_SideElevator_Room4_Right", "RSI_Constellation_CargoBay_Aquila", "RSI_Constellation_CargoBay_Phoenix", "RSI_Constellation_CargoBay_Pirate", "RSI_Constellation_CargoBay_Taurus", "Door_Ship_Exterior_MISC_Freelancer_MAX", "DRAK_Cutlass_Blue_Airlock_Ext_Hatch", "Door_Ship_Exterior_AEGS_Vanguard_PIR", "Door_Ship_Exterior_CRUS_Starlifter_Rear_Ramp_A2", "ANVL_Pisces_Back_Door", "ANVL_Valkyrie_Door_Left", "ANVL_Valkyrie_Door_Right_CitizenCon", "ANVL_Valkyrie_Rear_Ramp", "Door_Ship_Automatic_Advanced_Phoenix_Left", "Door_Ship_Automatic_Advanced_Phoenix_Right", "Door_Ship_Exterior_Javelin_EscapePod_04_Invulnerable", "Door_Ship_Exterior_ORIG_890Jump_Cargo", "Door_Ship_Exterior_ORIG_890Jump_Entrance", "Door_Ship_Exterior_ORIG_890Jump_Hangar_Elevator", "TMBL_Cyclone_Ramp_TR", "RSI_Constellation_Elevator_Emerald", "Door_Ship_Exterior_Javelin_EscapePod_02_Invulnerable", "Door_Ship_Automatic_Advanced_Javelin_Airlock_Interior", "Door_Ship_Exterior_Javelin_EscapePod_03_Invulnerable", "Door_Ship_Exterior_MISC_Freelancer_MAX_Derelict", "Door_Ship_Exterior_Idris_Front_Left_Locked", "Door_Ship_Exterior_Javelin_EscapePod_Bridge_Invulnerable", "Door_Ship_Exterior_Idris_Front_Right_Locked", "ANVL_Pisces_C8R_Back_Door", "ANVL_Valkyrie_Door_Left_CitizenCon", "DRAK_Cutlass_Blue_Airlock_Door_Right", "Door_Ship_Exterior_Idris_Rear_Locked", "Door_Ship_Exterior_CRUS_Starlifter_Door_Bottom", "Door_Ship_Exterior_CRUS_Starlifter_Front_Door_Left", "Door_Ship_Exterior_CRUS_Starlifter_Front_Door_Right", "Door_Ship_Exterior_CRUS_Starlifter_Door_Bottom_A2", "Door_Ship_Exterior_Javelin_EscapePod_05_Invulnerable", "RSI_Constellation_CargoBay_Emerald", "Door_Ship_Exterior_ORIG_890Jump_Cargo_Elevator", "Door_Ship_Exterior_ORIG_890Jump_Entrance_Elevator"], "ORIG_300i_Base": ["ORIG_300i_Cargo_Cover_Rear", "ORIG_350r_Cargo_Cover_Front"]}}}, "Cargo": {"": {"1": {"": ["ANVL_Hornet_CargoGrid_F7C", "ARGO_MOLE_CargoGrid_Main", "ARGO_SRV_CargoGrid_Main", "CRUS_Starlifter_CargoGrid_Personal_Armory_Large", "CRUS_Starlifter_CargoGrid_Personal_Armory_Small", "CRUS_Starlifter_CargoGrid_Personal_Large", "MISC_Freelancer_CargoGrid_Rear_Turret", "MISC_Hull_C_FakeCargo", "MISC_Hull_C_FoldingStrut", "MISC_Hull_C_FoldingStrut_1A", "MISC_Hull_C_FoldingStrut_1A_Outer", "MISC_Hull_C_FoldingStrut_1B", "MISC_Hull_C_FoldingStrut_1B_Outer", "MISC_Hull_C_FoldingStrut_1C", "MISC_Hull_C_FoldingStrut_1C_Outer", "MISC_Hull_C_FoldingStrut_1D", "MISC_Hull_C_FoldingStrut_1D_Outer", "MISC_Hull_C_FoldingStrut_2A", "MISC_Hull_C_FoldingStrut_2A_Outer", "MISC_Hull_C_FoldingStrut_2B", "MISC_Hull_C_FoldingStrut_2B_Outer", "MISC_Hull_C_FoldingStrut_2C", "MISC_Hull_C_FoldingStrut_2C_Outer", "MISC_Hull_C_FoldingStrut_2D", "MISC_Hull_C_FoldingStrut_2D_Outer", "DRAK_Mule_CargoGrid_Side", "RSI_Ursa_CargoGrid_Rear", "DRAK_Mule_CargoGrid_Front", "PersonalStorage_400i", "PersonalStorage_ANVL_C8R", "PersonalStorage_Cutter", "PersonalStorage_DRAK_Corsair", "PersonalStorage_DRAK_Cutlass_01", "PersonalStorage_DRAK_Cutlass_02", "PersonalStorage_DRAK_Vulture", "PersonalStorage_GRIN_STV", "PersonalStorage_Hull_A", "PersonalStorage_Hull_C", "PersonalStorage_MISC_Fury", "PersonalStorage_MULE", "PersonalStorage_ORIG_300i", "PersonalStorage_RAFT", "PersonalStorage_RSI_Lynx_Left", "PersonalStorage_Redeemer_01", "PersonalStorage_Redeemer_02", "PersonalStorage_Redeemer_03", "PersonalStorage_Redeemer_04", "PersonalStorage_SPARTAN", "PersonalStorage_Scorpius", "PersonalStorage_Scorpius_CoPilot", "PersonalStorage_MISC_Fury_LX", "PersonalStorage_MISC_Fury_MX", "PersonalStorage_RSI_Lynx_Right", "MedicalStorage_ANVL_C8R"]}}}, "Container": {"": {"1": {"": ["Crafter_ResourceContainer", "ANVL_Pisces_BayDoor", "ANVL_Pisces_BayDoor_Bot", "ANVL_Pisces_BayDoor_Frame", "ANVL_Pisces_C8R_Siren", "ANVL_Pisces_C8R_Siren_Small", "CRUS_Starlifter_Ext_Door_Bottom", "CRUS_Starlifter_Ext_Door_Left_Lg_HACK", "CRUS_Starlifter_Ext_Door_Left_Sm_HACK", "CRUS_Starlifter_Ext_Door_Right_Lg_HACK", "CRUS_Starlifter_Ext_Door_Right_Sm_HACK", "RSI_Constellation_Base_BayWall_Right", "RSI_Constellation_PH_BayWall_Left", "RSI_Constellation_PH_BayWall_Right", "RSI_Constellation_TA_BayWall_Left", "RSI_Constellation_TA_BayWall_Right", "RSI_Constellation_Base_BayWall_Left"], "RSI_Constellation_Base": ["RSI_Constellation_Fake_Merlin", "RSI_Constellation_Fake_Archimedes"]}}, "Cargo": {"5": {"ANVL_Hornet_Base": ["ANVL_Hornet_F7C_Cargo_Mod", "UMNT_ANVL_S5_Cap", "UMNT_ANVL_S5_Rotodome"]}, "4": {"CNOU_Mustang_Base": ["CNOU_Mustang_Beta_Cover_Back", "CNOU_Mustang_Gamma_Cover_Back"], "": ["CNOU_Mustang_Cargo_Rack"], "RSI_Aurora_Base": ["RSI_Aurora_Cargo_Rack", "RSI_Aurora_Cargo_Rack_3SCU"]}, "1": {"": ["Cargo_Pod_F7C_TEMP", "Cargo_Pod_RAFT_TEMP", "Cargo_Mining_Pod", "Cargo_Mining_Pod_Mole"]}, "3": {"": ["TMBL_Cyclone_Module_AntiAir", "TMBL_Cyclone_Module_Cargo", "TMBL_Cyclone_Module_Racing", "TMBL_Cyclone_Module_Recon"]}}}, "FuelTank": {"Fuel": {"1": {"": ["HTNK_VNCL_Blade", "HTNK_VNCL_Glaive", "HTNK_VNCL_Scythe", "HTNK_XIAN_Nox", "HTNK_XIAN_Scout", "HTNK_AEGS_Avenger_Stalker", "HTNK_AEGS_Avenger_Titan", "HTNK_AEGS_Avenger_Warlock", "HTNK_AEGS_Eclipse", "HTNK_AEGS_Gladius", "HTNK_AEGS_Idris", "HTNK_AEGS_Reclaimer", "HTNK_AEGS_Retaliator", "HTNK_AEGS_Sabre", "HTNK_AEGS_Sabre_Raven", "HTNK_AEGS_Vanguard_Harbinger", "HTNK_AEGS_Vanguard_Hoplite", "HTNK_AEGS_Vanguard_Sentinel", "HTNK_AEGS_Vanguard_Warden", "HTNK_ANVL_Arrow", "HTNK_ANVL_Carrack", "HTNK_ANVL_Gladiator", "HTNK_ANVL_Hawk", "HTNK_ANVL_Hornet_F7A", "HTNK_ANVL_Hornet_F7A_Mk1", "HTNK_ANVL_Hornet_F7A_Mk2", "HTNK_ANVL_Hornet_F7C", "HTNK_ANVL_Hornet_F7CM", "HTNK_ANVL_Hornet_F7CR", "HTNK_ANVL_Hornet_F7CS", "HTNK_ANVL_Hurricane", "HTNK_ANVL_Lightning_F8", "HTNK_ANVL_Pisces", "HTNK_ANVL_Terrapin", "HTNK_ANVL_Valkyrie", "HTNK_ARGO_MOLE", "HTNK_ARGO_MPUV", "HTNK_ARGO_MPUV_Transport", "HTNK_ARGO_RAFT_Large", "HTNK_ARGO_RAFT_Small", "HTNK_BANU_Defender", "HTNK_CNOU_Mustang_Alpha", "HTNK_CNOU_Mustang_Beta", "HTNK_CNOU_Mustang_Delta", "HTNK_CNOU_Mustang_Gamma", "HTNK_CNOU_Mustang_Omega", "HTNK_CNOU_Nomad", "HTNK_CRUS_Star_Runner", "HTNK_CRUS_Starfighter", "HTNK_CRUS_Starlifter", "HTNK_DRAK_Buccaneer", "HTNK_DRAK_Caterpillar", "HTNK_DRAK_Corsair", "HTNK_DRAK_Cutlass_Black", "HTNK_DRAK_Cutlass_Red", "HTNK_DRAK_Cutlass_Steel", "HTNK_DRAK_Cutter", "HTNK_DRAK_Dragonfly", "HTNK_DRAK_Herald", "HTNK_DRAK_Vulture", "HTNK_Default", "HTNK_ESPR_Talon", "HTNK_KRIG_P52_Merlin", "HTNK_KRIG_P72_Archimedes", "HTNK_MISC_Freelancer", "HTNK_MISC_Freelancer_DUR", "HTNK_MISC_Freelancer_MAX", "HTNK_MISC_Freelancer_MIS", "HTNK_MISC_Fury", "HTNK_MISC_Fury_LX", "HTNK_MISC_Hull_A", "HTNK_MISC_Hull_C", "HTNK_MISC_Prospector", "HTNK_MISC_Razor", "HTNK_MISC_Reliant_Kore", "HTNK_MISC_Starfarer", "HTNK_MISC_Starfarer_Gemini", "HTNK_ORIG_100i", "HTNK_ORIG_300i", "HTNK_ORIG_315p", "HTNK_ORIG_325a", "HTNK_ORIG_350r", "HTNK_ORIG_400i", "HTNK_ORIG_600i", "HTNK_ORIG_85x", "HTNK_ORIG_890J", "HTNK_ORIG_M50", "HTNK_RSI_Aurora_CL", "HTNK_RSI_Aurora_ES", "HTNK_RSI_Aurora_LN", "HTNK_RSI_Aurora_LX", "HTNK_RSI_Aurora_MR", "HTNK_RSI_Bengal", "HTNK_RSI_Constellation_Andromeda", "HTNK_RSI_Constellation_Aquila", "HTNK_RSI_Constellation_Taurus", "HTNK_RSI_Mantis", "HTNK_RSI_Scorpius", "HTNK_MISC_Reliant_Mako", "HTNK_MISC_Reliant_Sen", "HTNK_MISC_Reliant_Tana", "INNK_ANVL_Lightning_F8"]}, "2": {"MISC_Starfarer_Base": ["MISC_FuelPod"], "": ["HTNK_AEGS_Redeemer", "HTNK_ESPR_Prowler"]}, "3": {"MISC_Starfarer_Base": ["MISC_FuelRefinery_L", "MISC_FuelRefinery_R"]}, "0": {"": ["HTNK_CNOU_HoverQuad"]}, "6": {"": ["HTNK_AEGS_Hammerhead"]}, "4": {"": ["HTNK_AEGS_Javelin"]}}}, "QuantumFuelTank": {"QuantumFuel": {"1": {"": ["QTNK_VNCL_Blade", "QTNK_VNCL_Glaive", "QTNK_VNCL_Scythe", "QTNK_XIAN_Scout", "QTNK_AEGS_Avenger_Stalker", "QTNK_AEGS_Avenger_Titan", "QTNK_AEGS_Avenger_Warlock", "QTNK_AEGS_Eclipse", "QTNK_AEGS_Gladius", "QTNK_AEGS_Hammerhead", "QTNK_AEGS_Idris", "QTNK_AEGS_Sabre", "QTNK_ANVL_Arrow", "QTNK_ANVL_Gladiator", "QTNK_ANVL_Hawk", "QTNK_ANVL_Hornet_F7A", "QTNK_ANVL_Hornet_F7A_Mk1", "QTNK_ANVL_Hornet_F7A_Mk2", "QTNK_ANVL_Hornet_F7C", "QTNK_ANVL_Hornet_F7CM", "QTNK_ANVL_Hornet_F7CR", "QTNK_ANVL_Hornet_F7CS", "QTNK_ANVL_Hornet_F8", "QTNK_ANVL_Hurricane", "QTNK_ANVL_Pisces", "QTNK_ANVL_Terrapin", "QTNK_ANVL_Valkyrie", "QTNK_ARGO_MOLE", "QTNK_BANU_Defender", "QTNK_CNOU_Mustang_Alpha", "QTNK_CNOU_Mustang_Beta", "QTNK_CNOU_Mustang_Delta", "QTNK_CNOU_Mustang_Gamma", "QTNK_CNOU_Mustang_Omega", "QTNK_CNOU_Nomad", "QTNK_CRUS_Star_Runner", "QTNK_CRUS_Starfighter", "QTNK_DRAK_Buccaneer", "QTNK_DRAK_Cutlass_Black", "QTNK_DRAK_Cutlass_Red", "QTNK_DRAK_Cutlass_Steel", "QTNK_DRAK_Cutter", "QTNK_DRAK_Herald", "QTNK_DRAK_Vulture", "QTNK_Default", "QTNK_ESPR_Talon", "QTNK_MISC_Freelancer_DUR", "QTNK_MISC_Freelancer_MAX", "QTNK_MISC_Freelancer_MIS", "QTNK_MISC_Hull_A", "QTNK_MISC_Prospector", "QTNK_MISC_Razor", "QTNK_MISC_Reliant_Kore", "QTNK_ORIG_100i", "QTNK_ORIG_300i", "QTNK_ORIG_315p", "QTNK_ORIG_325a", "QTNK_ORIG_350r", "QTNK_ORIG_400i", "QTNK_ORIG_85X", "QTNK_ORIG_m50", "QTNK_RSI_Aurora_CL", "QTNK_RSI_Aurora_ES", "QTNK_RSI_Aurora_LN", "QTNK_RSI_Aurora_LX", "QTNK_RSI_Aurora_MR", "QTNK_RSI_Constellation_Andromeda", "QTNK_RSI_Constellation_Aquila", "QTNK_RSI_Constellation_Taurus", "QTNK_RSI_Mantis", "QTNK_RSI_Scorpius", "QTNK_RSI_Scorpius_Antares", "QTNK_MISC_Reliant_Mako", "QTNK_MISC_Reliant_Sen", "QTNK_MISC_Reliant_Tana"]}, "2": {"": ["QTNK_AEGS_Javelin", "QTNK_AEGS_Reclaimer", "QTNK_AEGS_Redeemer", "QTNK_AEGS_Retaliator", "QTNK_AEGS_Vanguard_Harbinger", "QTNK_AEGS_Vanguard_Hoplite", "QTNK_AEGS_Vanguard_Sentinel", "QTNK_AEGS_Vanguard_Warden", "QTNK_ARGO_RAFT_Large", "QTNK_ARGO_RAFT_Small", "QTNK_DRAK_Caterpillar", "QTNK_DRAK_Corsair", "QTNK_ESPR_Prowler", "QTNK_MISC_Freelancer", "QTNK_ORIG_600i", "QTNK_ORIG_890J", "QTNK_RSI_Bengal"]}, "3": {"": ["QTNK_ANVL_Carrack", "QTNK_CRUS_Starlifter", "QTNK_MISC_Hull_C", "QTNK_MISC_Starfarer", "QTNK_MISC_Starfarer_Gemini"]}}}, "FuelIntake": {"Fuel": {"6": {"$MISC_Starfarer_Base": ["INTK_MISC_Starfarer_Nose_SCItem"]}, "1": {"": ["INTK_AEGS_Avenger_Stalker", "INTK_AEGS_Avenger_Titan", "INTK_AEGS_Avenger_Warlock", "INTK_AEGS_Eclipse", "INTK_AEGS_Gladius", "INTK_AEGS_Hammerhead", "INTK_AEGS_Reclaimer", "INTK_AEGS_Retaliator", "INTK_AEGS_Sabre", "INTK_AEGS_Sabre_Raven", "INTK_AEGS_Vanguard_Harbinger", "INTK_AEGS_Vanguard_Hoplite", "INTK_AEGS_Vanguard_Sentinel", "INTK_AEGS_Vanguard_Warden", "INTK_ANVL_Arrow", "INTK_ANVL_Carrack", "INTK_ANVL_Gladiator", "INTK_ANVL_Hawk", "INTK_ANVL_Hornet_F7A", "INTK_ANVL_Hornet_F7A_Mk1", "INTK_ANVL_Hornet_F7A_Mk2", "INTK_ANVL_Hornet_F7C", "INTK_ANVL_Hornet_F7CM", "INTK_ANVL_Hornet_F7CR", "INTK_ANVL_Hornet_F7CS", "INTK_ANVL_Hurricane", "INTK_ANVL_Lightning_F8", "INTK_ANVL_Pisces", "INTK_ANVL_Terrapin", "INTK_ANVL_Valkyrie", "INTK_ARGO_MOLE", "INTK_ARGO_MPUV", "INTK_ARGO_MPUV_Transport", "INTK_ARGO_RAFT", "INTK_BANU_Defender", "INTK_CNOU_HoverQuad", "INTK_CNOU_Mustang_Alpha", "INTK_CNOU_Mustang_Beta", "INTK_CNOU_Mustang_Delta", "INTK_CNOU_Mustang_Gamma", "INTK_CNOU_Mustang_Omega", "INTK_CNOU_Nomad", "INTK_CRUS_Star_Runner", "INTK_CRUS_Starfighter", "INTK_CRUS_Starlifter", "INTK_DRAK_Buccaneer", "INTK_DRAK_Caterpillar", "INTK_DRAK_Corsair", "INTK_DRAK_Cutlass_Black", "INTK_DRAK_Cutlass_Red", "INTK_DRAK_Cutlass_Steel", "INTK_DRAK_Cutter", "INTK_DRAK_Dragonfly", "INTK_DRAK_Herald", "INTK_DRAK_Vulture", "INTK_Default", "INTK_ESPR_Talon", "INTK_KRIG_P52_Merlin", "INTK_KRIG_P72_Archimedes", "INTK_MISC_Freelancer", "INTK_MISC_Freelancer_DUR", "INTK_MISC_Freelancer_MAX", "INTK_MISC_Freelancer_MIS", "INTK_MISC_Fury", "INTK_MISC_Fury_LX", "INTK_MISC_Hull_A", "INTK_MISC_Hull_C", "INTK_MISC_Prospector", "INTK_MISC_Razor", "INTK_MISC_Reliant_Kore", "INTK_MISC_Reliant_Mako", "INTK_MISC_Reliant_Sen", "INTK_MISC_Reliant_Tana", "INTK_MISC_Starfarer", "INTK_MISC_Starfarer_Gemini", "INTK_ORIG_100i", "INTK_ORIG_300i", "INTK_ORIG_315p", "INTK_ORIG_325a", "INTK_ORIG_350r", "INTK_ORIG_400i", "INTK_ORIG_600i", "INTK_ORIG_85x", "INTK_ORIG_890J", "INTK_ORIG_M50", "INTK_RSI_Aurora_CL", "INTK_RSI_Aurora_ES", "INTK_RSI_Aurora_LN", "INTK_RSI_Aurora_LX", "INTK_RSI_Aurora_MR", "INTK_RSI_Constellation_Andromeda", "INTK_RSI_Constellation_Aquila", "INTK_RSI_Constellation_Taurus", "INTK_RSI_Mantis", "INTK_RSI_Scorpius", "INTK_VNCL_Blade", "INTK_VNCL_Glaive", "INTK_VNCL_Scythe", "INTK_XIAN_Nox", "INTK_XIAN_Scout"]}, "4": {"": ["INTK_AEGS_Idris", "INTK_AEGS_Javelin"]}, "2": {"": ["INTK_AEGS_Redeemer", "INTK_ESPR_Prowler"]}}, "NoseMounted": {"2": {"": ["KRIG_P72_Archimedes_Intake"]}}, "": {"1": {"ORIG_300i_Base": ["ORIG_300i_Intake", "ORIG_315p_Intake", "ORIG_325a_Intake", "ORIG_350r_Intake"]}}}, "MissileLauncher": {"MissileRack": {"4": {"$AEGS_Redeemer": ["MRCK_S04_AEGS_Redeemer"], "$AEGS_Vanguard_Launcher": ["MRCK_S04_AEGS_Vanguard"], "": ["MRCK_S04_ANVL_Lightning_F8_Quad", "MRCK_S04_BEHR_Dual_S03", "MRCK_S04_BEHR_Octo_S01", "MRCK_S04_BEHR_Quad_S02", "MRCK_S04_BEHR_Single_S04", "MRCK_TALN_Colonial_S3x8", "MRCK_TALN_Colonial_S3x8_Orison"], "$ORIG_890Jump": ["MRCK_S04_ORIG_Octo_S01"], "CNOU_Nomad": ["MRCK_S04_CNOU_Quad_S02_Left", "MRCK_S04_CNOU_Quad_S02_Right"], "$ESPR_Talon_Base": ["MRCK_S04_ESPR_Talon", "MRCK_S04_ESPR_Talon_CAP", "MRCK_S04_ESPR_Talon_CAP_R"], "$ORIG_400i_Missile": ["MRCK_S04_ORIG_400i_Octo_S02", "MRCK_S04_ORIG_400i_Octo_S02_L"], "RSI_Constellation_Base": ["MRCK_S04_RSI_Constellation"], "RSI_Scorpius": ["MRCK_S04_RSI_Scorpius", "MRCK_S04_RSI_Scorpius_bottom_right", "MRCK_S04_RSI_Scorpius_top_left", "MRCK_S04_RSI_Scorpius_top_right"], "$VNCL_Glaive": ["MRCK_S04_VNCL_Quad_S02"]}, "5": {"AEGS_Vanguard_Base": ["MRCK_S05_AEGS_Vanguard"], "ANVL_Ballista": ["MRCK_ANVL_Ballista_Quad_S05"], "": ["MRCK_S05_BEHR_Dual_S04", "MRCK_S05_BEHR_Octo_S02", "MRCK_S05_BEHR_Quad_S03", "MRCK_S05_BEHR_Quad_S03_a", "MRCK_S05_BEHR_Single_S05", "MRCK_S05_CRUS_Starfighter_Left", "MRCK_S05_CRUS_Starfighter_Right"], "$MISC_Freelancer_MIS": ["MRCK_S05_MISC_Freelancer_MIS_Left", "MRCK_S05_MISC_Freelancer_MIS_Right"], "MISC_Reliant_Base": ["MRCK_S05_MISC_Reliant_Left", "MRCK_S05_MISC_Reliant_Right", "MISC_Reliant_Missile_Cap_Left", "MISC_Reliant_Missile_Cap_Right"], "$ORIG_600i_Missile": ["MRCK_S05_ORIG_600i_Quad_S03", "MRCK_S05_ORIG_600i_Quad_S03_Lower_Left", "MRCK_S05_ORIG_600i_Quad_S03_Lower_Right", "MRCK_S05_ORIG_600i_Quad_S03_Upper_Right"], "$ORIG_890Jump": ["MRCK_S05_ORIG_890J_Quad_S03", "MRCK_S05_ORIG_890J_Quad_S03_R"], "RSI_Constellation_Base": ["MRCK_S05_RSI_Constellation"]}, "8": {"Idris_Base": ["MRCK_S08_AEGS_Idris"], "": ["MRCK_S08_BEHR_Non_S05_PUDefenseTurret", "MRCK_S08_BEHR_Non_S05_PUDefenseTurret_Crusader", "MRCK_S08_BEHR_Non_S05_PUDefenseTurret_NoAnim"]}, "9": {"": ["MRCK_S09_AEGS_Eclipse", "MRCK_S09_AEGS_Retaliator_Fore", "MRCK_S09_AEGS_Retaliator_Rear", "MRCK_S12_AEGS_Javelin"]}, "6": {"ANVL_Gladiator": ["MRCK_S06_ANVL_Gladiator"], "": ["MRCK_S06_BEHR_Beehive_S02", "MRCK_S06_BEHR_Dual_S05", "MRCK_S06_BEHR_Octo_S03", "MRCK_S06_BEHR_Quad_S04", "MRCK_S06_BEHR_Single_S06"], "$MISC_Starfarer_Base": ["MRCK_S06_MISC_Gemini", "MRCK_S06_MISC_Gemini_Derelict"], "TMBL_Nova": ["MRCK_S06_TMBL_Nova_Custom"]}, "7": {"ANVL_Ballista": ["MRCK_S07_ANVL_Ballista_Duel"], "CRUS_Starfighter": ["MRCK_S07_CRUS_Starfighter"]}, "1": {"": ["MRCK_S01_BEHR_Single_S01"], "ORIG_300i_Base": ["MRCK_S05_ORIG_325a_Quad_S03"], "VNCL_Blade VNCL_Scythe_Base": ["VNCL_MissileRack_Blade"]}, "2": {"": ["MRCK_S02_BEHR_Dual_S01", "MRCK_S02_BEHR_Single_S02"], "Cyclone_AA": ["MRCK_S02_BEHR_Single_S02_Cyclone_AA"], "MISC_Fury": ["MRCK_S02_MISC_Fury"], "MISC_Fury_Miru": ["MRCK_S02_MISC_Fury_Dual"], "$ORIG_100i_Missile": ["MRCK_S02_ORIG_100i_Dual_S02"], "$ORIG_125a_Missile": ["MRCK_S02_ORIG_125a_Quad_S02"], "$ORIG_400i_Missile": ["MRCK_S02_ORIG_400i_Octo_S01", "MRCK_S02_ORIG_400i_Octo_S01_L"]}, "3": {"": ["MRCK_S03_BEHR_Dual_S02", "MRCK_S03_BEHR_Quad_S01", "MRCK_S03_BEHR_Single_S03"], "MISC_Fury_Miru": ["MRCK_S03_MISC_Fury_Dual"], "Cyclone_MT": ["MRCK_S03_TMBL_Dual_S02_Cyclone_MT_Left", "MRCK_S03_TMBL_Dual_S02_Cyclone_MT_Right"], "VNCL_Scythe_Base": ["MRCK_S03_VNCL_Quad_S01"], "VNCL_Blade_Base": ["MRCK_S03_VNCL_Quad_S01_Blade"]}}}, "Turret": {"BallTurret": {"3": {"CNOU_Mustang_Base": ["CNOU_Mustang_Gamma_Scoop_Front", "CNOU_Mustang_Nose_Turret"], "ANVL_Arrow_Base": ["ANVL_Arrow_Turret"], "ANVL_Terrapin_Base": ["ANVL_Terrapin_Nose_Turret"]}, "5": {"ANVL_Hornet_Base": ["ANVL_Fixed_Mount_Hornet_Ball_S4", "ANVL_Hornet_F7C_Ball_Turret", "ANVL_Hornet_F7A_Ball_Turret"], "CRUS_Star_Runner": ["CRUS_Star_Runner_Nose_Turret"], "ESPR_Prowler_Base": ["ESPR_Prowler_Remote_Turret"], "$MISC_Hull_A_Turret": ["MISC_Hull_A_Nose_Turret"], "": ["MISC_Hull_C_Nose_Turret"]}, "4": {"ANVL_Ballista": ["ANVL_Ballista_Remote_Top_Turret"], "$ANVL_Centurion_Turret": ["ANVL_Centurion_Remote_Top_Turret"], "ANVL_Spartan": ["ANVL_Spartan_Remote_Top_Turret"], "TMBL_Nova": ["TMBL_Nova_Remote_Gun_Turret"]}, "2": {"RSI_Ursa": ["RSI_Ursa_Rover_SCItem_BallTurret"]}, "1": {"RSI_Lynx": ["RSI_Lynx_Ball_Turret"]}}, "GunTurret": {"5": {"": ["AEGS_Idris_SCItem_AI_Turret", "AEGS_Idris_SCItem_AI_Turret_Bottom_Left", "AEGS_Idris_SCItem_AI_Turret_Bottom_Right", "AEGS_Idris_SCItem_AI_Turret_Top_Left", "AEGS_Idris_SCItem_AI_Turret_Top_Right", "ANVL_Valkyrie_SCItem_Remote_Turret", "ANVL_Valkyrie_SCItem_Remote_Turret_Left", "ANVL_Valkyrie_SCItem_Remote_Turret_Right", "RSI_Bengal_SCItem_Remote_Turret", "Mount_Gimbal_S5"], "AEGS_Reclaimer_Base": ["AEGS_Reclaimer_SCItem_Remote_Salvage_Turret", "AEGS_Reclaimer_SCItem_Remote_Turret", "AEGS_Reclaimer_SCItem_Remote_Turret_02", "AEGS_Reclaimer_SCItem_Remote_Turret_Bottom", "AEGS_Reclaimer_SCItem_Remote_Turret_Front_Left", "AEGS_Reclaimer_SCItem_Remote_Turret_Front_Right", "AEGS_Reclaimer_SCItem_Remote_Turret_Rear_Left", "AEGS_Reclaimer_SCItem_Remote_Turret_Rear_Right", "AEGS_Reclaimer_SCItem_Remote_Turret_Top"], "$ANVL_Carrack_Turret": ["ANVL_Carrack_SCItem_Remote_Turret"], "CRUS_Starlifter": ["CRUS_Starlifter_Bomb_Turret", "CRUS_Starlifter_SCItem_Remote_Turret_Main", "CRUS_Starlifter_SCItem_Remote_Turret_Main_A2", "CRUS_Starlifter_SCItem_Remote_Turret_Nose", "CRUS_Starlifter_SCItem_Remote_Turret_Rear", "CRUS_Starlifter_SCItem_Remote_Turret_Single", "CRUS_Starlifter_SCItem_Remote_Turret_Front_Left", "CRUS_Starlifter_SCItem_Remote_Turret_Front_Right"], "ANVL_Lightning_F8": ["ANVL_Lightning_F8_Turret"], "DRAK_Caterpillar_Base": ["DRAK_Dual_S3"], "ORIG_600i_Turret": ["ORIG_600i_SCItem_Remote_Turret", "ORIG_600i_SCItem_Remote_Turret_Bottom", "ORIG_600i_SCItem_Remote_Turret_Bottom_Exec", "ORIG_600i_SCItem_Remote_Turret_Exec"], "$ORIG_890Jump": ["ORIG_890j_SCItem_Remote_Turret", "ORIG_890j_SCItem_Remote_Turret_2"], "TMBL_Nova": ["TMBL_Nova_Main_Turret"]}, "8": {"": ["AEGS_Javelin_SCItem_Turret_Large", "AEGS_Javelin_SCItem_Turret_Large_Invulnerable", "RSI_Bengal_SCItem_Remote_Turret_AA", "RSI_Bengal_SCItem_Remote_Turret_Medium"]}, "3": {"$AEGS_Redeemer_Turret": ["AEGS_Redeemer_SCItem_Remote_Turret_Front", "AEGS_Redeemer_SCItem_Remote_Turret_Rear"], "$RSI_Scorpius_Turret": ["RSI_Scorpius_SCItem_Remote_Turret"], "ANVL_Valkyrie": ["ANVL_Valkyrie_Nose_Turret"], "DRAK_Caterpillar_Base": ["DRAK_Dual_S1"], "": ["Mount_Gimbal_S3", "Mount_Gimbal_S3_MM", "Mount_Gimbal_S3_S42"], "$ORIG_85x_Turret": ["ORIG_85X_Turret"], "ANVL_Lightning_F8": ["ANVL_Lightning_F8C_Turret"]}, "4": {"ARGO_RAFT_Turret": ["ARGO_RAFT_SCItem_Remote_Turret"], "MISC_Hull_C": ["MISC_Hull_C_SCItem_Remote_Turret", "MISC_Hull_C_SCItem_Remote_Turret_Rear", "MISC_Hull_C_SCItem_Tractor_Beam_Turret", "MISC_Hull_C_SCItem_Tractor_Beam_Turret_Bottom"], "ORIG_400i_Turret": ["ORIG_400i_SCItem_Remote_Turret", "ORIG_400i_SCItem_Remote_Turret_Bottom", "ORIG_400i_SCItem_Remote_Turret_Top"], "MISC_Reliant_Base": ["UMNT_MISC_S03_PL01", "GMNT_MISC_S03_PL01", "MISC_Reliant_Wing_Dual_Turret", "MISC_Reliant_Mako_Camera_Mount", "MISC_Reliant_Sen_Sensor_Mount"], "$AEGS_Avenger_Base": ["AEGS_Avenger_Nose_S3"], "DRAK_Buccaneer_Base": ["DRAK_Buccaneer_Dual_S2"], "": ["Mount_Gimbal_S4"]}, "6": {"CRUS_Starlifter": ["CRUS_Starlifter_SCItem_Remote_Turret_Dual", "CRUS_Starlifter_SCItem_Remote_Turret_Rear_Left", "CRUS_Starlifter_SCItem_Remote_Turret_Rear_Right"], "": ["RSI_Bengal_SCItem_Remote_Turret_Phalanx", "Mount_Gimbal_S6"]}, "12": {"": ["RSI_Bengal_SCItem_Remote_Turret_Main_Gun", "RSI_Bengal_SCItem_STS_Large_Turret"]}, "9": {"": ["RSI_Bengal_SCItem_STS_Turret", "RSI_Bengal_SCItem_AI_STS_Turret"], "$ANVL_Centurion_Turret": ["ANVL_Centurion_S4_Turret"]}, "2": {"": ["Mount_Gimbal_S2"]}, "1": {"": ["Mount_Gimbal_S1"], "salvageMount": ["Mount_Gimbal_Salvage"]}}, "Utility": {"5": {"AEGS_Reclaimer_Base": ["AEGS_Reclaimer_SCItem_Remote_Salvage_Turret_Left", "AEGS_Reclaimer_SCItem_Remote_Salvage_Turret_Right"]}}, "TopTurret": {"4": {"DRAK_Corsair_Remote_Turret": ["DRAK_Corsair_Remote_Turret_Tail", "DRAK_Corsair_Remote_Turret"], "DRAK_Cutlass_Base DRAK_Cutlass_Steel_Mount": ["DRAK_Cutlass_Steel_Rear_Remote_Dual_Turret"]}}, "MissileTurret": {"6": {"": ["RSI_Bengal_SCItem_Remote_Turret_MissileLauncher"]}, "5": {"$ORIG_890Jump": ["ORIG_890j_SCItem_Remote_Turret_Missile_Top_Left", "ORIG_890j_SCItem_Remote_Turret_Missile_Top_Right", "ORIG_890j_SCItem_Remote_Turret_Missile_Lower_Left", "ORIG_890j_SCItem_Remote_Turret_Missile_Lower_Right"]}, "9": {"ANVL_Ballista": ["ANVL_Ballista_Remote_Rear_Turret"]}}, "NoseMounted": {"5": {"MISC_Freelancer_Base": ["BEHR_PC2_Dual_S4_Fixed"], "$MISC_Freelancer_Base": ["BEHR_PC2_Dual_S3"]}, "6": {"$MISC_Starfarer_Base": ["BEHR_PC2_Dual_S4"]}}, "CanardTurret": {"3": {"ANVL_Hornet_Base": ["ANVL_Hornet_F7A_Nose_Turret", "ANVL_Hornet_F7C_Nose_Turret", "ANVL_Hornet_F7A_Mk1_Nose_Turret"]}}}, "WeaponGun": {"Gun": {"3": {"ORIG_300i_Base": ["ORIG_315p_Tractor_Beam"], "": ["AMRS_ScatterGun_S3", "APAR_BallisticScatterGun_S3", "HRST_LaserScatterGun_S3", "ASAD_DistortionRepeater_S3", "BEHR_BallisticRepeater_S3", "HRST_LaserRepeater_S3", "KLWE_LaserRepeater_S3", "MXOX_NeutronRepeater_S3", "AMRS_LaserCannon_S3", "BANU_TachyonCannon_S3", "BEHR_LaserCannon_S3", "ESPR_BallisticCannon_S3", "ESPR_LaserCannon_S3", "GATS_BallisticCannon_S3", "JOKR_DistortionCannon_S3", "KBAR_BallisticCannon_S3", "KLWE_MassDriver_S3", "KRIG_LaserCannon_S3", "KRON_LaserCannon_S3", "GATS_BallisticGatling_S3", "KRIG_BallisticGatling_S3", "KLWE_LaserRepeater_S3_MM", "KLWE_LaserRepeater_S3_S42", "GATS_BallisticGatling_S3_MM", "GATS_BallisticGatling_S3_S42"], "VNCL_Blade_Base": ["VNCL_PlasmaCannon_S3"]}, "2": {"Taurus_TractorBeam": ["RSI_Constellation_Taurus_Tractor_Beam"], "": ["APAR_BallisticScatterGun_S2", "HRST_LaserScatterGun_S2", "ASAD_DistortionRepeater_S2", "BEHR_BallisticRepeater_S2", "HRST_LaserRepeater_S2", "KLWE_LaserRepeater_S2", "MXOX_NeutronRepeater_S2", "AMRS_LaserCannon_S2", "APAR_MassDriver_S2", "BANU_TachyonCannon_S2", "BEHR_LaserCannon_S2", "ESPR_BallisticCannon_S2", "ESPR_LaserCannon_S2", "GATS_BallisticCannon_S2", "JOKR_DistortionCannon_S2", "KBAR_BallisticCannon_S2", "KLWE_MassDriver_S2", "KRON_LaserCannon_S2", "MXOX_NeutronCannon_S2", "GATS_BallisticGatling_S2"], "AEGS_Vanguard_Base VanguardNose": ["BEHR_BallisticRepeater_VNG_S2", "BEHR_DistortionRepeater_VNG_S2", "BEHR_LaserRepeater_VNG_S2", "BEHR_BallisticCannon_VNG_S2", "BEHR_DistortionCannon_VNG_S2", "BEHR_LaserCannon_VNG_S2"], "VNCL_Blade_Base": ["VNCL_LaserCannon_S2", "VNCL_PlasmaCannon_S2"]}, "1": {"": ["APAR_BallisticScatterGun_S1", "APAR_BallisticScatterGun_S6", "HRST_LaserScatterGun_S1", "ASAD_DistortionRepeater_S1", "BEHR_BallisticRepeater_S1", "HRST_LaserRepeater_S1", "KLWE_LaserRepeater_S1", "MXOX_NeutronRepeater_S1", "AMRS_LaserCannon_S1", "BANU_TachyonCannon_S1", "BEHR_LaserCannon_S1", "ESPR_BallisticCannon_S1", "ESPR_LaserCannon_S1", "GATS_BallisticCannon_S1", "JOKR_DistortionCannon_S1", "KBAR_BallisticCannon_S1", "KLWE_MassDriver_S1", "KRON_LaserCannon_S1", "MXOX_NeutronCannon_S1", "GATS_BallisticGatling_S1"], "VNCL_Scythe_Base": ["VNCL_LaserCannon_S1"]}, "4": {"": ["PRAR_DistortionScatterGun_S4", "HRST_LaserRepeater_S4", "KLWE_LaserRepeater_S4", "AMRS_LaserCannon_S4", "BEHR_BallisticCannon_S4", "BEHR_LaserCannon_S4", "ESPR_BallisticCannon_S4", "ESPR_LaserCannon_S4", "APAR_BallisticGatling_S4", "GRIN_TractorBeam_S4", "KLWE_LaserRepeater_S4_LowPoly", "APAR_BallisticGatling_S4_LowPoly"]}, "5": {"": ["PRAR_DistortionScatterGun_S5", "HRST_LaserRepeater_S5", "KLWE_LaserRepeater_S5", "AMRS_LaserCannon_S5", "BEHR_LaserCannon_S5", "Bengal_Turret_BallisticCannon_S8", "ESPR_BallisticCannon_S5", "ESPR_LaserCannon_S5", "BEHR_BallisticGatling_S5", "KLWE_LaserRepeater_S5_LowPoly", "KLWE_LaserRepeater_S5_Turret"], "TMBL_Nova": ["HRST_Nova_BallisticCannon_S5"], "VNCL_Scythe_Base": ["VNCL_NeutronCannon_S5", "VNCL_PlasmaCannon_S5"]}, "6": {"": ["PRAR_DistortionScatterGun_S6", "HRST_LaserRepeater_S6", "KLWE_LaserRepeater_S6", "AMRS_LaserCannon_S6", "BEHR_LaserCannon_S6", "ESPR_BallisticCannon_S6", "ESPR_LaserCannon_S6", "APAR_BallisticGatling_S6", "BEHR_BallisticGatling_S6", "Bengal_BallisticGatling_S6", "KLWE_LaserRepeater_S6_LowPoly"]}, "10": {"": ["BEHR_LaserRepeater_S10", "KLWE_MassDriver_S10", "KLWE_MassDriver_S10_LowPoly"]}, "7": {"": ["BEHR_JavelinBallisticCannon_S7", "BEHR_LaserCannon_S7", "Bengal_BallisticCannon_S7", "BEHR_BallisticGatling_S7", "BEHR_JavelinBallisticCannon_S7_LowPoly", "BEHR_LaserCannon_S7_LowPoly", "BEHR_LaserCannon_S7_Turret", "BEHR_LaserCannon_SF7E_S7"]}, "8": {"": ["BEHR_LaserCannon_S8", "Bengal_BallisticCannon_S8"]}, "9": {"": ["BEHR_LaserCannon_S9", "BEHR_LaserCannon_S9_LowPoly"]}, "12": {"": ["BEHR_MassDriver_S12"]}}, "Rocket": {"1": {"": ["RPOD_S1_FSKI_3x_S3", "RPOD_S1_HRST_6x_S1", "RPOD_S1_THCN_4x_S2"]}, "2": {"": ["RPOD_S2_FSKI_6x_S3", "RPOD_S2_HRST_12x_S1", "RPOD_S2_THCN_8x_S2"]}, "3": {"": ["RPOD_S3_FSKI_9x_S3", "RPOD_S3_HRST_18x_S1"]}}, "NoseMounted": {"2": {"Merlin_Nose": ["KRIG_BallisticGatling_S2"]}}}, "ManneuverThruster": {"FixedThruster": {"1": {"": ["VNCL_Blade_Thruster_Aux_Fixed_01", "VNCL_Blade_Thruster_Aux_Fixed_02", "XIAN_Nox_Thruster_Mav_Fixed", "XIAN_Nox_Thruster_Retro", "ORIG_890_Jump_Thruster_Mav_Fixed", "ORIG_890_Jump_Thruster_Retro", "CNOU_Nomad_Thruster_Retro_Left", "MISC_Prospector_Thruster_Mav_FIxed_02", "MISC_Prospector_Thruster_Mav_Fixed_01", "MISC_Prospector_Thruster_Mav_Fixed_03", "MISC_Prospector_Thruster_Mav_Fixed_04", "MISC_Prospector_Thruster_Retro_01", "MISC_Prospector_Thruster_Retro_02", "ANVL_Carrack_Thruster_Mav", "ANVL_Carrack_Thruster_Retro", "ANVL_Carrack_Thruster_VTOL", "CRUS_Starlifter_Thruster_Retro", "ORIG_890_Jump_Thruster_Mav_FSL", "ORIG_890_Jump_Thruster_Mav_FSR", "ORIG_890_Jump_Thruster_Mav_Fixed_2", "ORIG_890_Jump_Thruster_Mav_MSL", "ORIG_890_Jump_Thruster_Mav_MSR", "ORIG_890_Jump_Thruster_Mav_RSL", "ORIG_890_Jump_Thruster_Mav_RSR", "ORIG_890_Jump_Thruster_Mav_TRL", "ORIG_890_Jump_Thruster_Mav_TRR", "ORIG_890_Jump_Thruster_Mav_VTOL", "ARGO_RAFT_Thruster_Mav", "MISC_Freelancer_Thruster_Retro", "ORIG_890_Jump_Thruster_Retro_L", "ORIG_890_Jump_Thruster_Retro_R", "KRIG_P72_Archimedes_Thruster_Mav_Fixed_01", "KRIG_P72_Archimedes_Thruster_Mav_Fixed_02", "KRIG_P72_Archimedes_Thruster_Retro_01", "KRIG_P72_Archimedes_Thruster_Retro_02", "ORIG_85X_Thruster_Mav_Fixed_01", "ORIG_85X_Thruster_Mav_Fixed_02", "ORIG_85X_Thruster_Retro", "DRAK_Dragonfly_Thruster_Mav_Fixed", "DRAK_Dragonfly_Thruster_Retro", "ORIG_350r_Thruster_Mav_Fixed_01", "ORIG_350r_Thruster_Mav_Fixed_02", "DRAK_Cutter_Thruster_Mav_Fixed", "DRAK_Caterpillar_Thruster_Mav_Fixed", "DRAK_Caterpillar_Thruster_Retro", "ANVL_Hawk_Thruster_Mav_Fixed", "AEGS_Redeemer_Thruster_Mav_Fixed", "AEGS_Redeemer_Thruster_Retro", "AEGS_Redeemer_Thruster_VTOL", "CNOU_HoverQuad_Thruster_Mav_Fixed", "CNOU_HoverQuad_Thruster_Retro", "CNOU_Mustang_Thruster_Mav_Fixed_01", "ANVL_Pisces_Thruster_Mav_Fixed", "AEGS_Vanguard_Thruster_Mav_Fixed", "ANVL_Lightning_F8_Thruster_Retro", "MISC_Fury_Thruster_FixedMav", "ORIG_890_Jump_Thruster_Mav_BML", "ORIG_890_Jump_Thruster_Mav_BMR", "ORIG_890_Jump_Thruster_Mav_BRL", "ORIG_890_Jump_Thruster_Mav_BRR", "ESPR_Talon_Thruster_Retro_L", "ESPR_Talon_Thruster_Retro_R", "ANVL_Lightning_F8_Thruster_Retro_DarkBlue", "ANVL_Lightning_F8_Thruster_Retro_Grey", "ANVL_Lightning_F8_Thruster_Retro_LightBlue", "ANVL_Lightning_F8_Thruster_Retro_White", "ORIG_M50_Thruster_Mav_Fixed", "CRUS_Starfighter_Thruster_Retro", "ANVL_Carrack_Thruster_Retro_Back", "ANVL_Carrack_Thruster_Retro_Front", "MISC_Freelancer_MAX_Thruster_Retro", "ORIG_600i_Thruster_Mav_Fixed_01", "ORIG_600i_Thruster_Mav_Fixed_02", "ORIG_600i_Thruster_Mav_Fixed_03", "ORIG_600i_Thruster_Retro", "ORIG_100i_Thruster_Mav_Fixed", "ORIG_100i_Thruster_Mav_Left", "ORIG_100i_Thruster_Mav_Right", "CRUS_Starfighter_Thruster_Retro_Right", "MISC_Hull_A_Thruster_Mav_Fixed", "MISC_Hull_A_Thruster_Mav_Roll", "MISC_Hull_A_Thruster_Retro", "MISC_Hull_A_Thruster_VTOL", "CNOU_Nomad_Thruster_Retro_Right", "ORIG_M50_Thruster_Mav_Fixed_AT", "ORIG_85X_Thruster_Mav_Fixed_03_Left", "ORIG_85X_Thruster_Mav_Fixed_03_Right", "ORIG_85X_Thruster_Mav_Fixed_04_Left", "ORIG_85X_Thruster_Mav_Fixed_04_Right"], "VNCL_Scythe_Base": ["VNCL_Glaive_Thruster_Aux_Fixed", "VNCL_Glaive_Thruster_Retro_Fixed_Left", "VNCL_Glaive_Thruster_Retro_Fixed_Right", "VNCL_Scythe_Thruster_Aux_Fixed", "VNCL_Scythe_Thruster_Retro", "VNCL_Scythe_Thruster_Retro_Fixed_Left", "VNCL_Scythe_Thruster_Retro_Fixed_Right"], "MISC_Reliant_Base": ["MISC_Reliant_Thruster_Mav_Fixed", "MISC_Reliant_Thruster_Mav_Fixed_02"], "AEGS_Reclaimer_Base": ["AEGS_Reclaimer_Thruster_Mav_Fixed", "AEGS_Reclaimer_Thruster_Mav_Fixed_Large"], "ANVL_Arrow_Base": ["ANVL_Arrow_Thruster_Retro"], "MISC_Razor": ["MISC_Razor_Thruster_Mav", "MISC_Razor_Thruster_Retro", "MISC_Razor_EX_Thruster_Retro", "MISC_Razor_LX_Thruster_Retro", "MISC_Razor_EX_Thruster_Mav", "MISC_Razor_LX_Thruster_Mav"], "DRAK_Vulture": ["DRAK_Vulture_Thruster_Maneuver", "DRAK_Vulture_Thruster_VTOL"], "ARGO_MPUV_Base": ["ARGO_MPUV_Thruster_Aux_Fixed_01", "ARGO_MPUV_Thruster_Aux_Fixed_02", "ARGO_MPUV_Thruster_Aux_Fixed_03", "ARGO_MPUV_Thruster_Retro_Joint", "ARGO_MPUV_Thruster_Aux_Front", "ARGO_MPUV_Thruster_Aux_Front_Top", "ARGO_MPUV_Thruster_Aux_Side", "ARGO_MPUV_Thruster_Aux_Side_Rear"], "ORIG_300i_Base": ["ORIG_300i_Thruster_Mav_Fixed_01", "ORIG_300i_Thruster_Mav_Fixed_02"], "CNOU_Mustang_Base": ["CNOU_Mustang_Thruster_Retro"], "MISC_Fury_LX": ["MISC_Fury_LX_Thruster_FixedMav", "MISC_Fury_LX_Thruster_FixedMav_Right"], "ANVL_Hurricane": ["ANVL_Hurricane_Thruster_Retro"], "DRAK_Herald_Base": ["DRAK_Herald_Thruster_Mav_Fixed", "DRAK_Herald_Thruster_Retro"], "ORIG_m50_Base": ["ORIG_M50_Thruster_Mav_Joint", "ORIG_M50_Thruster_Mav_Joint_old", "ORIG_M50_Thruster_Mav_Joint_AT"], "DRAK_Buccaneer_Base": ["DRAK_Buccaneer_Thruster_Mav_Fixed"], "AEGS_Eclipse": ["AEGS_Eclipse_Thruster_Retro"]}, "2": {"VNCL_Blade_Base": ["VNCL_Blade_Thruster_Retro_Fixed"], "AEGS_Javelin_Base": ["AEGS_Javelin_Thruster_Retro", "AEGS_Javelin_Thruster_Retro_Invulnerable"], "": ["ANVL_Terrapin_Thruster_Retro"], "AEGS_Sabre": ["AEGS_Sabre_Raven_Thruster_Retro", "AEGS_Sabre_Thruster_Retro", "AEGS_Sabre_Thruster_Retro_L", "AEGS_Sabre_Thruster_Retro_R"], "AEGS_Retaliator_Base": ["AEGS_Retaliator_Thruster_Mav_Fixed", "AEGS_Retaliator_Thruster_Retro", "AEGS_Retaliator_Thruster_Retro_Right", "AEGS_Retaliator_Thruster_Mav_Fixed_Front_Left", "AEGS_Retaliator_Thruster_Mav_Fixed_Front_Right", "AEGS_Retaliator_Thruster_Mav_Fixed_Front_Top_Left", "AEGS_Retaliator_Thruster_Mav_Fixed_Front_Top_Right", "AEGS_Retaliator_Thruster_Mav_Fixed_Rear_Top"]}, "3": {"AEGS_Reclaimer_Base": ["AEGS_Reclaimer_Thruster_Retro_01"], "MISC_Hull_C": ["MISC_Hull_C_Thruster_Retro", "MISC_Hull_C_Thruster_Retro_Small"], "MISC_Starfarer_Base": ["MISC_Starfarer_Gemini_Thruster_Mav_Fixed_01", "MISC_Starfarer_Gemini_Thruster_Retro", "MISC_Starfarer_Thruster_Mav_Fixed_01", "MISC_Starfarer_Thruster_Retro", "MISC_Starfarer_Gemini_Thruster_Retro_Derelict"], "AEGS_Vanguard_Base": ["AEGS_Vanguard_Thruster_Retro"], "": ["ANVL_Valkyrie_Thruster_Retro"]}, "4": {"DRAK_Vulture": ["DRAK_Vulture_Thruster_Retro"], "MISC_Starfarer_Base": ["MISC_Starfarer_Gemini_Thruster_Mav_Fixed_02", "MISC_Starfarer_Gemini_Thruster_Mav_Fixed_03", "MISC_Starfarer_Thruster_Mav_Fixed_02", "MISC_Starfarer_Thruster_Mav_Fixed_03"], "AEGS_Retaliator_Base": ["AEGS_Retaliator_Thruster_Mav_Joint_01"]}}, "JointThruster": {"1": {"VNCL_Scythe_Base": ["VNCL_Glaive_Thruster_Aux_Joint", "VNCL_Scythe_Thruster_Aux_Joint"], "XIAN_Nox_Base": ["XIAN_Nox_Thruster_Aux"], "KRIG_Merlin_Base": ["KRIG_P52_Merlin_Thruster_Mav_Fixed_01", "KRIG_P52_Merlin_Thruster_Mav_Fixed_02", "KRIG_P52_Merlin_Thruster_Retro_01", "KRIG_P52_Merlin_Thruster_Retro_02"], "": ["ARGO_MOLE_Thruster_Mav_Joint", "CNOU_Nomad_Thruster_Mav_Joint", "CRUS_Starlifter_Thruster_Mav", "CRUS_Starlifter_Thruster_Mav_Front", "MISC_Freelancer_Thruster_Mav_Joint", "DRAK_Dragonfly_Thruster_Aux", "DRAK_Dragonfly_Thruster_Mav_Joint", "ANVL_Hawk_Thruster_Mav_Joint", "ANVL_Hawk_Thruster_Retro", "AEGS_Redeemer_Thruster_Mav", "CNOU_HoverQuad_Thruster_Aux", "ANVL_Pisces_Thruster_Mav_Joint", "ANVL_Pisces_Thruster_Retro_Left", "ANVL_Pisces_Thruster_Retro_Right", "ANVL_Lightning_F8_Thruster_Mav_Joint", "ARGO_MPUV_Thruster_Aux_Bottom", "ARGO_MPUV_Thruster_Aux_Top", "AEGS_Avenger_Thruster_Mav_Joint", "AEGS_Avenger_Thruster_Retro", "RSI_Scorpius_Thruster_Mav_Joint", "RSI_Scorpius_Thruster_Retro_Left", "RSI_Scorpius_Thruster_Retro_Right", "ESPR_Talon_Thruster_Mav", "ORIG_M50_Thruster_Retro", "ORIG_M50_Thruster_Retro_old", "CRUS_Starfighter_Thruster_Mav", "CRUS_Starlifter_Thruster_Mav_Front_A2", "CRUS_Starlifter_Thruster_Mav_Front_M2", "CRUS_Starlifter_Thruster_Mav_A2", "CRUS_Starlifter_Thruster_Mav_M2", "ORIG_M50_Thruster_Retro_AT", "AEGS_Gladius_Thruster_Mav_Joint_01", "AEGS_Gladius_Thruster_Mav_Joint_02", "AEGS_Gladius_Thruster_Retro", "ESPR_Talon_Thruster_Mav_Small", "ESPR_Talon_Thruster_Mav_VTOL", "ORIG_100i_Thruster_Retro_Left", "ORIG_100i_Thruster_Retro_Right", "RSI_Mantis_Thruster_Mav_Joint", "RSI_Mantis_Thruster_Retro", "ANVL_Lightning_F8_Thruster_Mav_Joint_DarkBlue", "ANVL_Lightning_F8_Thruster_Mav_Joint_Grey", "ANVL_Lightning_F8_Thruster_Mav_Joint_LightBlue", "ANVL_Lightning_F8_Thruster_Mav_Joint_White"], "RSI_Aurora_Base": ["RSI_Aurora_Thruster_Mav_Joint_01"], "ANVL_Arrow_Base": ["ANVL_Arrow_Thruster_Mav"], "ARGO_MPUV_Base": ["ARGO_MPUV_Thruster_Aux_Joint"], "AEGS_Sabre": ["AEGS_Sabre_Raven_Thruster_Mav_Joint_02", "AEGS_Sabre_Raven_Thruster_Mav_Joint_03", "AEGS_Sabre_Thruster_Mav_Joint_01", "AEGS_Sabre_Thruster_Mav_Joint_02"], "ANVL_Hurricane": ["ANVL_Hurricane_Thruster_Mav"], "RSI_Constellation_Base": ["RSI_Constellation_Andromeda_Thruster_Turbine_Front", "RSI_Constellation_Andromeda_Thruster_Turbine_Rear", "RSI_Constellation_Taurus_Thruster_Turbine_Rear", "RSI_Constellation_Taurus_Thruster_Turbine_Front"], "AEGS_Eclipse": ["AEGS_Eclipse_Thruster_Mav_Ball", "AEGS_Eclipse_Thruster_Mav_Joint"], "ANVL_Hornet_Base": ["ANVL_Hornet_F7A_Mk1_Thruster_Mav_1", "ANVL_Hornet_F7A_Mk1_Thruster_Retro", "ANVL_Hornet_F7A_Mk2_Thruster_Mav_1", "ANVL_Hornet_F7A_Mk2_Thruster_Retro", "ANVL_Hornet_F7A_Thruster_Mav_1", "ANVL_Hornet_F7A_Thruster_Retro", "ANVL_Hornet_F7C_Thruster_Mav_Joint_01", "ANVL_Hornet_F7C_Thruster_Mav_Joint_02", "ANVL_Hornet_F7C_Thruster_Retro"], "ANVL_Gladiator": ["ANVL_Gladiator_Thruster_Mav_Joint_02"], "DRAK_Cutlass_Base": ["DRAK_Cutlass_Thruster_Maneuver"]}, "3": {"AEGS_Reclaimer_Base": ["AEGS_Reclaimer_Thruster_Retro_02"], "MISC_Hull_C": ["MISC_Hull_C_Thruster_Mav_Fixed", "MISC_Hull_C_Thruster_Mav_Fixed_Quad", "MISC_Hull_C_Thruster_Mav_Fixed_Small", "MISC_Hull_C_Thruster_VTOL_Front", "MISC_Hull_C_Thruster_VTOL_Rear"], "MISC_Starfarer_Base": ["MISC_Starfarer_Gemini_Thruster_Mav_Joint", "MISC_Starfarer_Thruster_Mav_Joint"], "RSI_Constellation_Base": ["RSI_Constellation_Andromeda_Thruster_Mav_Joint", "RSI_Constellation_Taurus_Thruster_Mav_Joint"]}, "2": {"AEGS_Javelin_Base": ["AEGS_Javelin_Thruster_Mav_Joint_01", "AEGS_Javelin_Thruster_Mav_Joint_02", "AEGS_Javelin_Thruster_Mav_Joint_01_Invulnerable", "AEGS_Javelin_Thruster_Mav_Joint_02_Invulnerable"], "": ["BANU_Defender_Thruster_Mav", "ANVL_Terrapin_Thruster_Mav_Fixed", "ANVL_Terrapin_Thruster_Mav_Joint", "AEGS_Vanguard_Thruster_Mav_Joint"]}, "5": {"": ["AEGS_Idris_Thruster_Mav_Fixed", "AEGS_Idris_Thruster_Retro", "RSI_Bengal_Thruster_Mav_Joint", "RSI_Bengal_Thruster_Retro", "RSI_Bengal_Thruster_Retro_Main_Left", "RSI_Bengal_Thruster_Retro_Main_Right", "RSI_Bengal_Thruster_Retro_Top_Left", "RSI_Bengal_Thruster_Retro_Top_Right"], "AEGS_Retaliator_Base": ["AEGS_Retaliator_Thruster_Mav_Joint_02"]}}, "FlexThruster": {"1": {"XIAN_Scout_Base": ["XIAN_Scout_Thruster_Aux_Joint"], "": ["ORIG_400i_Thruster_Mav", "ORIG_400i_Thruster_Mav_Side", "ORIG_400i_Thruster_Mav_Side_Front", "ORIG_400i_Thruster_Mav_VTOL", "ORIG_400i_Thruster_Mav_Side_Front_R"], "ANVL_Gladiator": ["ANVL_Gladiator_Thruster_Mav_Joint_01", "ANVL_Gladiator_Thruster_Retro"]}, "3": {"": ["AEGS_Hammerhead_Thruster_Mav_Fixed", "AEGS_Hammerhead_Thruster_Retro", "ANVL_Valkyrie_Thruster_Mav_Joint"]}}, "Retro": {"1": {"": ["ORIG_400i_Thruster_Retro", "ORIG_400i_Thruster_Retro_Left", "ARGO_MOLE_Thruster_Retro", "DRAK_Cutter_Thruster_AuxRetro", "DRAK_Cutter_Thruster_MainRetro"]}, "2": {"": ["BANU_Defender_Thruster_Retro"]}}, "": {"1": {"": ["CRUS_Star_Runner_Thruster_Mav", "CRUS_Star_Runner_Thruster_Retro", "CRUS_Star_Runner_Thruster_VTOL", "ORIG_300i_Thruster_Retro", "CRUS_Spirit_Thruster_Mav", "CRUS_Spirit_Thruster_Retro", "DRAK_Corsair_Thruster_Mav", "DRAK_Corsair_Thruster_Retro_A", "DRAK_Corsair_Thruster_Retro_B", "DRAK_Corsair_Thruster_Retro_C"], "ESPR_Prowler_Base": ["ESPR_Prowler_Thruster_Aux", "ESPR_Prowler_Thruster_Mav_01", "ESPR_Prowler_Thruster_Mav_02", "ESPR_Prowler_Thruster_Retro", "ESPR_Prowler_Thruster_Retro_02"]}, "4": {"DRAK_Buccaneer_Base": ["DRAK_Buccaneer_Thruster_Retro"]}}, "Light": {"1": {"AEGS_Sabre": ["AEGS_Sabre_Raven_Thruster_Mav_Joint_01"]}}}, "MainThruster": {"FixedThruster": {"3": {"VNCL_Blade_Base": ["VNCL_Blade_Thruster_Main_Fixed_01", "VNCL_Blade_Thruster_Main_Fixed_02"], "VNCL_Scythe_Base": ["VNCL_Glaive_Thruster_Main_Fixed", "VNCL_Scythe_Thruster_Main_Fixed"], "": ["XIAN_Nox_Thruster_Main", "MISC_Prospector_Thruster_Aux", "MISC_Prospector_Thruster_Main", "DRAK_Dragonfly_Thruster_Main", "ANVL_Terrapin_Thruster_Main", "ORIG_300i_Thruster_Main", "DRAK_Caterpillar_Thruster_Aux", "DRAK_Caterpillar_Thruster_Main", "ANVL_Valkyrie_Thruster_Main_Aux", "ANVL_Valkyrie_Thruster_Main_Front", "ANVL_Valkyrie_Thruster_Main_Rear", "MISC_Hull_A_Thruster_Aux", "MISC_Hull_A_Thruster_Main"], "AEGS_Reclaimer_Base": ["AEGS_Reclaimer_Thruster_Aux", "AEGS_Reclaimer_Thruster_Main"], "ORIG_300i_350r": ["ORIG_350r_Thruster_Main"], "ANVL_Hornet_Base": ["ANVL_Hornet_F7A_Mk1_Thruster_Main", "ANVL_Hornet_F7A_Mk2_Thruster_Main", "ANVL_Hornet_F7A_Thruster_Main", "ANVL_Hornet_F7C_Thruster_Main"]}, "1": {"MISC_Reliant_Base": ["MISC_Reliant_Thruster_Main"], "KRIG_Merlin_Base": ["KRIG_P52_Merlin_Thruster_Main"], "": ["ORIG_400i_Thruster_Main", "ARGO_MOLE_Thruster_Main", "ARGO_MOLE_Thruster_VTOL", "MISC_Razor_Thruster_Main", "ANVL_Carrack_Thruster_Main", "CRUS_Starlifter_Thruster_Main", "CRUS_Starlifter_Thruster_Main_Aux", "CRUS_Starlifter_Thruster_Main_Aux_1", "CRUS_Starlifter_Thruster_VTOL_Side", "CRUS_Starlifter_Thruster_VTOL_Wing_Left", "CRUS_Starlifter_Thruster_VTOL_Wing_Right", "ARGO_RAFT_Thruster_Main", "ARGO_RAFT_Thruster_Retro", "ARGO_RAFT_Thruster_VTOL", "MISC_Freelancer_Thruster_Main", "KRIG_P72_Archimedes_Thruster_Main", "ORIG_85X_Thruster_Main", "DRAK_Cutter_Thruster_Aux", "DRAK_Cutter_Thruster_Main", "ANVL_Hawk_Thruster_Main", "AEGS_Redeemer_Thruster_Main_Left", "AEGS_Redeemer_Thruster_Main_Right", "AEGS_Redeemer_Thruster_Nutcracker", "CNOU_HoverQuad_Thruster_Main", "ANVL_Pisces_Thruster_Main_Left", "ANVL_Pisces_Thruster_Main_Right", "ARGO_RAFT_Thruster_Retro_Right", "ANVL_Lightning_F8_Thruster_Main", "RSI_Scorpius_Thruster_Main_Bottom_Left", "RSI_Scorpius_Thruster_Main_Bottom_Right", "RSI_Scorpius_Thruster_Main_Top_Left", "RSI_Scorpius_Thruster_Main_Top_Right", "ARGO_MOLE_Thruster_VTOL_Rear", "ORIG_400i_Thruster_Main_Sub", "ESPR_Talon_Thruster_Main_TL", "CRUS_Starlifter_Thruster_VTOL_Side_Left", "ORIG_M50_Thruster_Main", "CRUS_Starfighter_Thruster_Main_Left", "CRUS_Starfighter_Thruster_Main_Right", "CRUS_Starlifter_Thruster_Main_A2", "CRUS_Starlifter_Thruster_Main_M2", "ANVL_Carrack_Thruster_Main_Large", "ANVL_Carrack_Thruster_Main_Small", "ESPR_Talon_Thruster_Main_BL", "ESPR_Talon_Thruster_Main_BR", "ESPR_Talon_Thruster_Main_TR", "MISC_Razor_EX_Thruster_Main", "MISC_Razor_LX_Thruster_Main", "AEGS_Gladius_Thruster_Main", "ORIG_400i_Thruster_Main_Sub_R", "ORIG_600i_Thruster_Main", "ORIG_100i_Thruster_Main_Left", "ORIG_100i_Thruster_Main_Right", "ANVL_Lightning_F8_Thruster_Main_DarkBlue", "ANVL_Lightning_F8_Thruster_Main_Grey", "ANVL_Lightning_F8_Thruster_Main_LightBlue", "ANVL_Lightning_F8_Thruster_Main_White", "MISC_Freelancer_Thruster_DUR_Main", "MISC_Freelancer_Thruster_Main_Right", "ORIG_M50_Thruster_Main_AT", "MISC_Freelancer_Thruster_DUR_Main_Right"], "RSI_Aurora_Base": ["RSI_Aurora_Thruster_CL_Main", "RSI_Aurora_Thruster_ES_Main", "RSI_Aurora_Thruster_LN_Main", "RSI_Aurora_Thruster_MR_Main", "RSI_Aurora_Thruster_Retro", "RSI_Aurora_Thruster_LN_Retro", "RSI_Aurora_Thruster_Retro_Right", "RSI_Aurora_Thruster_LN_Retro_Right"], "ARGO_MPUV_Base": ["ARGO_MPUV_Thruster_Main_Fixed", "ARGO_MPUV_Thruster_Main"], "AEGS_Sabre": ["AEGS_Sabre_Raven_Thruster_Main", "AEGS_Sabre_Thruster_Main"], "CNOU_Mustang_Base": ["CNOU_Mustang_Thruster_Aux", "CNOU_Mustang_Thruster_Main"], "ANVL_Hurricane": ["ANVL_Hurricane_Thruster_Main"], "AEGS_Eclipse": ["AEGS_Eclipse_Thruster_Main"]}, "2": {"AEGS_Javelin_Base": ["AEGS_Javelin_Thruster_Main_01", "AEGS_Javelin_Thruster_Main_02", "AEGS_Javelin_Thruster_Main_01_Invulnerable", "AEGS_Javelin_Thruster_Main_02_Invulnerable"], "": ["ORIG_890_Jump_Thruster_Main", "CNOU_Nomad_Thruster_Main_Left", "BANU_Defender_Thruster_Main", "CNOU_Nomad_Thruster_Main_Right", "ORIG_890_Jump_Thruster_Main_BL", "ORIG_890_Jump_Thruster_Main_BR", "ORIG_890_Jump_Thruster_Main_TL", "ORIG_890_Jump_Thruster_Main_TR", "RSI_Mantis_Thruster_Main"], "ANVL_Arrow_Base": ["ANVL_Arrow_Thruster_Main"]}, "6": {"MISC_Hull_C": ["MISC_Hull_C_Thruster_Main"], "MISC_Starfarer_Base": ["MISC_Starfarer_Gemini_Thruster_Aux", "MISC_Starfarer_Thruster_Aux"], "": ["AEGS_Hammerhead_Thruster_Main"], "AEGS_Retaliator_Base": ["AEGS_Retaliator_Thruster_Main", "AEGS_Retaliator_Thruster_Main_Right"]}, "4": {"DRAK_Vulture": ["DRAK_Vulture_Thruster_Main"], "ORIG_300i_315p": ["ORIG_315p_Thruster_Main"], "": ["AEGS_Vanguard_Thruster_Main_01"], "AEGS_Vanguard_Base": ["AEGS_Vanguard_Thruster_Main_02"], "AEGS_Avenger_Base": ["AEGS_Avenger_Thruster_Main"], "DRAK_Herald_Base": ["DRAK_Herald_Thruster_Aux", "DRAK_Herald_Thruster_Main"], "DRAK_Buccaneer_Base": ["DRAK_Buccaneer_Thruster_Main"], "DRAK_Cutlass_Base": ["DRAK_Cutlass_Thruster_Main", "DRAK_Cutlass_Thruster_Retro"]}, "7": {"MISC_Starfarer_Base": ["MISC_Starfarer_Gemini_Thruster_Main", "MISC_Starfarer_Gemini_Thruster_Main_Derelict"], "": ["MISC_Starfarer_Thruster_Main"]}, "5": {"RSI_Constellation_Base": ["RSI_Constellation_Andromeda_Thruster_Main", "RSI_Constellation_Andromeda_Thruster_Retro", "RSI_Constellation_Taurus_Thruster_Main", "RSI_Constellation_Taurus_Thruster_Retro"]}}, "JointThruster": {"3": {"XIAN_Scout_Base": ["XIAN_Scout_Thruster_Main"]}, "5": {"": ["AEGS_Idris_Thruster_Main_01", "AEGS_Idris_Thruster_Main_02", "AEGS_Idris_Thruster_Main_Fixed_01", "RSI_Bengal_Thruster_Aux", "RSI_Bengal_Thruster_Main", "RSI_Bengal_Thruster_Main_Large", "RSI_Bengal_Thruster_Main_Medium", "RSI_Bengal_Thruster_Main_Small"]}, "1": {"ARGO_MPUV_Base": ["ARGO_MPUV_Thruster_Main_Joint"], "": ["MISC_Fury_Thruster_Main", "MISC_Fury_Thruster_Main_Bottom", "MISC_Fury_Thruster_Main_LX", "MISC_Fury_Thruster_Main_MX", "MISC_Fury_Thruster_Main_Bottom_MX", "MISC_Fury_Thruster_Main_Bottom_LX"], "ANVL_Gladiator": ["ANVL_Gladiator_Thruster_Main"]}}, "": {"1": {"": ["CRUS_Star_Runner_Thruster_Main", "CRUS_Star_Runner_Thruster_Main_Extra", "CRUS_Spirit_Thruster_Main_A", "CRUS_Spirit_Thruster_VTOL_Main", "DRAK_Corsair_Thruster_Aux_B", "DRAK_Corsair_Thruster_Aux_C", "DRAK_Corsair_Thruster_Main_A", "CRUS_Spirit_Thruster_VTOL_Aux"], "ESPR_Prowler_Base": ["ESPR_Prowler_Thruster_Main"]}}}, "TurretBase": {"MannedTurret": {"5": {"": ["ANVL_Carrack_SCItem_Turret_Side", "ANVL_Carrack_SCItem_Turret_Side_Left", "ANVL_Carrack_SCItem_Turret_Side_Right", "AEGS_Hammerhead_SCItem_Turret_Rear", "AEGS_Hammerhead_SCItem_Turret_Top", "AEGS_Idris_SCItem_Turret_Lower", "AEGS_Idris_SCItem_Turret_Upper", "AEGS_Javelin_SCItem_Turret_Manned", "AEGS_Javelin_Side_Turret", "AEGS_Reclaimer_SCItem_Turret", "AEGS_Reclaimer_Tractor_Beam", "AEGS_Redeemer_Front_SCItem_Turret", "AEGS_Redeemer_Rear_SCItem_Turret", "ANVL_Carrack_SCItem_Turret_Bubble", "ANVL_Hurricane_SCItem_Turret", "DRAK_Cutlass_SCItem_Turret_Black", "AEGS_Hammerhead_SCItem_Turret_Side_BackLeft", "AEGS_Hammerhead_SCItem_Turret_Side_BackRight", "AEGS_Hammerhead_SCItem_Turret_Side_FrontLeft", "AEGS_Hammerhead_SCItem_Turret_Side_FrontRight", "AEGS_Hammerhead_SCItem_Turret_Side_FrontLeft_LowPoly", "AEGS_Idris_SCItem_Turret_Upper_Front_Left", "AEGS_Idris_SCItem_Turret_Upper_Front_Right", "AEGS_Idris_SCItem_Turret_Upper_Rear_Left", "AEGS_Idris_SCItem_Turret_Upper_Rear_Right", "AEGS_Idris_SCItem_Turret_Upper_Stanton", "AEGS_Hammerhead_SCItem_Turret_Side_BackLeft_LowPoly", "AEGS_Idris_SCItem_Turret_Upper_Front_Right_LowPoly", "AEGS_Idris_SCItem_Turret_Upper_Front_Left_LowPoly", "AEGS_Hammerhead_SCItem_Turret_Side_FrontRight_LowPoly", "AEGS_Javelin_SCItem_Turret_Lower_Manned", "AEGS_Javelin_SCItem_Turret_Manned_Invulnerable", "AEGS_Javelin_SCItem_Turret_Manned_Left", "AEGS_Javelin_SCItem_Turret_Manned_LowPoly", "AEGS_Javelin_SCItem_Turret_Lower_Manned_Invulnerable", "AEGS_Javelin_SCItem_Turret_Lower_Manned_LowPoly", "AEGS_Hammerhead_SCItem_Turret_Rear_LowPoly", "DRAK_Cutlass_SCItem_Turret_Blue", "AEGS_Idris_SCItem_Turret_Upper_Rear_Right_LowPoly", "AEGS_Idris_SCItem_Turret_Upper_Rear_Right_Stanton", "AEGS_Idris_SCItem_Turret_Upper_Rear_Left_LowPoly", "AEGS_Idris_SCItem_Turret_Upper_Rear_Left_Stanton", "AEGS_Javelin_SCItem_Turret_Manned_Left_Invulnerable", "AEGS_Idris_SCItem_Turret_Upper_Stanton_Left", "AEGS_Idris_SCItem_Turret_Upper_Stanton_Right", "AEGS_Hammerhead_SCItem_Turret_Side_BackRight_LowPoly", "AEGS_Hammerhead_SCItem_Turret_Top_LowPoly", "AEGS_Javelin_Side_Turret_Invulnerable", "AEGS_Javelin_Side_Turret_LowPoly", "AEGS_Javelin_Side_Turret_Player_C01", "AEGS_Idris_SCItem_Turret_Lower_Short", "AEGS_Idris_SCItem_Turret_Lower_Short_Left", "AEGS_Idris_SCItem_Turret_Lower_Short_Right", "AEGS_Idris_SCItem_Turret_Lower_Short_Left_LowPoly", "AEGS_Idris_SCItem_Turret_Lower_Short_Left_Stanton", "AEGS_Idris_SCItem_Turret_Lower_Short_Right_LowPoly", "AEGS_Idris_SCItem_Turret_Lower_Short_Right_Stanton"], "$ORIG_890Jump": ["ORIG_890J_SCItem_Turret_Upper", "ORIG_890J_SCItem_Turret_Lower"]}, "6": {"": ["MISC_Starfarer_SCItem_Turret_Small", "MISC_Starfarer_SCItem_Turret_Small_Right", "AEGS_Vanguard_Harbinger_SCItem_Turret", "AEGS_Vanguard_SCItem_Turret", "ANVL_Gladiator_SCItem_Turret", "DRAK_Caterpillar_SCItem_Turret_Top", "MISC_Freelancer_Base_SCItem_Turret", "RSI_Constellation_SCItem_Turret_Lower", "RSI_Constellation_Phoenix_Turret_Lower", "RSI_Constellation_SCItem_Turret_Upper", "RSI_Constellation_Taurus_Turret_Lower", "RSI_Constellation_Aquila_SCItem_Turret_Radar", "RSI_Constellation_Phoenix_Turret_Upper", "DRAK_Caterpillar_SCItem_Turret_Bottom"], "DRAK_Cutlass_Base": ["DRAK_Fixed_Mount_S4"]}, "3": {"": ["TMBL_Cyclone_Module_MT", "TMBL_Cyclone_Module_Turret", "ANVL_Valkyrie_Turret_Door", "ANVL_Valkyrie_Turret_Door_Left", "ANVL_Valkyrie_Turret_Door_Right"]}, "7": {"": ["AEGS_Idris_SCItem_Turret_Large", "AEGS_Idris_SCItem_Turret_Large_LowPoly", "AEGS_Idris_SCItem_Turret_Large_Stanton"]}, "4": {"": ["AEGS_Retaliator_SCItem_Turret_Upper", "ANVL_Valkyrie_Turret_Bubble", "ANVL_Valkyrie_Turret_Top", "AEGS_Retaliator_SCItem_Turret_Lower", "AEGS_Retaliator_SCItem_Turret_Upper_Rear_Left", "AEGS_Retaliator_SCItem_Turret_Upper_Rear_Right", "ANVL_Valkyrie_Turret_Top_CitizenCon", "AEGS_Retaliator_SCItem_Turret_Lower_Rear"]}, "1": {"": ["ANVL_Terrapin_Support_Turret", "CRUS_Star_Runner_Turret_Top", "DRAK_Corsair_Turret_Manned", "CRUS_Star_Runner_Turret_Bottom"]}, "10": {"": ["MISC_Starfarer_SCItem_Turret_Large"]}, "12": {"": ["MISC_Starfarer_Gemini_SCItem_Turret_Large", "MISC_Starfarer_Gemini_SCItem_Turret_Large_Derelict"]}, "8": {"": ["MISC_Starfarer_Gemini_SCItem_Turret_Small", "MISC_Starfarer_Gemini_SCItem_Turret_Small_Right"]}}, "Unmanned": {"4": {"": ["DRAK_Cutlass_Red_Sensor_Turret"]}}}, "EMP": {"": {"2": {"": ["MXOX_EMP_Device_S2"], "ANVL_Hawk_Base": ["RSI_Mantis_EMP_Device", "ANVL_Hawk_EMP_Device_S2"]}, "4": {"Scorpius_EMP": ["RSI_Scorpius_EMP_Device"], "AEGS_EMP_Device": ["AEGS_EMP_Device_S4", "AEGS_EMP_Sentinel_S4"]}, "1": {"": ["TMBL_EMP_Device_S1"]}}}, "Missile": {"Rocket": {"9": {"": ["NOVP_Rocket_Venom_S1_Strike_TL_IR"]}}, "Missile": {"1": {"": ["MISL_S01_CS_FSKI_Spark", "MISL_S01_EM_BEHR_Pioneer", "MISL_S01_EM_THCN_TaskForce", "MISL_S01_IR_BEHR_Marksman", "MISL_S01_IR_VNCL_Arrow"]}, "2": {"": ["MISL_S02_CS_FSKI_Tempest", "MISL_S02_CS_THCN_StrikeForce", "MISL_S02_EM_TALN_Dominator", "MISL_S02_IR_FSKI_Ignite", "MISL_S02_IR_NOVP_Rattler", "MISL_S02_IR_VNCL_Bullet"]}, "3": {"": ["MISL_S03_CS_FSKI_Arrester", "MISL_S03_EM_FSKI_Thunderbolt", "MISL_S03_IR_NOVP_Viper", "MISL_S03_IR_VNCL_Chaos"]}, "4": {"": ["MISL_S04_CS_TALN_Assailant", "MISL_S04_EM_TALN_Raptor", "MISL_S04_IR_BEHR_Pathfinder", "MISL_S04_IR_VNCL_Dragon"]}, "5": {"": ["MISL_S05_EM_TALN_Reaper", "MISL_S05_EM_TALN_Scimitar", "MISL_S05_IR_TALN_Valkyrie"]}, "7": {"": ["MISL_S07_IR_TALN_Hellion"]}}, "Torpedo": {"5": {"": ["MISL_S05_CS_TALN_Stalker"]}, "9": {"": ["MISL_S09_CS_TALN_Argos", "MISL_S09_EM_TALN_Seeker", "MISL_S09_IR_TALN_Typhoon"]}, "12": {"": ["MISL_S12_IR_BEHR_Torpedo"]}}}, "WeaponRegenPool": {"": {"1": {"": ["WeaponRegenPool_Turret_Default", "WeaponRegenPool_Turret_Hammerhead", "WeaponRegenPool_Turret_Hull_A", "WeaponRegenPool_Turret_Hull_C", "WeaponRegenPool_Turret_Idris", "WeaponRegenPool_Turret_Javelin", "WeaponRegenPool_Turret_Lynx", "WeaponRegenPool_Turret_MOLE", "WeaponRegenPool_Turret_Nomad", "WeaponRegenPool_Turret_Nova", "WeaponRegenPool_Turret_Pisces", "WeaponRegenPool_Turret_Prospector", "WeaponRegenPool_Turret_Prowler", "WeaponRegenPool_Turret_Raft", "WeaponRegenPool_Turret_Reclaimer", "WeaponRegenPool_Turret_Retaliator", "WeaponRegenPool_Turret_S1", "WeaponRegenPool_Turret_S2", "WeaponRegenPool_Turret_S3", "WeaponRegenPool_Turret_Scythe", "WeaponRegenPool_Turret_Starfarer", "WeaponRegenPool_Turret_Starlifter", "WeaponRegenPool_Turret_Terrapin", "WeaponRegenPool_Turret_Ursa", "WeaponRegenPool_Turret_Valkyrie", "WeaponRegenPool_Turret_600i", "WeaponRegenPool_Turret_890J", "WeaponRegenPool_Turret_Ballista", "WeaponRegenPool_Turret_Bengal", "WeaponRegenPool_Turret_Carrack", "WeaponRegenPool_Turret_Caterpillar", "WeaponRegenPool_Crew_Default", "WeaponRegenPool_Crew_890J", "WeaponRegenPool_Crew_Ballista", "WeaponRegenPool_Crew_Bengal", "WeaponRegenPool_Crew_Bike", "WeaponRegenPool_Crew_Capital_Small", "WeaponRegenPool_Crew_Carrack", "WeaponRegenPool_Crew_Caterpillar", "WeaponRegenPool_Crew_Cyclone", "WeaponRegenPool_Crew_Dogfighter", "WeaponRegenPool_Crew_Dropship", "WeaponRegenPool_Crew_Hammerhead", "WeaponRegenPool_Crew_HeavyFighter", "WeaponRegenPool_Crew_Hull_A", "WeaponRegenPool_Crew_Hull_C", "WeaponRegenPool_Crew_Idris", "WeaponRegenPool_Crew_Interceptor", "WeaponRegenPool_Crew_Javelin", "WeaponRegenPool_Crew_Lynx", "WeaponRegenPool_Crew_MOLE", "WeaponRegenPool_Crew_MultiRoleFighter", "WeaponRegenPool_Crew_Nomad", "WeaponRegenPool_Crew_Nova", "WeaponRegenPool_Crew_Prospector", "WeaponRegenPool_Crew_Raft", "WeaponRegenPool_Crew_Reclaimer", "WeaponRegenPool_Crew_Retaliator", "WeaponRegenPool_Crew_SnubFighter", "WeaponRegenPool_Crew_Starfarer", "WeaponRegenPool_Crew_Ursa", "WeaponRegenPool_Crew_600i", "WeaponRegenPool_Crew_Constellation", "WeaponRegenPool_Crew_Starlifter", "WeaponRegenPool_Crew_Freelancer", "WeaponRegenPool_Crew_Prowler", "WeaponRegenPool_Crew_Star_Runner", "WeaponRegenPool_Crew_Terrapin", "WeaponRegenPool_Crew_Valkyrie", "WeaponRegenPool_Crew_Dragonfly", "WeaponRegenPool_Crew_Nox", "WeaponRegenPool_S0", "WeaponRegenPool_S1", "WeaponRegenPool_S2", "WeaponRegenPool_S3", "WeaponRegenPool_S4", "WeaponRegenPool_S5", "WeaponRegenPool_S6", "WeaponRegenPool_S7"]}}}, "FlightController": {"": {"1": {"": ["Controller_Flight_AEGS_Avenger_Stalker", "Controller_Flight_AEGS_Eclipse", "Controller_Flight_AEGS_Gladius", "Controller_Flight_AEGS_Hammerhead", "Controller_Flight_AEGS_Idris", "Controller_Flight_AEGS_Javelin", "Controller_Flight_AEGS_Reclaimer", "Controller_Flight_AEGS_Redeemer", "Controller_Flight_AEGS_Retaliator", "Controller_Flight_AEGS_Sabre", "Controller_Flight_AEGS_Vanguard", "Controller_Flight_ANVL_Arrow", "Controller_Flight_ANVL_Carrack", "Controller_Flight_ANVL_Gladiator", "Controller_Flight_ANVL_Hawk", "Controller_Flight_ANVL_Hornet_F7C", "Controller_Flight_ANVL_Hurricane", "Controller_Flight_ANVL_Lightning_F8", "Controller_Flight_ANVL_Pisces", "Controller_Flight_ANVL_Terrapin", "Controller_Flight_ANVL_Valkyrie", "Controller_Flight_ARGO_MOLE", "Controller_Flight_ARGO_MPUV", "Controller_Flight_ARGO_RAFT", "Controller_Flight_BANU_Defender", "Controller_Flight_CNOU_HoverQuad", "Controller_Flight_CNOU_Mustang_Alpha", "Controller_Flight_CNOU_Nomad", "Controller_Flight_CRUS_Star_Runner", "Controller_Flight_CRUS_Starfighter", "Controller_Flight_CRUS_Starlifter", "Controller_Flight_CRUS_Starlifter_A2", "Controller_Flight_CRUS_Starlifter_M2", "Controller_Flight_DRAK_Buccaneer", "Controller_Flight_DRAK_Caterpillar", "Controller_Flight_DRAK_Corsair", "Controller_Flight_DRAK_Cutlass_Black", "Controller_Flight_DRAK_Cutlass_Blue", "Controller_Flight_DRAK_Cutlass_Red", "Controller_Flight_DRAK_Cutlass_Steel", "Controller_Flight_DRAK_Cutter", "Controller_Flight_DRAK_Dragonfly", "Controller_Flight_DRAK_Herald", "Controller_Flight_DRAK_Vulture", "Controller_Flight_ESPR_Prowler", "Controller_Flight_ESPR_Talon", "Controller_Flight_KRIG_P52_Merlin", "Controller_Flight_KRIG_P72_Archimedes", "Controller_Flight_MISC_Freelancer", "Controller_Flight_MISC_Fury", "Controller_Flight_MISC_Fury_LX", "Controller_Flight_MISC_Hull_A", "Controller_Flight_MISC_Hull_C", "Controller_Flight_MISC_Prospector", "Controller_Flight_MISC_Razor", "Controller_Flight_MISC_Reliant_Kore", "Controller_Flight_MISC_Starfarer", "Controller_Flight_ORIG_100i", "Controller_Flight_ORIG_125a", "Controller_Flight_ORIG_135c", "Controller_Flight_ORIG_300i", "Controller_Flight_ORIG_400i", "Controller_Flight_ORIG_600i", "Controller_Flight_ORIG_85X", "Controller_Flight_ORIG_890J", "Controller_Flight_ORIG_m50", "Controller_Flight_RSI_Aurora_CL", "Controller_Flight_RSI_Bengal", "Controller_Flight_RSI_Constellation_Andromeda", "Controller_Flight_RSI_Mantis", "Controller_Flight_RSI_Scorpius", "Controller_Flight_VNCL_Blade", "Controller_Flight_VNCL_Scythe", "Controller_Flight_XIAN_Nox", "Controller_Flight_XIAN_Scout", "Controller_Flight_AEGS_Gladius_MasterModes", "Controller_Flight_AEGS_Gladius_MasterModes_PU", "Controller_Flight_RSI_Aurora_ES", "Controller_Flight_RSI_Aurora_LN", "Controller_Flight_RSI_Aurora_LX", "Controller_Flight_RSI_Aurora_MR", "Controller_Flight_ANVL_Hornet_F7A", "Controller_Flight_ANVL_Hornet_F7A_Mk1", "Controller_Flight_ANVL_Hornet_F7A_Mk2", "Controller_Flight_ANVL_Hornet_F7CM", "Controller_Flight_ANVL_Hornet_F7CR", "Controller_Flight_ANVL_Hornet_F7CS", "Controller_Flight_RSI_Scorpius_Antares", "Controller_Flight_RSI_Constellation_Aquila", "Controller_Flight_RSI_Constellation_Phoenix", "Controller_Flight_RSI_Constellation_Taurus", "Controller_Flight_CNOU_Mustang_Beta", "Controller_Flight_CNOU_Mustang_Delta", "Controller_Flight_CNOU_Mustang_Gamma", "Controller_Flight_CNOU_Mustang_Omega", "Controller_Flight_MISC_Starfarer_Gemini", "Controller_Flight_ANVL_Pisces_C8R", "Controller_Flight_MISC_Freelancer_DUR", "Controller_Flight_MISC_Freelancer_MAX", "Controller_Flight_MISC_Freelancer_MIS", "Controller_Flight_ARGO_MPUV_Transport", "Controller_Flight_ANVL_Lightning_F8_MasterModes", "Controller_Flight_AEGS_Sabre_Raven", "Controller_Flight_VNCL_Glaive", "Controller_Flight_AEGS_Vanguard_Harbinger", "Controller_Flight_AEGS_Vanguard_Hoplite", "Controller_Flight_AEGS_Vanguard_Sentinel", "Controller_Flight_MISC_Razor_EX", "Controller_Flight_MISC_Razor_LX", "Controller_Flight_MISC_Reliant_Mako", "Controller_Flight_MISC_Reliant_Sen", "Controller_Flight_MISC_Reliant_Tana", "Controller_Flight_AEGS_Avenger_Titan", "Controller_Flight_AEGS_Avenger_Warlock", "Controller_Flight_ORIG_315p", "Controller_Flight_ORIG_325a", "Controller_Flight_ORIG_350r"]}}}, "Shield": {"": {"1": {"": ["SHLD_ASAS_S01_Cloak_SCItem", "SHLD_ASAS_S01_Mirage_SCItem", "SHLD_ASAS_S01_Shimmer_SCItem", "SHLD_ASAS_S01_Veil_SCItem", "SHLD_BANU_S01_Placeholder_SCItem", "SHLD_BASL_S01_Bulwark_SCItem", "SHLD_BASL_S01_Guardian_SCItem", "SHLD_BASL_S01_Palisade_SCItem", "SHLD_BASL_S01_Steward_SCItem", "SHLD_BEHR_S01_5SA_SCItem", "SHLD_BEHR_S01_6SA_SCItem", "SHLD_BEHR_S01_7SA_SCItem", "SHLD_GODI_S01_AllStop_SCItem", "SHLD_GODI_S01_FR66_SCItem", "SHLD_GODI_S01_ForceWall_SCItem", "SHLD_GODI_S01_SecureHyde_SCItem", "SHLD_SECO_S01_HEX_SCItem", "SHLD_SECO_S01_INK_SCItem", "SHLD_SECO_S01_WEB_SCItem", "SHLD_YORM_S01_Falco_SCItem", "SHLD_YORM_S01_Jaghte_SCItem", "SHLD_YORM_S01_Targa_SCItem"]}, "4": {"": ["SHLD_GODI_S04_Bengal_SCItem", "SHLD_GODI_S04_Idris_SCItem", "SHLD_GODI_S04_Javelin_SCItem", "SHLD_ORIG_S04_890J_SCItem", "SHLD_GODI_S04_Idris_Pirate_SCItem"]}, "0": {"": ["SHLD_BASL_S00_Castra_SCItem", "SHLD_SECO_S00_PIN_SCItem"]}, "3": {"": ["SHLD_BASL_S03_Barbican_SCItem", "SHLD_BASL_S03_Parapet_SCItem", "SHLD_BASL_S03_Stronghold_SCItem", "SHLD_BASL_S03_Ward_SCItem", "SHLD_BEHR_S03_5CA_SCItem", "SHLD_BEHR_S03_6CA_SCItem", "SHLD_BEHR_S03_7CA_SCItem", "SHLD_GODI_S03_FR86_SCItem", "SHLD_GODI_S03_FullBlock_SCItem", "SHLD_GODI_S03_SecureScreen_SCItem", "SHLD_GODI_S03_SureStop_SCItem", "SHLD_SECO_S03_ARMOR_SCItem", "SHLD_SECO_S03_GUARD_SCItem", "SHLD_SECO_S03_HAVEN_SCItem"]}, "2": {"": ["SHLD_ASAS_S02_Obscura_SCItem", "SHLD_ASAS_S02_Sheut_SCItem", "SHLD_ASAS_S02_Shroud_SCItem", "SHLD_ASAS_S02_Umbra_SCItem", "SHLD_BANU_S02_Placeholder_SCItem", "SHLD_BASL_S02_Armada_SCItem", "SHLD_BASL_S02_Aspis_SCItem", "SHLD_BASL_S02_Citadel_SCItem", "SHLD_BASL_S02_Rampart_SCItem", "SHLD_BEHR_S02_5MA_SCItem", "SHLD_BEHR_S02_6MA_SCItem", "SHLD_BEHR_S02_7MA_SCItem", "SHLD_GODI_S02_CoverAll_SCItem", "SHLD_GODI_S02_FR76_SCItem", "SHLD_GODI_S02_FullStop_SCItem", "SHLD_GODI_S02_SecureShield_SCItem", "SHLD_SECO_S02_BLOC_SCItem", "SHLD_SECO_S02_RPEL_SCItem", "SHLD_SECO_S02_STOP_SCItem", "SHLD_YORM_S02_Bamoty_SCItem", "SHLD_YORM_S02_Haltur_SCItem", "SHLD_YORM_S02_Trenta_SCItem"]}}}, "QuantumDrive": {"": {"3": {"": ["QDRV_ARCC_S03_Echo_SCItem", "QDRV_ARCC_S03_Fissure_SCItem", "QDRV_ARCC_S03_Impulse_SCItem", "QDRV_JUST_S03_Agni_SCItem", "QDRV_JUST_S03_Kama_SCItem", "QDRV_JUST_S03_Vesta_SCItem", "QDRV_RSI_S03_Erebos_SCItem", "QDRV_RSI_S03_Metis_SCItem", "QDRV_RSI_S03_Tyche_SCItem", "QDRV_TARS_S03_Drifter_SCItem", "QDRV_TARS_S03_Ranger_SCItem", "QDRV_TARS_S03_Wanderer_SCItem", "QDRV_WETK_S03_Balandin_SCItem", "QDRV_WETK_S03_Pontes_SCItem", "QDRV_WETK_S03_TS2_SCItem"]}, "1": {"": ["QDRV_ACAS_S01_FoxFire_SCItem", "QDRV_ACAS_S01_LightFire_SCItem", "QDRV_ARCC_S01_Burst_SCItem", "QDRV_ARCC_S01_Flood_SCItem", "QDRV_ARCC_S01_Rush_SCItem", "QDRV_JUST_S01_Colossus_SCItem", "QDRV_JUST_S01_Goliath_SCItem", "QDRV_JUST_S01_Vulcan_SCItem", "QDRV_RACO_S01_Drift_SCItem", "QDRV_RACO_S01_Spectre_SCItem", "QDRV_RACO_S01_Zephyr_SCItem", "QDRV_RSI_S01_Atlas_SCItem", "QDRV_RSI_S01_Eos_SCItem", "QDRV_RSI_S01_Hyperion_SCItem", "QDRV_TARS_S01_Expedition_SCItem", "QDRV_TARS_S01_Voyage_SCItem", "QDRV_TARS_S01_Wayfare_SCItem", "QDRV_WETK_S01_Beacon_SCItem", "QDRV_WETK_S01_Siren_SCItem", "QDRV_WETK_S01_VK00_SCItem"]}, "2": {"": ["QDRV_ACAS_S02_SparkFire_SCItem", "QDRV_ACAS_S02_SunFire_SCItem", "QDRV_ARCC_S02_Cascade_SCItem", "QDRV_ARCC_S02_Flash_SCItem", "QDRV_ARCC_S02_Torrent_SCItem", "QDRV_JUST_S02_Bolon_SCItem", "QDRV_JUST_S02_Huracan_SCItem", "QDRV_JUST_S02_Yaluk_SCItem", "QDRV_RACO_S02_Bolt_SCItem", "QDRV_RACO_S02_Nova_SCItem", "QDRV_RACO_S02_Spicule_SCItem", "QDRV_RSI_S02_Aither_SCItem", "QDRV_RSI_S02_Hemera_SCItem", "QDRV_RSI_S02_Khaos_SCItem", "QDRV_TARS_S02_Odyssey_SCItem", "QDRV_TARS_S02_Quest_SCItem", "QDRV_TARS_S02_Sojourn_SCItem", "QDRV_WETK_S02_Crossfield_SCItem", "QDRV_WETK_S02_XL1_SCItem", "QDRV_WETK_S02_Yeager_SCItem"]}, "4": {"": ["QDRV_AEGS_S04_Javelin_SCItem", "QDRV_ORIG_S04_890J_SCItem", "QDRV_WETK_S04_Idris_TEMP"]}}}, "Cooler": {"": {"3": {"": ["COOL_AEGS_S03_Blizzard_SCItem", "COOL_AEGS_S03_Galinstan_SCItem", "COOL_AEGS_S03_Mercury_SCItem", "COOL_AEGS_S03_Tempest_SCItem", "COOL_JSPN_S03_CryoStarXL_SCItem", "COOL_JSPN_S03_FrostStarXL_SCItem", "COOL_JSPN_S03_WinterStarXL_SCItem", "COOL_JUST_S03_ChillMax_SCItem", "COOL_JUST_S03_Hydropulse_SCItem", "COOL_JUST_S03_IceFlush_SCItem", "COOL_JUST_S03_ThermalCore_SCItem", "COOL_LPLT_S03_ColdSurge_SCItem", "COOL_LPLT_S03_FrostBite_SCItem", "COOL_LPLT_S03_FrostBurn_SCItem", "COOL_WCPR_S03_Draug_SCItem", "COOL_WCPR_S03_Elsen_SCItem", "COOL_WCPR_S03_Kragen_SCItem"]}, "1": {"": ["COOL_ACOM_S01_IcePlunge_SCItem", "COOL_ACOM_S01_QuickCool_SCItem", "COOL_ACOM_S01_ZeroRush_SCItem", "COOL_AEGS_S01_Bracer_SCItem", "COOL_AEGS_S01_Glacier_SCItem", "COOL_AEGS_S01_Polar_SCItem", "COOL_AEGS_S01_Tundra_SCItem", "COOL_JSPN_S01_CryoStar_SCItem", "COOL_JSPN_S01_FrostStar_SCItem", "COOL_JSPN_S01_WinterStar_SCItem", "COOL_JUST_S01_EcoFlow_SCItem", "COOL_JUST_S01_Hydrocel_SCItem", "COOL_JUST_S01_Thermax_SCItem", "COOL_JUST_S01_UltraFlow_SCItem", "COOL_LPLT_S01_ArcticStorm_SCItem", "COOL_LPLT_S01_BlastChill_SCItem", "COOL_LPLT_S01_FlashFreeze_SCItem", "COOL_TYDT_S01_HeatSafe_SCItem", "COOL_TYDT_S01_SnowBlind_SCItem", "COOL_TYDT_S01_VaporBlock_SCItem", "COOL_WCPR_S01_Berian_SCItem", "COOL_WCPR_S01_Endo_SCItem", "COOL_WCPR_S01_Gelid_SCItem"]}, "4": {"": ["COOL_AEGS_S04_Idris_SCItem", "COOL_AEGS_S04_Javelin_SCItem", "COOL_ORIG_S04_890J_SCItem", "COOL_RSI_S04_Bengal_SCItem"]}, "0": {"": ["COOL_JSPN_S00_CryoStarSL_SCItem", "COOL_JSPN_S00_FrostStarSL_SCItem", "COOL_JSPN_S00_WinterStarSL_SCItem", "COOL_WCPR_S00_Fridan_SCItem", "COOL_WCPR_S00_Kelvid_SCItem", "COOL_WCPR_S00_Tepilo_SCItem"]}, "2": {"": ["COOL_ACOM_S02_AbsoluteZero_SCItem", "COOL_ACOM_S02_IceDive_SCItem", "COOL_ACOM_S02_RapidCool_SCItem", "COOL_AEGS_S02_Arctic_SCItem", "COOL_AEGS_S02_Avalanche_SCItem", "COOL_AEGS_S02_Boreal_SCItem", "COOL_AEGS_S02_Permafrost_SCItem", "COOL_JSPN_S02_CryoStarEX_SCItem", "COOL_JSPN_S02_FrostStarEX_SCItem", "COOL_JSPN_S02_WinterStarEX_SCItem", "COOL_JUST_S02_CoolCore_SCItem", "COOL_JUST_S02_Hydrojet_SCItem", "COOL_JUST_S02_Snowfall_SCItem", "COOL_JUST_S02_Snowpack_SCItem", "COOL_LPLT_S02_ColdSnap_SCItem", "COOL_LPLT_S02_FullFrost_SCItem", "COOL_LPLT_S02_WhiteOut_SCItem", "COOL_TYDT_S02_HeatSink_SCItem", "COOL_TYDT_S02_IceBox_SCItem", "COOL_TYDT_S02_NightFall_SCItem", "COOL_WCPR_S02_Aufeis_SCItem", "COOL_WCPR_S02_Graupel_SCItem", "COOL_WCPR_S02_Taiga_SCItem"]}}}, "PowerPlant": {"Power": {"4": {"": ["POWR_AEGS_S04_Idris_SCItem", "POWR_AEGS_S04_Reclaimer_SCItem", "POWR_ORIG_S04_890J_SCItem", "POWR_RSI_S04_Bengal_SCItem"]}, "1": {"": ["POWR_ACOM_S01_LumaCore_SCItem", "POWR_ACOM_S01_StarHeart_SCItem", "POWR_ACOM_S01_SunFlare_SCItem", "POWR_AEGS_S01_Charger_SCItem", "POWR_AEGS_S01_FierellCascade_SCItem", "POWR_AEGS_S01_Quadracell_SCItem", "POWR_AEGS_S01_Regulus_SCItem", "POWR_AMRS_S01_DynaFlux_SCItem", "POWR_AMRS_S01_HyperGen_SCItem", "POWR_AMRS_S01_JS300_SCItem", "POWR_AMRS_S01_OverDrive_SCItem", "POWR_JUST_S01_Breton_SCItem", "POWR_JUST_S01_Endurance_SCItem", "POWR_JUST_S01_Fortitude_SCItem", "POWR_JUST_S01_Roughneck_SCItem", "POWR_LPLT_S01_IonBurst_SCItem", "POWR_LPLT_S01_PowerBolt_SCItem", "POWR_LPLT_S01_ZapJet_SCItem", "POWR_SASU_S01_LightBlossom_SCItem", "POWR_SASU_S01_MagnaBloom_SCItem", "POWR_SASU_S01_WhiteRose_SCItem", "POWR_TYDT_S01_DeltaMax_SCItem", "POWR_TYDT_S01_Slipstream_SCItem", "POWR_TYDT_S01_SonicLite_SCItem"]}, "2": {"": ["POWR_ACOM_S02_LuxCore_SCItem", "POWR_ACOM_S02_SolarFlare_SCItem", "POWR_ACOM_S02_StarBurn_SCItem", "POWR_AEGS_S02_Bolide_SCItem", "POWR_AEGS_S02_Maelstrom_SCItem", "POWR_AEGS_S02_QuadracellMT_SCItem", "POWR_AEGS_S02_Vortex_SCItem", "POWR_AMRS_S02_ExoGen_SCItem", "POWR_AMRS_S02_JS400_SCItem", "POWR_AMRS_S02_TurboDrive_SCItem", "POWR_AMRS_S02_UltraFlux_SCItem", "POWR_JUST_S02_Diligence_SCItem", "POWR_JUST_S02_Genoa_SCItem", "POWR_JUST_S02_Sedulity_SCItem", "POWR_JUST_S02_Trommel_SCItem", "POWR_LPLT_S02_FullForce_SCItem", "POWR_LPLT_S02_IonSurge_SCItem", "POWR_LPLT_S02_SparkJet_SCItem", "POWR_SASU_S02_DayBreak_SCItem", "POWR_SASU_S02_Lotus_SCItem", "POWR_SASU_S02_Radiance_SCItem", "POWR_TYDT_S02_Cirrus_SCItem", "POWR_TYDT_S02_Eclipse_SCItem", "POWR_TYDT_S02_GammaMax_SCItem"]}, "3": {"": ["POWR_AEGS_S03_Centurion_SCItem", "POWR_AEGS_S03_Drassik_SCItem", "POWR_AEGS_S03_Fulgur_SCItem", "POWR_AEGS_S03_QuadracellMX_SCItem", "POWR_AMRS_S03_JS500_SCItem", "POWR_AMRS_S03_MegaFlux_SCItem", "POWR_AMRS_S03_SmartGen_SCItem", "POWR_AMRS_S03_SuperDrive_SCItem", "POWR_JUST_S03_Durango_SCItem", "POWR_JUST_S03_Ginzel_SCItem", "POWR_JUST_S03_Reliance_SCItem", "POWR_LPLT_S03_FullForcePro_SCItem", "POWR_LPLT_S03_IonSurgePro_SCItem", "POWR_LPLT_S03_SparkJetPro_SCItem", "POWR_SASU_S03_Celestial_SCItem", "POWR_SASU_S03_NewDawn_SCItem", "POWR_SASU_S03_TigerLilly_SCItem"]}, "0": {"": ["POWR_JUST_S00_Defiant_SCItem", "POWR_JUST_S00_Jennet_SCItem", "POWR_JUST_S00_SteadFast_SCItem", "POWR_LPLT_S00_DuraJet_SCItem", "POWR_LPLT_S00_IonWave_SCItem", "POWR_LPLT_S00_Radix_SCItem"]}}}};
\ No newline at end of file
@@ -0,0 +1,165 @@
+// Data files are normally scripts that set a global variable. Files published with --binary are listed in
+// binaryDataFiles instead, with the variable they set, and are fetched and decoded here. Those can't block the page
+// like scripts, so the application scripts are only loaded once they've arrived.
+const pendingDataFiles = [];
+
+// Reads the encoding written by scripts/binary_encoding.py. Every string is stored once in a table at the start and
+// values refer to it by index.
+const decodeBinaryData = (buffer) => {
+    const bytes = new Uint8Array(buffer);
+    const view = new DataView(buffer);
+    const decoder = new TextDecoder();
+    const magic = "HPB1";
+    let position = 0;
+
+    for (const character of magic) {
+        if (bytes[position++] != character.charCodeAt(0)) {
+            throw new Error("Data doesn't start with the expected header");
+        }
+    }
+
+    // Numbers can be longer than the 32 bits bitwise operators work on.
+    const readVarint = () => {
+        let number = 0;
+        let scale = 1;
+        while (true) {
+            const byte = bytes[position++];
+            number += (byte & 0x7F) * scale;
+            if (byte < 0x80) {
+                return number;
+            }
+            scale *= 0x80;
+        }
+    };
+
+    const strings = [];
+    const stringCount = readVarint();
+    for (let i = 0; i < stringCount; i++) {
+        const length = readVarint();
+        strings.push(decoder.decode(bytes.subarray(position, position + length)));
+        position += length;
+    }
+
+    const readValue = () => {
+        const tag = bytes[position++];
+        switch (tag) {
+            case 0:
+                return null;
+            case 1:
+                return false;
+            case 2:
+                return true;
+            case 3: {
+                const number = readVarint();
+                return number % 2 ? -(number + 1) / 2 : number / 2;
+            }
+            case 4: {
+                const value = view.getFloat64(position, true);
+                position += 8;
+                return value;
+            }
+            case 5:
+                return strings[readVarint()];
+            case 6: {
+                const result = [];
+                const count = readVarint();
+                for (let i = 0; i < count; i++) {
+                    result.push(readValue());
+                }
+                return result;
+            }
+            case 7: {
+                const result = {};
+                const count = readVarint();
+                for (let i = 0; i < count; i++) {
+                    const key = strings[readVarint()];
+                    result[key] = readValue();
+                }
+                return result;
+            }
+        }
+
+        throw new Error("Unknown value tag " + tag + " at offset " + (position - 1));
+    };
+
+    return readValue();
+};
+
+const loadDataFiles = (names) => {
+    for (const name of names) {
+        const variable = binaryDataFiles[name];
+        if (variable) {
+            pendingDataFiles.push(fetch("data/" + name + ".bin")
+                .then(n => {
+                    if (!n.ok) {
+                        throw new Error("Failed to fetch data/" + name + ".bin");
+                    }
+                    return n.arrayBuffer();
+                })
+                .then(n => globalThis[variable] = decodeBinaryData(n)));
+        }
+        else {
+            document.write('<script src="data/' + name + '.js"><\/script>');
+        }
+    }
+};
+
+// With ?shards, vehicles, items and ammo params come from the shards published with --shards instead. The manifest
+// lists every vehicle, but only the one in the URL is fetched up front, or all of them on other pages. Shards have
+// their content hash in their names, so browsers can keep them across data updates.
+let shardManifest;
+
+const fetchJson = (path) => {
+    return fetch(path).then(n => {
+        if (!n.ok) {
+            throw new Error("Failed to fetch " + path);
+        }
+        return n.json();
+    });
+};
+
+const fetchShard = (shard) => {
+    return fetchJson("data/shards/" + shard);
+};
+
+// Resolves to an object of the named vehicles.
+const fetchVehicleShards = (names) => {
+    return Promise.all(names.map(n => fetchShard(shardManifest.vehicles[n].shard)))
+        .then(vehicles => Object.fromEntries(names.map((n, i) => [n, vehicles[i]])));
+};
+
+const loadShards = () => {
+    pendingDataFiles.push(fetchJson("data/shards/manifest.json").then(manifest => {
+        shardManifest = manifest;
+
+        const match = location.hash.match(/^#\/vehicles\/([^\/]+)/);
+        const viewed = match && decodeURIComponent(match[1]);
+        const vehicleNames = viewed in manifest.vehicles ? [viewed] : Object.keys(manifest.vehicles);
+
+        const itemShards = Object.values(manifest.itemShards);
+        return Promise.all([fetchVehicleShards(vehicleNames), Promise.all(itemShards.map(fetchShard)), fetchShard(manifest.ammoParamsShard)])
+            .then(([vehicles, itemsByType, ammoParams]) => {
+                // Items are sharded by type, but lists of them are in the published order.
+                const items = Object.assign({}, ...itemsByType);
+                globalThis.allVehicles = vehicles;
+                globalThis.allItems = Object.fromEntries(Object.keys(manifest.items).map(n => [n, items[n]]));
+                globalThis.allAmmoParams = ammoParams;
+            });
+    }));
+};
+
+const loadScript = (src) => {
+    return new Promise((resolve, reject) => {
+        const script = document.createElement("script");
+        script.src = src;
+        script.async = false;
+        script.onload = resolve;
+        script.onerror = () => reject(new Error("Failed to load " + src));
+        document.body.appendChild(script);
+    });
+};
+
+// Scripts added together still run in the order given.
+const loadApplication = (scripts) => {
+    return Promise.all(pendingDataFiles).then(() => Promise.all(scripts.map(loadScript)));
+};
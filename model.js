@@ -249,6 +249,10 @@ class WeaponGunExtension extends DefaultExtension {
     }
 
     get range() {
+        if (this._item.weaponMetrics) {
+            return this._item.weaponMetrics.range;
+        }
+
         if (!this.ammo) {
             return 0;
         }
@@ -257,6 +261,10 @@ class WeaponGunExtension extends DefaultExtension {
     }
 
     get alpha() {
+        if (this._item.weaponMetrics) {
+            return new Damage(this._item.weaponMetrics.alpha);
+        }
+
         if (!this.ammo) {
             return new Damage();
         }
@@ -272,6 +280,10 @@ class WeaponGunExtension extends DefaultExtension {
     }
 
     get burstDps() {
+        if (this._item.weaponMetrics) {
+            return new Damage(this._item.weaponMetrics.burstDps);
+        }
+
         if (!this.ammo) {
             return new Damage();
         }
@@ -287,7 +299,19 @@ class WeaponGunExtension extends DefaultExtension {
         return this.alpha;
     }
 
+    get sustainedDps() {
+        if (this._item.weaponMetrics) {
+            return new Damage(this._item.weaponMetrics.sustainedDps);
+        }
+
+        return this.burstDps;
+    }
+
     get droppedDps() {
+        if (this._item.weaponMetrics && this._item.weaponMetrics.droppedDps) {
+            return new Damage(this._item.weaponMetrics.droppedDps);
+        }
+
         if (this.ammo && this.ammo.damageDrop) {
             return this.droppedAlpha.scale(this._item.weaponAction.pelletCount).scale(this._item.weaponAction.fireRate / 60.0);
         }
@@ -296,6 +320,10 @@ class WeaponGunExtension extends DefaultExtension {
     }
 
     get dropStartRange() {
+        if (this._item.weaponMetrics) {
+            return this._item.weaponMetrics.dropStartRange;
+        }
+
         if (this.ammo && this.ammo.damageDrop) {
             // TODO Support other and mixed damage types for damage drop.
             const key = "energy";
@@ -305,6 +333,10 @@ class WeaponGunExtension extends DefaultExtension {
     }
 
     get dropEndRange() {
+        if (this._item.weaponMetrics) {
+            return this._item.weaponMetrics.dropEndRange;
+        }
+
         if (this.ammo && this.ammo.damageDrop) {
             // TODO Support other and mixed damage types for damage drop.
             const key = "energy";
@@ -338,6 +370,69 @@ class WeaponRegenPoolExtension extends DefaultExtension {
     }
 }
 
+// Published vehicles refer to shared blocks for their ports and default loadouts, so expand those in place. Every
+// vehicle gets its own copies to match loading the vehicles in full.
+if (typeof vehicleBlocks != "undefined") {
+    const expandLoadout = (key) => _.mapValues(vehicleBlocks[key], n => Object.assign({}, vehicleBlocks[n], {children: expandLoadout(vehicleBlocks[n].children)}));
+
+    for (const vehicle of Object.values(allVehicles)) {
+        if (typeof vehicle.ports == "number") {
+            vehicle.ports = vehicleBlocks[vehicle.ports].map(n => _.cloneDeep(vehicleBlocks[n]));
+            if (vehicle.defaultItems) {
+                vehicle.defaultItems = expandLoadout(vehicle.defaultItems);
+            }
+        }
+    }
+}
+
+// Default loadouts of vehicles and items can also be published as flat rows of parent row, port name id and item name
+// id. Rows are in depth first order, so each entry's parent already exists and a single pass rebuilds the whole loadout.
+if (typeof loadoutTables != "undefined") {
+    const expandRows = (records, rowsByName) => {
+        for (const [name, rows] of Object.entries(rowsByName || {})) {
+            const record = records[name];
+            if (record && !record.defaultItems) {
+                record.defaultItems = {};
+
+                const containers = [];
+                for (let i = 0; i < rows.length; i += 3) {
+                    const entry = {itemName: loadoutTables.itemNames[rows[i + 2]], children: {}};
+                    const container = rows[i] < 0 ? record.defaultItems : containers[rows[i]];
+                    container[loadoutTables.portNames[rows[i + 1]]] = entry;
+                    containers.push(entry.children);
+                }
+            }
+        }
+    };
+
+    expandRows(allVehicles, loadoutTables.vehicles);
+    expandRows(allItems, loadoutTables.items);
+}
+
+// Display names are converted in English. Other languages are published as bundles of only the localization keys the
+// records refer to, so when one was loaded swap in its strings.
+const localizeRecords = (records) => {
+    if (typeof localizationBundle != "undefined") {
+        for (const record of records) {
+            const localized = localizationBundle[record.displayNameKey];
+            if (localized) {
+                record.displayName = localized;
+            }
+        }
+    }
+};
+
+localizeRecords(Object.values(allVehicles).concat(Object.values(allItems)));
+
+// Vehicles loaded from shards are only the ones the first page needed, but the manifest lists all of them.
+const publishedVehicles = () => typeof shardManifest == "undefined" ? allVehicles : shardManifest.vehicles;
+
+if (typeof shardManifest != "undefined") {
+    localizeRecords(Object.values(shardManifest.vehicles));
+}
+
+const itemOrder = new Map(Object.keys(allItems).map((n, i) => [n, i]));
+
 const extensionClasses = {
     Container: ContainerExtension,
     MainThruster: ThrusterExtension,
@@ -439,11 +534,54 @@ class ItemBinding {
             return true;
         };
 
-        const keys = Object.keys(allItems);
-        const filtered = keys.filter(n => matchesPort(allItems[n]));
+        // Fall back to scanning every item when the port index wasn't published.
+        let filtered;
+        if (typeof portIndex == "undefined") {
+            filtered = Object.keys(allItems).filter(n => matchesPort(allItems[n]));
+        }
+        else {
+            filtered = this._lookupMatchingItems(typeFilter);
+        }
+
         return filtered.map(n => allItems[n]).map(n => new ExtendedItem(n, this._makeExtension(n)));
     }
 
+    _lookupMatchingItems(typeFilter) {
+        const matchesTags = (itemTags) => {
+            return itemTags.every(t => this.port.requiredTags.includes(t) || this._loadout.vehicle.itemPortTags.includes(t)) &&
+                this.port.requiredTags.every(t => itemTags.includes(t));
+        };
+
+        const names = new Set();
+        for (const portType of this.port.types) {
+            if (typeFilter && portType.type != typeFilter) {
+                continue;
+            }
+
+            for (const [subtype, sizes] of Object.entries(portIndex[portType.type] || {})) {
+                if (portType.subtype && subtype && portType.subtype != subtype) {
+                    continue;
+                }
+
+                for (const [size, groups] of Object.entries(sizes)) {
+                    if ((this.port.minSize && Number(size) < this.port.minSize) || (this.port.maxSize && Number(size) > this.port.maxSize)) {
+                        continue;
+                    }
+
+                    // Items are grouped by their required tags, so the tags only need checking once per group.
+                    for (const [tags, groupNames] of Object.entries(groups)) {
+                        if (matchesTags(tags ? tags.split(" ") : [])) {
+                            groupNames.forEach(n => names.add(n));
+                        }
+                    }
+                }
+            }
+        }
+
+        // Keep the same order as scanning all items would.
+        return Array.from(names).sort((a, b) => itemOrder.get(a) - itemOrder.get(b));
+    }
+
     setItem(itemName) {
         this.item = allItems[itemName];
 
@@ -693,4 +831,13 @@ class VehicleLoadout {
 const defaultLoadouts = {};
 for (const vehicleName of Object.keys(allVehicles)) {
     defaultLoadouts[vehicleName] = new VehicleLoadout(vehicleName);
-}
\ No newline at end of file
+}
+
+// Adds vehicles fetched from shards after loading, once a page needs them.
+const addVehicles = (vehicles) => {
+    localizeRecords(Object.values(vehicles));
+    for (const [vehicleName, vehicle] of Object.entries(vehicles)) {
+        allVehicles[vehicleName] = vehicle;
+        defaultLoadouts[vehicleName] = new VehicleLoadout(vehicleName);
+    }
+};
\ No newline at end of file
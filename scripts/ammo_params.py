@@ -24,3 +24,53 @@ def make_ammo_params(ammo_params_element):
                 "minDamage": _make_damage(drop_element.single("damagedropmindamage"))
             }
     return result
+
+
+_damage_keys = ["damageDistortion", "damageEnergy", "damagePhysical", "damageThermal"]
+
+
+def _add_damage(damage, other):
+    return {x: damage[x] + other[x] for x in _damage_keys}
+
+
+def _scale_damage(damage, coefficient):
+    return {x: damage[x] * coefficient for x in _damage_keys}
+
+
+def make_weapon_metrics(weapon, ammo_params):
+    # Same numbers WeaponGunExtension in model.js works out, joined once here rather than on every render.
+    weapon_action = weapon.get("weaponAction")
+    if not weapon_action:
+        return None
+
+    zero_damage = {x: 0.0 for x in _damage_keys}
+    alpha = _add_damage(ammo_params.get("damage", zero_damage), ammo_params.get("explosionDamage", zero_damage))
+
+    shots_per_second = weapon_action["fireRate"] / 60.0
+    pellet_count = weapon_action.get("pelletCount", 1)
+
+    # Energy weapons can't keep firing faster than their requested regeneration refills their ammo load.
+    sustained_shots_per_second = shots_per_second
+    if weapon.get("regenerationCostPerBullet"):
+        sustained_shots_per_second = min(shots_per_second, weapon["requestedRegenPerSec"] / weapon["regenerationCostPerBullet"])
+
+    result = {
+        "alpha": alpha,
+        "burstDps": _scale_damage(alpha, pellet_count * shots_per_second),
+        "sustainedDps": _scale_damage(alpha, pellet_count * sustained_shots_per_second),
+        "heatPerSecond": weapon_action["heatPerShot"] * shots_per_second,
+        "range": ammo_params["speed"] * ammo_params["lifetime"]
+    }
+
+    damage_drop = ammo_params.get("damageDrop")
+    if damage_drop:
+        # TODO Support other and mixed damage types for damage drop.
+        key = "damageEnergy"
+        result["droppedDps"] = _scale_damage(damage_drop["minDamage"], pellet_count * shots_per_second)
+        result["dropStartRange"] = damage_drop["minDistance"][key]
+        result["dropEndRange"] = None
+        if damage_drop["dropPerMeter"][key]:
+            drop_distance = (alpha[key] - damage_drop["minDamage"][key]) / damage_drop["dropPerMeter"][key]
+            result["dropEndRange"] = result["dropStartRange"] + drop_distance
+
+    return result
@@ -0,0 +1,138 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+
+from xml.etree import ElementTree
+
+from extract import source_path, convert_game_xml, vehicle_paths, item_paths
+from forge import ForgeRecordIndex, find_forge_entries
+from item import make_item
+from localization import LocalizationTable, localization_path
+from synthetic_data import generate_corpus
+from vehicle import make_vehicle, make_loadout
+from xml_reader import clear_xml_file_cache, read_xml_file, read_xml_tree, walk_xml_tree
+
+
+def _time_best(function, repeat):
+    best = None
+    for _ in range(repeat):
+        # Every run starts with cold parsed files, so runs after the first don't skip parsing definitions, loadouts
+        # and patches.
+        clear_xml_file_cache()
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmarks(extracted_path, repeat):
+    game_xml_path = os.path.join(extracted_path, "Data", "Game.xml")
+    root = ElementTree.parse(game_xml_path).getroot()
+
+    index = ForgeRecordIndex()
+    index.register("EntityClassDefinition", vehicle_paths, "vehicles")
+    index.register("EntityClassDefinition", item_paths, "items")
+
+    vehicle_elements = []
+    item_elements = []
+    for element, families in find_forge_entries(root, index):
+        if "vehicles" in families:
+            vehicle_elements.append(element)
+        if "items" in families:
+            item_elements.append(element)
+
+    definition_paths = []
+    for element in vehicle_elements:
+        vehicle_params = read_xml_tree(element).single("components").single("vehiclecomponentparams")
+        definition_paths.append(os.path.join(extracted_path, "Data", vehicle_params["@vehicledefinition"]))
+
+    def read_all_records():
+        for element in root:
+            for _ in walk_xml_tree(read_xml_tree(element)):
+                pass
+
+    def make_all_items():
+        for element in item_elements:
+            make_item(read_xml_tree(element))
+
+    def make_all_vehicles():
+        for path in definition_paths:
+            make_vehicle(read_xml_file(path))
+
+    def make_all_loadouts():
+        for element in vehicle_elements:
+            loadout_component = read_xml_tree(element).single("components").single("sentitycomponentdefaultloadoutparams")
+            make_loadout(loadout_component, extracted_path)
+
+    def convert_all():
+        localization = LocalizationTable(localization_path(extracted_path))
+        convert_game_xml(game_xml_path, extracted_path, localization)
+
+    benchmarks = [
+        ("read_xml_tree", len(root), read_all_records),
+        ("make_item", len(item_elements), make_all_items),
+        ("make_vehicle", len(definition_paths), make_all_vehicles),
+        ("make_loadout", len(vehicle_elements), make_all_loadouts),
+        ("convert", len(root), convert_all)
+    ]
+
+    results = []
+    for name, record_count, function in benchmarks:
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds = _time_best(function, repeat)
+        results.append({"benchmark": name, "records": record_count, "seconds": seconds})
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--label", default=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    parser.add_argument("--results", default=os.path.join(source_path, "extracted", "benchmarks.json"), metavar="RESULTS_PATH")
+    arguments = parser.parse_args()
+
+    history = []
+    if os.path.exists(arguments.results):
+        with open(arguments.results, "r", encoding="UTF-8") as results_file:
+            history = json.load(results_file)
+
+    previous = history[-1] if history else None
+    previous_seconds = {}
+    if previous:
+        for result in previous["results"]:
+            previous_seconds[(result["scale"], result["benchmark"])] = result["seconds"]
+
+    run = {
+        "label": arguments.label,
+        "python": platform.python_version(),
+        "results": []
+    }
+
+    for scale in arguments.scales:
+        with tempfile.TemporaryDirectory() as extracted_path:
+            print("Generating synthetic data at scale " + str(scale))
+            generate_corpus(extracted_path, scale)
+
+            for result in run_benchmarks(extracted_path, arguments.repeat):
+                result["scale"] = scale
+                run["results"].append(result)
+
+                line = "    {}: {:.3f}s for {} records".format(result["benchmark"], result["seconds"], result["records"])
+                baseline = previous_seconds.get((scale, result["benchmark"]))
+                if baseline:
+                    line += " ({:+.1f}% vs {})".format(100 * (result["seconds"] / baseline - 1), previous["label"])
+                print(line)
+
+    history.append(run)
+    os.makedirs(os.path.dirname(arguments.results), exist_ok=True)
+    with open(arguments.results, "w", encoding="UTF-8") as results_file:
+        json.dump(history, results_file, indent=4)
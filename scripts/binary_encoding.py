@@ -0,0 +1,149 @@
+import collections
+import struct
+
+
+# Compact binary encoding of JSON compatible values. Every string, including object keys, is stored once in a table
+# ordered by frequency, and values refer to it by index. Port names, types, flags and hashes repeat a lot in the
+# published data, so this is a lot smaller than the equivalent JSON.
+_magic = b"HPB1"
+
+_null = 0
+_false = 1
+_true = 2
+_integer = 3
+_float = 4
+_string = 5
+_list = 6
+_object = 7
+
+_double = struct.Struct("<d")
+
+
+def _count_strings(value, counts):
+    if isinstance(value, str):
+        counts[value] += 1
+    elif isinstance(value, list):
+        for x in value:
+            _count_strings(x, counts)
+    elif isinstance(value, dict):
+        for key, x in value.items():
+            counts[key] += 1
+            _count_strings(x, counts)
+
+
+def _write_varint(output, number):
+    while number >= 0x80:
+        output.append((number & 0x7F) | 0x80)
+        number >>= 7
+    output.append(number)
+
+
+def _write_value(output, value, indices):
+    if value is None:
+        output.append(_null)
+    elif value is False:
+        output.append(_false)
+    elif value is True:
+        output.append(_true)
+    elif isinstance(value, int):
+        output.append(_integer)
+        _write_varint(output, value * 2 if value >= 0 else -value * 2 - 1)
+    elif isinstance(value, float):
+        output.append(_float)
+        output.extend(_double.pack(value))
+    elif isinstance(value, str):
+        output.append(_string)
+        _write_varint(output, indices[value])
+    elif isinstance(value, list):
+        output.append(_list)
+        _write_varint(output, len(value))
+        for x in value:
+            _write_value(output, x, indices)
+    elif isinstance(value, dict):
+        output.append(_object)
+        _write_varint(output, len(value))
+        for key, x in value.items():
+            _write_varint(output, indices[key])
+            _write_value(output, x, indices)
+    else:
+        raise TypeError("Unable to encode value of type " + type(value).__name__)
+
+
+def encode(value):
+    counts = collections.Counter()
+    _count_strings(value, counts)
+
+    # Frequent strings get the smallest indices, which take a single byte to refer to.
+    strings = [x for x, _ in counts.most_common()]
+    indices = {x: index for index, x in enumerate(strings)}
+
+    output = bytearray(_magic)
+    _write_varint(output, len(strings))
+    for string in strings:
+        encoded = string.encode("UTF-8")
+        _write_varint(output, len(encoded))
+        output.extend(encoded)
+
+    _write_value(output, value, indices)
+    return bytes(output)
+
+
+class _Decoder:
+    def __init__(self, data):
+        self.data = data
+        self.position = len(_magic)
+        self.strings = []
+
+    def read_varint(self):
+        number = 0
+        shift = 0
+        while True:
+            byte = self.data[self.position]
+            self.position += 1
+            number |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return number
+            shift += 7
+
+    def read_value(self):
+        tag = self.data[self.position]
+        self.position += 1
+
+        if tag == _null:
+            return None
+        if tag == _false:
+            return False
+        if tag == _true:
+            return True
+        if tag == _integer:
+            number = self.read_varint()
+            return number >> 1 if not number & 1 else -((number + 1) >> 1)
+        if tag == _float:
+            value = _double.unpack_from(self.data, self.position)[0]
+            self.position += _double.size
+            return value
+        if tag == _string:
+            return self.strings[self.read_varint()]
+        if tag == _list:
+            return [self.read_value() for _ in range(self.read_varint())]
+        if tag == _object:
+            result = {}
+            for _ in range(self.read_varint()):
+                key = self.strings[self.read_varint()]
+                result[key] = self.read_value()
+            return result
+
+        raise ValueError("Unknown value tag " + str(tag) + " at offset " + str(self.position - 1))
+
+
+def decode(data):
+    if data[:len(_magic)] != _magic:
+        raise ValueError("Data doesn't start with the expected header")
+
+    decoder = _Decoder(data)
+    for _ in range(decoder.read_varint()):
+        length = decoder.read_varint()
+        decoder.strings.append(data[decoder.position:decoder.position + length].decode("UTF-8"))
+        decoder.position += length
+
+    return decoder.read_value()
@@ -0,0 +1,131 @@
+import argparse
+import hashlib
+import json
+import os
+
+
+_families = ["vehicles", "items", "ammo_params"]
+
+
+def hash_record(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("UTF-8")).hexdigest()[:16]
+
+
+# Writes a content hash of every record next to a converted file, so versions can be compared without loading the
+# records themselves. Takes the same calls as the other writers of converted records.
+class RecordHashWriter:
+    def __init__(self, path):
+        self.path = path
+        self._hashes = {}
+
+    def write(self, key, value):
+        self._hashes.setdefault(key, hash_record(value))
+
+    def close(self):
+        with open(self.path + ".tmp", "w", encoding="UTF-8") as hashes_file:
+            json.dump(self._hashes, hashes_file)
+        os.replace(self.path + ".tmp", self.path)
+
+    def abort(self):
+        pass
+
+
+def hashes_path(extracted_path, family):
+    return os.path.join(extracted_path, family + ".hashes.json")
+
+
+def _read_json_file(path):
+    with open(path, "r", encoding="UTF-8") as json_file:
+        return json.load(json_file)
+
+
+def read_record_hashes(extracted_path, family):
+    # Versions converted before hashes were written only have the records, so hash those instead.
+    path = hashes_path(extracted_path, family)
+    if os.path.exists(path):
+        return _read_json_file(path)
+
+    return {key: hash_record(value) for key, value in _read_json_file(os.path.join(extracted_path, family + ".json")).items()}
+
+
+def diff_values(old, new, path=""):
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        result = []
+        for key in old:
+            if key not in new:
+                result.append({"path": path + "/" + key, "removed": old[key]})
+            else:
+                result.extend(diff_values(old[key], new[key], path + "/" + key))
+        for key in new:
+            if key not in old:
+                result.append({"path": path + "/" + key, "added": new[key]})
+        return result
+
+    if isinstance(old, list) and isinstance(new, list):
+        # Lists of named entries like ports are matched by name, so an inserted port doesn't show every later one
+        # as changed.
+        if all(isinstance(x, dict) and "name" in x for x in old + new):
+            old_named = {x["name"]: x for x in old}
+            new_named = {x["name"]: x for x in new}
+            if len(old_named) == len(old) and len(new_named) == len(new):
+                return diff_values(old_named, new_named, path)
+
+        result = []
+        for index in range(max(len(old), len(new))):
+            if index >= len(new):
+                result.append({"path": path + "/" + str(index), "removed": old[index]})
+            elif index >= len(old):
+                result.append({"path": path + "/" + str(index), "added": new[index]})
+            else:
+                result.extend(diff_values(old[index], new[index], path + "/" + str(index)))
+        return result
+
+    return [{"path": path, "old": old, "new": new}]
+
+
+def diff_versions(old_path, new_path):
+    changelog = {}
+    for family in _families:
+        old_hashes = read_record_hashes(old_path, family)
+        new_hashes = read_record_hashes(new_path, family)
+
+        changed = [x for x in new_hashes if x in old_hashes and old_hashes[x] != new_hashes[x]]
+        entry = {
+            "added": [x for x in new_hashes if x not in old_hashes],
+            "removed": [x for x in old_hashes if x not in new_hashes],
+            "changed": {}
+        }
+
+        # Only the records that differ are compared field by field, and the converted files are only loaded if any do.
+        if changed:
+            old_records = _read_json_file(os.path.join(old_path, family + ".json"))
+            new_records = _read_json_file(os.path.join(new_path, family + ".json"))
+            for key in changed:
+                entry["changed"][key] = diff_values(old_records[key], new_records[key])
+
+        changelog[family] = entry
+
+    return changelog
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--old", required=True, metavar="OLD_VERSION")
+    parser.add_argument("--new", required=True, metavar="NEW_VERSION")
+    parser.add_argument("--output", "-o", metavar="CHANGELOG_PATH")
+    arguments = parser.parse_args()
+
+    extracted_root = os.path.join(os.path.dirname(__file__), "..", "extracted")
+    changelog = diff_versions(os.path.join(extracted_root, arguments.old), os.path.join(extracted_root, arguments.new))
+    changelog = {"old": arguments.old, "new": arguments.new, "families": changelog}
+
+    output_path = arguments.output or os.path.join(extracted_root, arguments.new, "changelog.json")
+    with open(output_path, "w", encoding="UTF-8") as changelog_file:
+        json.dump(changelog, changelog_file, indent=4)
+
+    for family, entry in changelog["families"].items():
+        print(family + ": " + str(len(entry["added"])) + " added, " + str(len(entry["removed"])) + " removed, " +
+            str(len(entry["changed"])) + " changed")
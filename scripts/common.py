@@ -1,7 +1,8 @@
-import uuid
+import hashlib
+import json
 
 
-def _make_item_port(item_port_element, name_override, types):
+def _make_item_port(item_port_element, name_override, types, position):
     port = {
         "name": (name_override or item_port_element.get("@name", "")).lower(),
         "types": types,
@@ -19,11 +20,6 @@ def _make_item_port(item_port_element, name_override, types):
         for connection_param in connections_element.get("sitemportconnectionparam", []):
             port["connections"][connection_param.get("@klass")] = connection_param.get("@name")
 
-    # Nameless item ports on the C8 Pisces appear like a broken attempt at hiding them.
-    if not port["name"]:
-        print("    Warning: Adding uuid name to nameless item port")
-        port["name"] = str(uuid.uuid4())
-
     port["flags"] = [x.replace("$", "") for x in port["flags"]]
 
     if not port["requiredTags"]:
@@ -34,4 +30,11 @@ def _make_item_port(item_port_element, name_override, types):
     port["flags"].sort()
     port["types"].sort(key=lambda x: x.get("type") + "_" + str(x.get("subtype")))
 
+    # Nameless item ports on the C8 Pisces appear like a broken attempt at hiding them.
+    # Name them from their position and contents so converting the same data always gives the same output.
+    if not port["name"]:
+        print("    Warning: Adding generated name to nameless item port")
+        digest = hashlib.sha1(json.dumps(port, sort_keys=True).encode("UTF-8")).hexdigest()
+        port["name"] = "unnamed_" + str(position) + "_" + digest[:8]
+
     return port
@@ -0,0 +1,79 @@
+import copy
+import hashlib
+import json
+import os
+
+from xml.etree import ElementTree
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as hashed_file:
+        for block in iter(lambda: hashed_file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_code_version(paths):
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.basename(path).encode("UTF-8"))
+        digest.update(_hash_file(path).encode("UTF-8"))
+    return digest.hexdigest()
+
+
+# Converted records keyed by a hash of the serialized DataForge record, validated against hashes of every file the
+# converter read or probed for that record. Results are stored before localization so they're language independent.
+class ConversionCache:
+    def __init__(self, path, extracted_path, code_version):
+        self.path = path
+        self.extracted_path = extracted_path
+        self.code_version = code_version
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = {}
+        self._used = {}
+        self._file_hashes = {}
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="UTF-8") as cache_file:
+                content = json.load(cache_file)
+            if content.get("codeVersion") == code_version:
+                self._entries = content["entries"]
+
+    def _dependency_hash(self, relative_path):
+        if relative_path not in self._file_hashes:
+            path = os.path.join(self.extracted_path, relative_path)
+            self._file_hashes[relative_path] = _hash_file(path) if os.path.exists(path) else None
+        return self._file_hashes[relative_path]
+
+    def make_key(self, family, element):
+        # The text following the record depends on how far the parser had read when it was handed over, which differs
+        # between streaming and reading the whole file, so it's left out.
+        element = copy.copy(element)
+        element.tail = None
+        return hashlib.sha256(family.encode("UTF-8") + b"\0" + ElementTree.tostring(element)).hexdigest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry and all(self._dependency_hash(k) == v for k, v in entry["dependencies"].items()):
+            self.hits += 1
+            self._used[key] = entry
+            return copy.deepcopy(entry["result"]), True
+
+        self.misses += 1
+        return None, False
+
+    def put(self, key, result, dependencies):
+        relative_paths = [os.path.relpath(x, self.extracted_path) for x in dependencies]
+        self._used[key] = {
+            "result": copy.deepcopy(result),
+            "dependencies": {x: self._dependency_hash(x) for x in relative_paths}
+        }
+
+    def save(self):
+        # Only entries used by this run are kept, which is enough to carry them forward to the next game version.
+        with open(self.path + ".tmp", "w", encoding="UTF-8") as cache_file:
+            json.dump({"codeVersion": self.code_version, "entries": self._used}, cache_file)
+        os.replace(self.path + ".tmp", self.path)
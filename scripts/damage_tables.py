@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+
+import numpy
+
+from ammo_params import _damage_keys
+from publish import read_converted_file, write_compressed_artifacts
+
+
+# Damage over distance for every ammo params record and damage type at once. Direct damage falls off linearly by
+# dropPerMeter beyond minDistance until it reaches minDamage, explosion damage doesn't fall off, and nothing hits
+# beyond the projectile's range.
+class DamageCurves:
+    def __init__(self, ammo_params):
+        self.references = list(ammo_params)
+        self.indices = {x: index for index, x in enumerate(self.references)}
+
+        def damage_array(path):
+            rows = []
+            for params in ammo_params.values():
+                damage = params
+                for key in path:
+                    damage = (damage or {}).get(key)
+                rows.append([(damage or {}).get(x, 0.0) for x in _damage_keys])
+            return numpy.array(rows, dtype=numpy.float64).reshape(-1, len(_damage_keys))
+
+        self.damage = damage_array(["damage"])
+        self.explosion_damage = damage_array(["explosionDamage"])
+        self.min_distance = damage_array(["damageDrop", "minDistance"])
+        self.drop_per_meter = damage_array(["damageDrop", "dropPerMeter"])
+        self.min_damage = damage_array(["damageDrop", "minDamage"])
+        self.range = numpy.array([x["speed"] * x["lifetime"] for x in ammo_params.values()], dtype=numpy.float64)
+
+    def evaluate(self, distances):
+        # Distances are either one grid shared by all records, or one row of distances per record. The result has a
+        # row per record, a column per distance and the damage types along the last axis.
+        distances = numpy.asarray(distances, dtype=numpy.float64)
+        if distances.ndim == 1:
+            distances = numpy.broadcast_to(distances, (len(self.references), distances.shape[0]))
+        distances = distances[:, :, None]
+
+        excess = numpy.maximum(distances - self.min_distance[:, None, :], 0)
+        dropped = self.damage[:, None, :] - self.drop_per_meter[:, None, :] * excess
+        floor = numpy.minimum(self.min_damage, self.damage)[:, None, :]
+        direct = numpy.where(self.drop_per_meter[:, None, :] > 0, numpy.maximum(dropped, floor), self.damage[:, None, :])
+
+        total = direct + self.explosion_damage[:, None, :]
+        return numpy.where(distances <= self.range[:, None, None], total, 0.0)
+
+    def drop_end_distances(self):
+        drop = self.damage - numpy.minimum(self.min_damage, self.damage)
+        per_meter = numpy.where(self.drop_per_meter > 0, self.drop_per_meter, 1.0)
+        return numpy.where(self.drop_per_meter > 0, self.min_distance + drop / per_meter, self.min_distance)
+
+    def breakpoints(self):
+        # Every curve is piecewise linear between the start of the range, the start and end of each damage type's
+        # falloff and the end of the range, so evaluating these distances describes it exactly.
+        candidates = numpy.concatenate([
+            numpy.zeros((len(self.references), 1)),
+            self.min_distance,
+            self.drop_end_distances(),
+            self.range[:, None]], axis=1)
+        return numpy.minimum(candidates, self.range[:, None])
+
+
+def make_weapon_tables(items, ammo_params):
+    curves = DamageCurves(ammo_params)
+    breakpoints = curves.breakpoints()
+    damage = curves.evaluate(breakpoints)
+
+    tables = {}
+    for name, item in items.items():
+        index = curves.indices.get(item.get("ammoParamsReference"))
+        if index is None or not item.get("weaponAction"):
+            continue
+
+        distances, columns = numpy.unique(breakpoints[index], return_index=True)
+        pellet_count = item["weaponAction"].get("pelletCount", 1)
+
+        table = {"distances": distances.tolist()}
+        for type_index, key in enumerate(_damage_keys):
+            values = damage[index, columns, type_index] * pellet_count
+            if values.any():
+                table[key] = values.tolist()
+        tables[name] = table
+
+    return tables
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--publish", "-p", action="store_true")
+    parser.add_argument("--version", "-v", required=True)
+    arguments = parser.parse_args()
+
+    root_path = os.path.join(os.path.dirname(__file__), "..")
+    extracted_path = os.path.join(root_path, "extracted", arguments.version)
+    tables = make_weapon_tables(read_converted_file(extracted_path, "items"), read_converted_file(extracted_path, "ammo_params"))
+
+    with open(os.path.join(extracted_path, "damage_tables.json"), "w", encoding="UTF-8") as json_file:
+        json.dump(tables, json_file, indent=4)
+
+    if arguments.publish:
+        data_path = os.path.join(root_path, "data")
+        with open(os.path.join(data_path, "damage_tables.js"), "w", encoding="UTF-8") as js_file:
+            js_file.write("const damageTables = ")
+            json.dump(tables, js_file)
+            js_file.write(";")
+        write_compressed_artifacts([os.path.join(data_path, "damage_tables.js")], data_path)
+
+    print("Wrote damage tables for " + str(len(tables)) + " weapons")
@@ -1,15 +1,27 @@
 import argparse
-import fnmatch
+import collections
+import glob
 import json
+import mmap
+import multiprocessing
 import os
 import subprocess
 
 from xml.etree import ElementTree
 
-from xml_reader import read_xml_file, read_xml_tree
+from changelog import RecordHashWriter, hashes_path
+from conversion_cache import ConversionCache, hash_code_version
+from forge import ForgeRecordIndex, find_forge_entries, load_record_offsets, read_forge_records, stream_forge_entries
+from json_writer import JsonObjectWriter
+from localization import LocalizationTable, is_placeholder, localization_path, publish_localization_bundles, read_used_keys, write_used_keys
+from pattern_matcher import PatternMatcher
+from profiler import profiler
+from publish import LoadoutRowWriter, LoadoutTables, PortIndexWriter, VehicleBlockWriter, publish_shards, read_converted_file, write_binary_data_files, write_compressed_artifacts
+from store import ConvertedStore
+from xml_reader import read_xml_file, read_xml_tree, index_xml_ids, unindex_xml_ids, record_file_dependencies, xml_file_exists, xml_file_cache_info
 from vehicle import make_vehicle, make_loadout
 from item import make_item
-from ammo_params import make_ammo_params
+from ammo_params import make_ammo_params, make_weapon_metrics
 
 
 source_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -26,32 +38,45 @@ def read_lines_file(path):
     return patterns
 
 
-def read_localization_file(path):
-    localization = {}
-    with open(path, "r", encoding="UTF-8", errors="replace") as ini_file:
-        for line in ini_file:
-            split = line.strip().split("=", 1)
-            key = "@" + split[0]
-            localization[key] = split[1]
-
-    return localization
-
-
 def write_json_file(path, content):
     with open(path, "w", encoding="UTF-8") as json_file:
         json.dump(content, json_file, indent=4)
 
 
-def publish_data_file(path, variable_name):
-    with open(path, "r", encoding="UTF-8") as json_file:
-        content = json.load(json_file)
+def open_publish_writers(flat_loadouts=False):
+    data_path = os.path.join(source_path, "data")
+    loadout_tables = LoadoutTables(os.path.join(data_path, "loadouts.js"))
+
+    writers = {}
+    for family, variable in _publish_variables.items():
+        writers[family] = JsonObjectWriter(os.path.join(data_path, family + ".js"), "const " + variable + " = ", ";")
+
+    writers["vehicles"] = LoadoutRowWriter(VehicleBlockWriter(writers["vehicles"], os.path.join(data_path, "vehicle_blocks.js")),
+        loadout_tables, "vehicles", flat_loadouts)
+    writers["items"] = LoadoutRowWriter(PortIndexWriter(writers["items"], os.path.join(data_path, "port_index.js")),
+        loadout_tables, "items", flat_loadouts)
+    return writers
+
+
+def publish_data_files(extracted_path, flat_loadouts=False):
+    writers = open_publish_writers(flat_loadouts)
+    try:
+        for family, writer in writers.items():
+            with open(os.path.join(extracted_path, family + ".json"), "r", encoding="UTF-8") as json_file:
+                content = json.load(json_file)
+
+            for key, value in content.items():
+                writer.write(key, value)
 
-    publish_path = os.path.join(source_path, "data", os.path.basename(path).replace(".json", ".js"))
+            # Only hold one converted file at a time.
+            content = None
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
 
-    with open(publish_path, "w", encoding="UTF-8") as js_file:
-        js_file.write("const " + variable_name + " = ")
-        json.dump(content, js_file)
-        js_file.write(";")
+    for writer in writers.values():
+        writer.close()
 
 
 def localize_key(container, container_key, localization):
@@ -59,33 +84,26 @@ def localize_key(container, container_key, localization):
     if localization_key:
         localized = localization.get(localization_key, None)
 
-        if localized and localized.startswith("<="):
+        if localized and is_placeholder(localized):
             localized = None
 
+        # The key stays next to the localized string, so clients can swap in the string from another language's
+        # bundle.
         container[container_key] = localized
+        container[container_key + "Key"] = localization_key
 
 
-def find_forge_entries(game_xml_root, paths, type):
-    for child in game_xml_root:
-        if child.tag.startswith(type) and any(child.attrib["__path"].startswith(x) for x in paths):
-            yield child
+vehicle_paths = ["libs/foundry/records/entities/spaceships", "libs/foundry/records/entities/groundvehicles"]
+item_paths = [
+    "libs/foundry/records/entities/scitem/doors",
+    "libs/foundry/records/entities/scitem/ships",
+    "libs/foundry/records/entities/scitem/vehicles",
+    "libs/foundry/records/entities/scitem/weaponregenpools"]
+ammo_param_paths = ["libs/foundry/records/ammoparams/vehicle"]
 
 
-def modify_vehicle(implementation, modification_name, definition_path):
-    def find_element(element, id):
-        children = []
-        if isinstance(element, dict):
-            if element.get("@id") == id:
-                return element
-
-            children = element.values()
-        elif isinstance(element, list):
-            children = element
-
-        for entry in children:
-            result = find_element(entry, id)
-            if result:
-                return result
+def modify_vehicle(implementation, modification_name, definition_path, extracted_path):
+    ids = index_xml_ids(implementation)
 
     available = implementation.single("modifications")["modification"]
     modification = next(x for x in available if x["@name"] == modification_name)
@@ -93,7 +111,7 @@ def modify_vehicle(implementation, modification_name, definition_path):
     if modification.get("elems"):
         elements = modification.single("elems").get("elem")
         for entry in elements:
-            element = find_element(implementation, entry["@idref"])
+            element = ids.get(entry["@idref"])
             if element:
                 element["@" + entry["@name"]] = entry["@value"]
             else:
@@ -106,117 +124,551 @@ def modify_vehicle(implementation, modification_name, definition_path):
             for entry in value:
                 id = entry.get("@id")
                 if id:
-                    element = find_element(implementation, id)
+                    element = ids.get(id)
                     if element:
+                        unindex_xml_ids(element, ids)
                         element.clear()
                         element.update(entry)
+                        index_xml_ids(element, ids)
                     else:
                         print("    Warning: Unable to modify element ID " + id)
 
 
-def convert_vehicles(game_xml_root, extracted_path, localization):
-    hidden_patterns = read_lines_file(os.path.join(source_path, "scripts", "hidden_vehicles.txt"))
-    vehicle_paths = ["libs/foundry/records/entities/spaceships", "libs/foundry/records/entities/groundvehicles"]
+def convert_vehicle(element, extracted_path):
+    identifier = element.tag.split(".", 1)[-1]
 
-    vehicles = {}
+    print("Converting vehicle and default loadout for " + identifier)
 
-    for element in find_forge_entries(game_xml_root, vehicle_paths, "EntityClassDefinition"):
-        identifier = element.tag.split(".", 1)[-1]
-        if any(fnmatch.fnmatchcase(identifier, x) for x in hidden_patterns):
-            continue
+    entity = read_xml_tree(element)
+    definition_path = entity.single("components").single("vehiclecomponentparams")["@vehicledefinition"]
+    modification_name = entity.single("components").single("vehiclecomponentparams")["@modification"]
 
-        print("Converting vehicle and default loadout for " + identifier)
+    definition_path = os.path.join(extracted_path, "Data", definition_path)
+    if not xml_file_exists(definition_path):
+        print("    Warning: Unable to find definition file")
+        return None
 
-        entity = read_xml_tree(element)
-        definition_path = entity.single("components").single("vehiclecomponentparams")["@vehicledefinition"]
-        modification_name = entity.single("components").single("vehiclecomponentparams")["@modification"]
+    definition = read_xml_file(definition_path)
 
-        definition_path = os.path.join(extracted_path, "Data", definition_path)
-        if not os.path.exists(definition_path):
-            print("    Warning: Unable to find definition file")
-            continue
+    if modification_name:
+        with profiler.phase("modify_vehicle"):
+            modify_vehicle(definition, modification_name, definition_path, extracted_path)
 
-        definition = read_xml_file(definition_path)
-
-        if modification_name:
-            modify_vehicle(definition, modification_name, definition_path)
-        
+    with profiler.phase("make_vehicle"):
         converted = make_vehicle(definition)
-        if converted:
-            converted["name"] = identifier
-            if modification_name:
-                converted["modificationName"] = modification_name
+    if converted:
+        converted["name"] = identifier
+        if modification_name:
+            converted["modificationName"] = modification_name
 
-            loadout_component = entity.single("components").single("sentitycomponentdefaultloadoutparams")
+        loadout_component = entity.single("components").single("sentitycomponentdefaultloadoutparams")
+        with profiler.phase("make_loadout"):
             converted["defaultItems"] = make_loadout(loadout_component, extracted_path)
 
-            converted["displayName"] = entity.single("components").single("vehiclecomponentparams")["@vehiclename"]
-            localize_key(converted, "displayName", localization)
+        converted["displayName"] = entity.single("components").single("vehiclecomponentparams")["@vehiclename"]
 
-            vehicles[identifier] = converted
+    return converted
 
-    write_json_file(os.path.join(extracted_path, "vehicles.json"), vehicles)
 
+def convert_item(element, extracted_path):
+    identifier = element.tag.split(".", 1)[-1]
 
-def convert_items(game_xml_root, extracted_path, localization):
-    hidden_patterns = read_lines_file(os.path.join(source_path, "scripts", "hidden_items.txt"))
-    item_paths = [
-        "libs/foundry/records/entities/scitem/doors",
-        "libs/foundry/records/entities/scitem/ships",
-        "libs/foundry/records/entities/scitem/vehicles",
-        "libs/foundry/records/entities/scitem/weaponregenpools"]
+    print("Converting item for " + identifier)
 
-    items = {}
+    entity = read_xml_tree(element)
+    with profiler.phase("make_item"):
+        converted = make_item(entity)
+    if converted:
+        converted["name"] = identifier
 
-    for element in find_forge_entries(game_xml_root, item_paths, "EntityClassDefinition"):
-        identifier = element.tag.split(".", 1)[-1]
-        if any(fnmatch.fnmatchcase(identifier, x) for x in hidden_patterns):
-            continue
+        loadout_component = entity.single("components").single("sentitycomponentdefaultloadoutparams")
+        if loadout_component:
+            with profiler.phase("make_loadout"):
+                converted["defaultItems"] = make_loadout(loadout_component, extracted_path)
 
-        print("Converting item for " + identifier)
+    return converted
 
-        entity = read_xml_tree(element)
-        converted = make_item(entity)
-        if converted:
-            converted["name"] = identifier
-            localize_key(converted, "displayName", localization)
 
-            loadout_component = entity.single("components").single("sentitycomponentdefaultloadoutparams")
-            if loadout_component:
-                converted["defaultItems"] = make_loadout(loadout_component, extracted_path)
+def convert_ammo_param(element):
+    identifier = element.tag.split(".", 1)[-1]
 
-            items[identifier] = converted
+    print("Converting ammo params for " + identifier)
 
-    write_json_file(os.path.join(extracted_path, "items.json"), items)
+    entity = read_xml_tree(element)
+    with profiler.phase("make_ammo_params"):
+        converted = make_ammo_params(entity)
+    if converted:
+        converted["name"] = identifier
 
+    return converted
 
-def convert_ammo_params(game_xml_root, extracted_path):
-    ammo_param_paths = ["libs/foundry/records/ammoparams/vehicle"]
 
-    ammo_params = {}
+def make_converters(extracted_path):
+    return {
+        "vehicles": lambda x: convert_vehicle(x, extracted_path),
+        "items": lambda x: convert_item(x, extracted_path),
+        "ammo_params": convert_ammo_param
+    }
+
+
+_output_keys = {
+    "vehicles": "name",
+    "items": "name",
+    "ammo_params": "reference"
+}
+
+_publish_variables = {
+    "vehicles": "allVehicles",
+    "items": "allItems",
+    "ammo_params": "allAmmoParams"
+}
+
+_hidden_pattern_files = {
+    "vehicles": "hidden_vehicles.txt",
+    "items": "hidden_items.txt"
+}
+
+_localized_keys = {
+    "vehicles": ["displayName"],
+    "items": ["displayName"],
+    "ammo_params": []
+}
+
+# Items held back waiting for their ammo params during conversion.
+_max_deferred_items = 1000
+
+_worker_converters = None
 
-    for element in find_forge_entries(game_xml_root, ammo_param_paths, "AmmoParams"):
-        identifier = element.tag.split(".", 1)[-1]
 
-        print("Converting ammo params for " + identifier)
+def _convert_with_dependencies(converters, family, element):
+    with record_file_dependencies() as dependencies, profiler.record(family, element.tag.split(".", 1)[-1]):
+        converted = converters[family](element)
+    return converted, dependencies
+
+
+def _initialize_worker(profile, *converter_arguments):
+    global _worker_converters
+    _worker_converters = make_converters(*converter_arguments)
+
+    # Forked workers start with a copy of the parent's profile, which the parent already counts.
+    profiler.reset()
+    if profile:
+        profiler.enable()
+
 
-        entity = read_xml_tree(element)
-        converted = make_ammo_params(entity)
+def _convert_in_worker(task):
+    family, record = task
+    converted, dependencies = _convert_with_dependencies(_worker_converters, family, ElementTree.fromstring(record))
+
+    file_cache_info = xml_file_cache_info()
+    worker_stats = {
+        "pid": os.getpid(),
+        "fileCacheHits": file_cache_info.hits,
+        "fileCacheMisses": file_cache_info.misses,
+        "profile": profiler.take_snapshot()
+    }
+
+    return converted, dependencies, worker_stats
+
+
+def _convert_chunk_in_worker(task):
+    game_xml_path, records = task
+
+    results = []
+    with open(game_xml_path, "rb") as game_xml_file, mmap.mmap(game_xml_file.fileno(), 0, access=mmap.ACCESS_READ) as game_xml:
+        for start, end, families in records:
+            with profiler.phase("parse Game.xml"):
+                element = ElementTree.fromstring(game_xml[start:end])
+            for family in families:
+                converted, _ = _convert_with_dependencies(_worker_converters, family, element)
+                results.append((family, converted))
+
+    file_cache_info = xml_file_cache_info()
+    worker_stats = {
+        "pid": os.getpid(),
+        "fileCacheHits": file_cache_info.hits,
+        "fileCacheMisses": file_cache_info.misses,
+        "profile": profiler.take_snapshot()
+    }
+
+    return results, worker_stats
+
+
+def _split_chunks(records, chunk_count):
+    # Consecutive records are grouped into chunks of roughly equal size in bytes, keeping document order.
+    total = sum(x[1] - x[0] for x in records)
+    target = max(1, total // max(1, chunk_count))
+
+    chunks = []
+    chunk = []
+    size = 0
+    for record in records:
+        chunk.append(record)
+        size += record[1] - record[0]
+        if size >= target:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _timed_records(records):
+    iterator = iter(records)
+    while True:
+        with profiler.phase("parse Game.xml"):
+            element = next(iterator, None)
+        if element is None:
+            return
+        yield element
+
+
+def make_hidden_matchers():
+    hidden_matchers = {}
+    for family, file_name in _hidden_pattern_files.items():
+        hidden_matchers[family] = PatternMatcher(read_lines_file(os.path.join(source_path, "scripts", file_name)))
+    return hidden_matchers
+
+
+def make_record_index():
+    index = ForgeRecordIndex()
+    index.register("EntityClassDefinition", vehicle_paths, "vehicles")
+    index.register("EntityClassDefinition", item_paths, "items")
+    index.register("AmmoParams", ammo_param_paths, "ammo_params")
+    return index
+
+
+def add_weapon_metrics(item, ammo_params_by_reference):
+    item.pop("weaponMetrics", None)
+    ammo_params = ammo_params_by_reference.get(item.get("ammoParamsReference"))
+    if ammo_params:
+        metrics = make_weapon_metrics(item, ammo_params)
+        if metrics:
+            item["weaponMetrics"] = metrics
+
+
+# Options after the localization are keyword only, so adding another one can't shift the arguments of existing calls.
+def convert_game_xml(game_xml_path, extracted_path, localization, *, stream=False, jobs=1, cache=None, publish=False, pretty=False,
+        flat_loadouts=False, chunked=False, store=None):
+    converter_arguments = (extracted_path,)
+
+    hidden_matchers = make_hidden_matchers()
+    index = make_record_index()
+
+    # Chunked conversion has the workers parse their own parts of Game.xml.
+    if chunked:
+        records = None
+    elif stream:
+        records = _timed_records(stream_forge_entries(game_xml_path, index.matches))
+    else:
+        with profiler.phase("parse Game.xml"):
+            records = ElementTree.parse(game_xml_path).getroot()
+
+    hidden_records = {x: {} for x in hidden_matchers}
+
+    def visible_families(element, families):
+        result = []
+        for family in families:
+            if family in hidden_matchers:
+                identifier = element.tag.split(".", 1)[-1]
+                pattern = hidden_matchers[family].match(identifier)
+                if pattern:
+                    hidden_records[family][identifier] = pattern
+                    continue
+
+            result.append(family)
+        return result
+
+    def find_entries():
+        for element, families in find_forge_entries(records, index):
+            for family in visible_families(element, families):
+                yield family, element
+
+    def find_chunks():
+        # Records are picked from the index of their byte ranges, so the workers never parse unwanted records.
+        offsets = load_record_offsets(game_xml_path, os.path.join(extracted_path, "record_index.json"))
+
+        wanted = []
+        for tag, path, _, start, end in offsets:
+            header = ElementTree.Element(tag, {"__path": path or ""})
+            families = visible_families(header, index.find(header))
+            if families:
+                wanted.append((start, end, families))
+
+        # More chunks than workers evens out chunks that happen to be slow to convert.
+        return [(game_xml_path, x) for x in _split_chunks(wanted, jobs * 4)]
+
+    # Every entry is queued in document order, but only cache misses are handed to the converters.
+    pending = collections.deque()
+
+    def find_misses():
+        for family, element in find_entries():
+            key = None
+            cached, hit = None, False
+            if cache:
+                key = cache.make_key(family, element)
+                cached, hit = cache.get(key)
+
+            pending.append((family, key, cached, hit))
+            if not hit:
+                yield family, element
+
+    # Records are written out as they're merged rather than collected first. Publishing at the same time avoids
+    # reading the converted files back in afterwards. Since nothing written can be taken back, the first record
+    # converted with a given key is the one every writer keeps, and later ones are skipped.
+    writers = {}
+    for family in _output_keys:
+        writers[family] = [
+            JsonObjectWriter(os.path.join(extracted_path, family + ".json"), indent=4 if pretty else None),
+            RecordHashWriter(hashes_path(extracted_path, family))
+        ]
+    if publish:
+        for family, writer in open_publish_writers(flat_loadouts).items():
+            writers[family].append(writer)
+
+    def write(family, converted):
+        with profiler.phase("write JSON"):
+            for writer in writers[family]:
+                writer.write(converted[_output_keys[family]], converted)
+
+        if store:
+            with profiler.phase("write SQLite"):
+                store.add(family, converted)
+
+    # Weapons get metrics derived from their ammo params, which may come later in the document. Items are held back
+    # in order from the first one with unconverted ammo params until those turn up. So memory stays bounded when they
+    # never do, or only come after most of the items, at most _max_deferred_items are held back. Items written
+    # before their ammo params were converted don't get metrics.
+    ammo_params_by_reference = {}
+    deferred_items = collections.deque()
+
+    def ammo_params_pending(item):
+        reference = item.get("ammoParamsReference")
+        return reference and reference not in ammo_params_by_reference and item.get("weaponAction")
+
+    def write_deferred_items(flush=False):
+        while deferred_items and (flush or len(deferred_items) > _max_deferred_items or not ammo_params_pending(deferred_items[0])):
+            item = deferred_items.popleft()
+            if ammo_params_pending(item):
+                print("    Warning: Writing " + item["name"] + " without weapon metrics, ammo params " + item["ammoParamsReference"] +
+                    " weren't converted before it")
+            add_weapon_metrics(item, ammo_params_by_reference)
+            write("items", item)
+
+    def add(family, converted):
         if converted:
-            converted["name"] = identifier
-            ammo_params[converted["reference"]] = converted
-
-    write_json_file(os.path.join(extracted_path, "ammo_params.json"), ammo_params)
+            for localized_key in _localized_keys[family]:
+                localize_key(converted, localized_key, localization)
+
+            if family == "items":
+                deferred_items.append(converted)
+                write_deferred_items()
+                return
+
+            write(family, converted)
+            if family == "ammo_params":
+                ammo_params_by_reference.setdefault(converted["reference"], converted)
+                write_deferred_items()
+
+    def merge(converted_misses):
+        for converted, dependencies in converted_misses:
+            while pending[0][3]:
+                family, _, cached, _ = pending.popleft()
+                add(family, cached)
+
+            family, key, _, _ = pending.popleft()
+            if cache:
+                cache.put(key, converted, dependencies)
+            add(family, converted)
+
+        while pending:
+            family, _, cached, _ = pending.popleft()
+            add(family, cached)
+
+    def convert_records():
+        if jobs > 1 or chunked:
+            # Each worker reports its running XML file cache counts, so keep the latest from each one. Profiles are
+            # reported as the difference since the previous task and can be merged directly.
+            worker_file_caches = {}
+
+            def note_worker_stats(worker_stats):
+                worker_file_caches[worker_stats["pid"]] = (worker_stats["fileCacheHits"], worker_stats["fileCacheMisses"])
+                profiler.merge_snapshot(worker_stats["profile"])
+
+            def collect_worker_stats(results):
+                for converted, dependencies, worker_stats in results:
+                    note_worker_stats(worker_stats)
+                    yield converted, dependencies
+
+            # Workers get the shared inputs once when they start; tasks only carry the serialized record.
+            initargs = (profiler.enabled,) + converter_arguments
+            with multiprocessing.Pool(jobs, initializer=_initialize_worker, initargs=initargs) as pool:
+                if chunked:
+                    # Chunks come back in document order, which keeps the output the same as converting serially.
+                    for results, worker_stats in pool.imap(_convert_chunk_in_worker, find_chunks()):
+                        note_worker_stats(worker_stats)
+                        for family, converted in results:
+                            add(family, converted)
+                else:
+                    tasks = ((family, ElementTree.tostring(element)) for family, element in find_misses())
+                    merge(collect_worker_stats(pool.imap(_convert_in_worker, tasks, chunksize=8)))
+
+            return sum(x[0] for x in worker_file_caches.values()), sum(x[1] for x in worker_file_caches.values())
+        else:
+            converters = make_converters(*converter_arguments)
+            merge(_convert_with_dependencies(converters, family, element) for family, element in find_misses())
+
+            file_cache_info = xml_file_cache_info()
+            return file_cache_info.hits, file_cache_info.misses
+
+    # Leave previously converted or published files alone if conversion fails part way through.
+    try:
+        file_cache_hits, file_cache_misses = convert_records()
+        write_deferred_items(flush=True)
+    except BaseException:
+        for family_writers in writers.values():
+            for writer in family_writers:
+                writer.abort()
+        if store:
+            store.abort()
+        raise
+
+    for family_writers in writers.values():
+        for writer in family_writers:
+            writer.close()
+    if store:
+        store.close()
+
+    write_json_file(os.path.join(extracted_path, "hidden_records.json"), hidden_records)
+    for family, matcher in hidden_matchers.items():
+        for pattern in matcher.unused_patterns():
+            print("Warning: Pattern " + pattern + " in " + _hidden_pattern_files[family] + " didn't hide any records")
+
+    print("XML file cache: " + str(file_cache_hits) + " hits, " + str(file_cache_misses) + " misses")
+
+    if cache:
+        print("Conversion cache: " + str(cache.hits) + " hits, " + str(cache.misses) + " misses")
+        cache.save()
+
+
+def reconvert_records(game_xml_path, extracted_path, localization, pattern, *, pretty=False):
+    # Seeks straight to the matching records using an index of their byte ranges in Game.xml, then patches them into
+    # the previously converted files. Records that weren't converted before are added at the end.
+    offsets = load_record_offsets(game_xml_path, os.path.join(extracted_path, "record_index.json"))
+    matcher = PatternMatcher([pattern])
+    selected = [x for x in offsets if matcher.match(x[0].split(".", 1)[-1])]
+
+    hidden_matchers = make_hidden_matchers()
+    index = make_record_index()
+    converters = make_converters(extracted_path)
+    converted_files = {family: read_converted_file(extracted_path, family) for family in _output_keys}
+
+    hidden_records_path = os.path.join(extracted_path, "hidden_records.json")
+    with open(hidden_records_path, "r", encoding="UTF-8") as hidden_records_file:
+        hidden_records = json.load(hidden_records_file)
+
+    changed = {family: set() for family in _output_keys}
+    reconverted = {family: set() for family in _output_keys}
+    removed_count = 0
+    for element, families in find_forge_entries(read_forge_records(game_xml_path, selected), index):
+        for family in families:
+            identifier = element.tag.split(".", 1)[-1]
+
+            # The key the record was converted under before, so it can be dropped if it's now hidden or doesn't
+            # convert any more.
+            key = element.get("__ref") if _output_keys[family] == "reference" else identifier
+
+            if family in hidden_matchers:
+                hidden_pattern = hidden_matchers[family].match(identifier)
+                if hidden_pattern:
+                    print("Skipping hidden record " + identifier)
+                    hidden_records[family][identifier] = hidden_pattern
+                    if converted_files[family].pop(key, None) is not None:
+                        changed[family].add(key)
+                        removed_count += 1
+                    continue
+                hidden_records[family].pop(identifier, None)
+
+            converted = converters[family](element)
+            if converted:
+                for localized_key in _localized_keys[family]:
+                    localize_key(converted, localized_key, localization)
+
+                # Like converting everything, the first record with a key wins.
+                key = converted[_output_keys[family]]
+                if key in reconverted[family]:
+                    print("    Warning: Skipping duplicate key " + key + " in " + family + ".json")
+                    continue
+
+                converted_files[family][key] = converted
+                changed[family].add(key)
+                reconverted[family].add(key)
+            elif key not in reconverted[family] and converted_files[family].pop(key, None) is not None:
+                changed[family].add(key)
+                removed_count += 1
+
+    reconverted_count = sum(len(x) for x in changed.values()) - removed_count
+
+    # Weapons need their metrics worked out again when either they or their ammo params changed.
+    for item_name, item in converted_files["items"].items():
+        if item_name in changed["items"] or item.get("ammoParamsReference") in changed["ammo_params"]:
+            add_weapon_metrics(item, converted_files["ammo_params"])
+            changed["items"].add(item_name)
+
+    for family, keys in changed.items():
+        if keys:
+            hash_writer = RecordHashWriter(hashes_path(extracted_path, family))
+            with JsonObjectWriter(os.path.join(extracted_path, family + ".json"), indent=4 if pretty else None) as writer:
+                for key, value in converted_files[family].items():
+                    writer.write(key, value)
+                    hash_writer.write(key, value)
+            hash_writer.close()
+
+    write_json_file(hidden_records_path, hidden_records)
+
+    print("Reconverted " + str(reconverted_count) + " records matching " + pattern + ", removed " + str(removed_count))
+    if os.path.exists(os.path.join(extracted_path, "converted.sqlite")):
+        print("Warning: converted.sqlite wasn't updated, convert again with --sqlite to refresh it")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--extract", "-e", metavar="DATA_P4K_PATH")
     parser.add_argument("--convert", "-c", action="store_true")
+    parser.add_argument("--only", metavar="PATTERN")
+    parser.add_argument("--stream", "-s", action="store_true")
+    parser.add_argument("--jobs", "-j", type=int, default=1)
+    parser.add_argument("--chunked", action="store_true")
+    parser.add_argument("--cache", metavar="CACHE_PATH")
+    parser.add_argument("--profile", nargs="?", type=int, const=20, metavar="TOP_COUNT")
     parser.add_argument("--publish", "-p", action="store_true")
+    parser.add_argument("--pretty", action="store_true")
+    parser.add_argument("--sqlite", action="store_true")
+    parser.add_argument("--shards", action="store_true")
+    parser.add_argument("--binary", nargs="*", metavar="NAME")
+    parser.add_argument("--flat-loadouts", action="store_true")
     parser.add_argument("--version", "-v", required=True)
     arguments = parser.parse_args()
 
+    if arguments.only and arguments.convert:
+        parser.error("--only can't be combined with --convert")
+
+    # Data files are named without their extension, and naming none encodes all of them.
+    data_names = list(_publish_variables) + ["vehicle_blocks", "loadouts", "port_index"]
+    binary_names = []
+    if arguments.binary is not None:
+        if not arguments.publish:
+            parser.error("--binary can only be combined with --publish")
+        binary_names = arguments.binary or data_names
+        for name in binary_names:
+            if name not in data_names:
+                parser.error("--binary names have to be one of " + ", ".join(data_names))
+
+    # Cache keys are made from records parsed in the main process, which chunked conversion never does.
+    if arguments.chunked and arguments.cache:
+        parser.error("--chunked can't be combined with --cache")
+
     # TODO Retrieve this from a config file.
     unp4k_path = os.path.join(source_path, "..", "unp4k-suite-v3.13.21")
 
@@ -228,15 +680,56 @@ if __name__ == "__main__":
         subprocess.check_call([os.path.join(unp4k_path, "unforge.exe"), "."], cwd=extracted_path)
 
     if arguments.convert:
-        localization = read_localization_file(os.path.join(extracted_path, "Data", "Localization", "english", "global.ini"))
-
-        game_xml_root = ElementTree.parse(os.path.join(extracted_path, "Data", "Game.xml")).getroot()
-        convert_vehicles(game_xml_root, extracted_path, localization)
-        convert_items(game_xml_root, extracted_path, localization)
-        convert_ammo_params(game_xml_root, extracted_path)
+        if arguments.profile:
+            profiler.enable()
+
+        with profiler.phase("read localization"):
+            localization = LocalizationTable(localization_path(extracted_path))
+
+        cache = None
+        if arguments.cache:
+            code_paths = glob.glob(os.path.join(source_path, "scripts", "*.py"))
+            cache = ConversionCache(arguments.cache, extracted_path, hash_code_version(code_paths))
+
+        store = None
+        if arguments.sqlite:
+            store = ConvertedStore(os.path.join(extracted_path, "converted.sqlite"))
+
+        game_xml_path = os.path.join(extracted_path, "Data", "Game.xml")
+        convert_game_xml(game_xml_path, extracted_path, localization, stream=arguments.stream, jobs=arguments.jobs, cache=cache,
+            publish=arguments.publish, pretty=arguments.pretty, flat_loadouts=arguments.flat_loadouts, chunked=arguments.chunked, store=store)
+        write_used_keys(extracted_path, localization.used_keys)
+
+        if arguments.profile:
+            profiler.write_report(os.path.join(extracted_path, "profile.json"), arguments.profile)
+    elif arguments.only:
+        localization = LocalizationTable(localization_path(extracted_path))
+        game_xml_path = os.path.join(extracted_path, "Data", "Game.xml")
+        reconvert_records(game_xml_path, extracted_path, localization, arguments.only, pretty=arguments.pretty)
+        write_used_keys(extracted_path, localization.used_keys.union(read_used_keys(extracted_path)))
+
+    # Converting already publishes as it goes, so only previously converted data needs to be published here.
+    if arguments.publish and not arguments.convert:
+        publish_data_files(extracted_path, arguments.flat_loadouts)
 
-    # TODO Don't be sad and make these constants.
     if arguments.publish:
-        publish_data_file(os.path.join(extracted_path, "vehicles.json"), "allVehicles")
-        publish_data_file(os.path.join(extracted_path, "items.json"), "allItems")
-        publish_data_file(os.path.join(extracted_path, "ammo_params.json"), "allAmmoParams")
\ No newline at end of file
+        # Bundles only hold the keys the converted records used, so other languages don't need converting again.
+        print("Writing localization bundles")
+        languages = publish_localization_bundles(extracted_path, os.path.join(source_path, "data", "localization"))
+
+        data_path = os.path.join(source_path, "data")
+        published_paths = [os.path.join(data_path, x + ".js") for x in data_names]
+        published_paths += [os.path.join(data_path, "localization", x + ".js") for x in languages]
+
+        # The plain data files are still written, so the report compares both formats of the encoded ones.
+        if binary_names:
+            print("Writing binary data files")
+        published_paths += write_binary_data_files(data_path, binary_names)
+
+        print("Writing compressed artifacts")
+        report = write_compressed_artifacts(published_paths, data_path)
+
+        if arguments.shards:
+            report.extend(publish_shards(extracted_path, os.path.join(data_path, "shards")))
+
+        write_json_file(os.path.join(extracted_path, "publish_report.json"), report)
@@ -0,0 +1,153 @@
+import bisect
+import json
+import os
+
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+
+class ForgeRecordIndex:
+    def __init__(self):
+        self._handlers = []
+        self._prefixes = {}
+        self._lookups = {}
+
+    def register(self, type, paths, handler):
+        order = len(self._handlers)
+        self._handlers.append(handler)
+
+        prefixes = self._prefixes.setdefault(type, {})
+        for path in paths:
+            prefixes.setdefault(path, []).append(order)
+
+        keys = sorted(prefixes)
+
+        # Each prefix points at the closest shorter prefix that it starts with, if any.
+        parents = []
+        for i, key in enumerate(keys):
+            parent = i - 1
+            while parent >= 0 and not key.startswith(keys[parent]):
+                parent = parents[parent]
+            parents.append(parent)
+
+        self._lookups[type] = (keys, parents)
+
+    def find(self, element):
+        type = element.tag.split(".", 1)[0]
+        if type not in self._lookups:
+            return []
+
+        keys, parents = self._lookups[type]
+        prefixes = self._prefixes[type]
+        path = element.attrib.get("__path", "")
+
+        # Any registered prefix of the path sorts at or below it, and is also a prefix of the closest key
+        # at or below it, so only that key's parent chain needs to be checked.
+        orders = []
+        i = bisect.bisect_right(keys, path) - 1
+        while i >= 0:
+            if path.startswith(keys[i]):
+                orders.extend(prefixes[keys[i]])
+            i = parents[i]
+
+        return [self._handlers[x] for x in sorted(set(orders))]
+
+    def matches(self, element):
+        return len(self.find(element)) > 0
+
+
+def find_forge_entries(records, index):
+    for child in records:
+        handlers = index.find(child)
+        if handlers:
+            yield child, handlers
+
+
+def stream_forge_entries(game_xml_path, is_wanted):
+    # Only the record currently being parsed is kept in memory; each one is cleared as soon as it ends.
+    depth = 0
+    wanted = False
+    context = ElementTree.iterparse(game_xml_path, events=("start", "end"))
+    _, root = next(context)
+    for event, element in context:
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                wanted = is_wanted(element)
+        else:
+            depth -= 1
+            if depth == 0:
+                if wanted:
+                    yield element
+                root.clear()
+
+
+def build_record_offsets(game_xml_path):
+    # ElementTree doesn't report where elements are in the file, so use expat directly. A record ends where whatever
+    # follows its end tag starts, which also covers records written as empty elements.
+    offsets = []
+    parser = expat.ParserCreate()
+    depth = 0
+    ending = None
+
+    def finish_record(*_):
+        nonlocal ending
+        if ending:
+            ending.append(parser.CurrentByteIndex)
+            offsets.append(ending)
+            ending = None
+
+    def start_element(tag, attributes):
+        nonlocal depth
+        finish_record()
+        depth += 1
+        if depth == 2:
+            offsets.append([tag, attributes.get("__path"), attributes.get("__ref"), parser.CurrentByteIndex])
+
+    def end_element(tag):
+        nonlocal depth, ending
+        finish_record()
+        depth -= 1
+        if depth == 1:
+            ending = offsets.pop()
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = finish_record
+    parser.CommentHandler = finish_record
+
+    with open(game_xml_path, "rb") as game_xml_file:
+        parser.ParseFile(game_xml_file)
+
+    return offsets
+
+
+def load_record_offsets(game_xml_path, index_path):
+    # The index is only rebuilt when Game.xml changed since it was written.
+    stat = os.stat(game_xml_path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+
+    # An index that can't be read, like one left over from an older version, is rebuilt too.
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "r", encoding="UTF-8") as index_file:
+                index = json.load(index_file)
+            if index["signature"] == signature:
+                return index["records"]
+        except (ValueError, KeyError, TypeError):
+            print("    Warning: Unable to read record index " + index_path)
+
+    print("Building record index for " + game_xml_path)
+    records = build_record_offsets(game_xml_path)
+    with open(index_path + ".tmp", "w", encoding="UTF-8") as index_file:
+        json.dump({"signature": signature, "records": records}, index_file)
+    os.replace(index_path + ".tmp", index_path)
+
+    return records
+
+
+def read_forge_records(game_xml_path, offsets):
+    with open(game_xml_path, "rb") as game_xml_file:
+        for _, _, _, start, end in offsets:
+            game_xml_file.seek(start)
+            yield ElementTree.fromstring(game_xml_file.read(end - start))
@@ -334,7 +334,7 @@ def make_item(item_element):
 
             port_container_element = components_element.single("sitemportcontainercomponentparams")
             if port_container_element:
-                for item_port_element in port_container_element.single("ports").get("sitemportdef", []):
+                for position, item_port_element in enumerate(port_container_element.single("ports").get("sitemportdef", [])):
                     types = []
                     for def_types_element in item_port_element.single("types").get("sitemportdeftypes", []):
                         port_type = def_types_element.get("@type")
@@ -353,7 +353,7 @@ def make_item(item_element):
                                 "type": port_type,
                                 "subtype": subtype})
 
-                    port = _make_item_port(item_port_element, None, types)
+                    port = _make_item_port(item_port_element, None, types, position)
                     baseline["ports"][port["name"]] = port
 
                 # TODO Doesn't handle containers with mixed types of ports.
@@ -0,0 +1,94 @@
+import json
+import os
+
+
+# Writes a JSON object one entry at a time, so callers never need to hold the whole object in memory. The result is
+# the same as dumping the equivalent dictionary with json.dump, optionally wrapped in a prefix and suffix. Output goes
+# to a temporary file that only replaces the target once the object is complete.
+class JsonObjectWriter:
+    def __init__(self, path, prefix="", suffix="", indent=None):
+        self.path = path
+        self.suffix = suffix
+        self.indent = indent
+
+        self._keys = set()
+        self._temporary_path = path + ".tmp"
+        self._file = open(self._temporary_path, "w", encoding="UTF-8")
+        self._file.write(prefix + "{")
+
+    def write(self, key, value):
+        if key in self._keys:
+            print("    Warning: Skipping duplicate key " + key + " in " + os.path.basename(self.path))
+            return
+
+        if self._keys:
+            self._file.write(",")
+
+        if self.indent is None:
+            if self._keys:
+                self._file.write(" ")
+            self._file.write(json.dumps(key) + ": " + json.dumps(value))
+        else:
+            padding = " " * self.indent
+            serialized = json.dumps(value, indent=self.indent).replace("\n", "\n" + padding)
+            self._file.write("\n" + padding + json.dumps(key) + ": " + serialized)
+
+        self._keys.add(key)
+
+    def close(self):
+        if self.indent is not None and self._keys:
+            self._file.write("\n")
+        self._file.write("}" + self.suffix)
+        self._file.close()
+        os.replace(self._temporary_path, self.path)
+
+    def abort(self):
+        self._file.close()
+        os.remove(self._temporary_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type:
+            self.abort()
+        else:
+            self.close()
+
+
+# Writes a JSON array one value at a time in the same way, returning each value's index.
+class JsonArrayWriter:
+    def __init__(self, path, prefix="", suffix=""):
+        self.path = path
+        self.suffix = suffix
+
+        self._count = 0
+        self._temporary_path = path + ".tmp"
+        self._file = open(self._temporary_path, "w", encoding="UTF-8")
+        self._file.write(prefix + "[")
+
+    def append(self, value):
+        if self._count:
+            self._file.write(", ")
+        self._file.write(json.dumps(value))
+
+        self._count += 1
+        return self._count - 1
+
+    def close(self):
+        self._file.write("]" + self.suffix)
+        self._file.close()
+        os.replace(self._temporary_path, self.path)
+
+    def abort(self):
+        self._file.close()
+        os.remove(self._temporary_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type:
+            self.abort()
+        else:
+            self.close()
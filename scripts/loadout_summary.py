@@ -0,0 +1,160 @@
+import argparse
+import csv
+import json
+import math
+import os
+
+import numpy
+
+from ammo_params import make_weapon_metrics
+from publish import read_converted_file
+
+
+# Resolves every vehicle's default loadout the same way VehicleLoadout in model.js does and flattens the result into
+# rows of (vehicle name, parent row, port name, item name), with the parent row -1 for items on the vehicle's own
+# ports. Rows are in the same depth first order the client walks its bindings.
+def flatten_loadouts(vehicles, items):
+    rows = []
+
+    def vehicle_default(vehicle, path):
+        container = vehicle["defaultItems"]
+        entry = None
+        for part in path:
+            entry = container.get(part)
+            if not entry:
+                return None
+            container = entry["children"]
+        return entry["itemName"]
+
+    def install(vehicle_name, vehicle, item_name, parent_row, path, from_vehicle):
+        item = items.get(item_name) if item_name else None
+        if not item:
+            return
+
+        row = len(rows)
+        rows.append((vehicle_name, parent_row, path[-1], item_name))
+
+        # Ports take their parent item's default first. Only items installed from the vehicle's own loadout fall back
+        # to it for ports their item leaves empty.
+        item_defaults = item.get("defaultItems", {})
+        for port_name in item["ports"]:
+            child_path = path + [port_name]
+            child_name = item_defaults.get(port_name, {}).get("itemName")
+            if child_name in items:
+                install(vehicle_name, vehicle, child_name, row, child_path, False)
+            elif from_vehicle:
+                install(vehicle_name, vehicle, vehicle_default(vehicle, child_path), row, child_path, True)
+
+    for vehicle_name, vehicle in vehicles.items():
+        for port in vehicle["ports"]:
+            install(vehicle_name, vehicle, vehicle_default(vehicle, [port["name"]]), -1, [port["name"]], True)
+
+    return rows
+
+
+_columns = [
+    "powerDraw",
+    "powerGenerated",
+    "thermalEnergyDraw",
+    "coolingRate",
+    "shieldCapacity",
+    "burstDps",
+    "sustainedDps",
+    "hydrogenFuelCapacity",
+    "quantumFuelCapacity",
+    "cargoCapacity"
+]
+
+
+def _item_contributions(item, ammo_params):
+    result = dict.fromkeys(_columns, 0.0)
+
+    power = item.get("power")
+    if power:
+        result["powerGenerated" if item["type"] == "PowerPlant" else "powerDraw"] = power["powerDraw"]
+
+    result["thermalEnergyDraw"] = item.get("heat", {}).get("thermalEnergyDraw", 0.0)
+
+    if item["type"] == "Cooler":
+        result["coolingRate"] = item["coolingRate"]
+    elif item["type"] == "Shield":
+        result["shieldCapacity"] = item["maxShieldHealth"]
+    elif item["type"] == "FuelTank":
+        result["hydrogenFuelCapacity"] = item["capacity"]
+    elif item["type"] == "QuantumFuelTank":
+        result["quantumFuelCapacity"] = item["capacity"]
+    elif item["type"] == "Cargo":
+        result["cargoCapacity"] = item["cargo"]
+    elif item["type"] == "WeaponGun":
+        metrics = item.get("weaponMetrics")
+        if not metrics and item.get("ammoParamsReference") in ammo_params:
+            metrics = make_weapon_metrics(item, ammo_params[item["ammoParamsReference"]])
+        if metrics:
+            result["burstDps"] = sum(metrics["burstDps"].values())
+            result["sustainedDps"] = sum(metrics["sustainedDps"].values())
+
+    return [result[x] for x in _columns]
+
+
+def summarize_loadouts(vehicles, items, ammo_params):
+    rows = flatten_loadouts(vehicles, items)
+
+    vehicle_names = list(vehicles)
+    vehicle_indices = {x: index for index, x in enumerate(vehicle_names)}
+    item_names = list(items)
+    item_indices = {x: index for index, x in enumerate(item_names)}
+
+    # Per item contributions are worked out once, then summed per vehicle over all installed rows in one go.
+    contributions = numpy.array([_item_contributions(items[x], ammo_params) for x in item_names], dtype=numpy.float64)
+    contributions = contributions.reshape(len(item_names), len(_columns))
+    quantum_fuel_requirements = numpy.array(
+        [items[x].get("quantumFuelRequirement", 0.0) if items[x]["type"] == "QuantumDrive" else numpy.nan for x in item_names],
+        dtype=numpy.float64)
+
+    row_vehicles = numpy.array([vehicle_indices[x[0]] for x in rows], dtype=numpy.intp)
+    row_items = numpy.array([item_indices[x[3]] for x in rows], dtype=numpy.intp)
+
+    totals = numpy.zeros((len(vehicle_names), len(_columns)))
+    numpy.add.at(totals, row_vehicles, contributions[row_items])
+
+    # Like the client, use the last quantum drive found when walking the loadout.
+    requirements = numpy.full(len(vehicle_names), numpy.nan)
+    drive_rows = ~numpy.isnan(quantum_fuel_requirements[row_items])
+    requirements[row_vehicles[drive_rows]] = quantum_fuel_requirements[row_items[drive_rows]]
+
+    fuel_per_gm = requirements * 1000
+    quantum_fuel = totals[:, _columns.index("quantumFuelCapacity")]
+    quantum_range = numpy.full(len(vehicle_names), numpy.nan)
+    numpy.divide(quantum_fuel, fuel_per_gm, out=quantum_range, where=fuel_per_gm > 0)
+
+    summary = []
+    for index, name in enumerate(vehicle_names):
+        entry = {"name": name, "displayName": vehicles[name].get("displayName")}
+        entry.update(zip(_columns, totals[index].tolist()))
+        entry["quantumRangeGm"] = None if math.isnan(quantum_range[index]) else float(quantum_range[index])
+        summary.append(entry)
+
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--version", "-v", required=True)
+    arguments = parser.parse_args()
+
+    root_path = os.path.join(os.path.dirname(__file__), "..")
+    extracted_path = os.path.join(root_path, "extracted", arguments.version)
+    summary = summarize_loadouts(
+        read_converted_file(extracted_path, "vehicles"),
+        read_converted_file(extracted_path, "items"),
+        read_converted_file(extracted_path, "ammo_params"))
+
+    with open(os.path.join(extracted_path, "loadout_summary.json"), "w", encoding="UTF-8") as json_file:
+        json.dump(summary, json_file, indent=4)
+
+    with open(os.path.join(extracted_path, "loadout_summary.csv"), "w", encoding="UTF-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(summary[0]) if summary else ["name"])
+        writer.writeheader()
+        writer.writerows(summary)
+
+    print("Wrote loadout summary for " + str(len(summary)) + " vehicles")
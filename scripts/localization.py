@@ -0,0 +1,133 @@
+import argparse
+import array
+import bisect
+import glob
+import json
+import mmap
+import os
+import re
+import zlib
+
+
+# A line with a key, up to the = separating it from the value. Whitespace before the key is ignored, as is the byte
+# order mark at the start of the file.
+_key_line = re.compile(rb"^(?:\xef\xbb\xbf)?[^\S\n]*([^=\n]*)=", re.MULTILINE)
+
+
+# Looks up strings in a global.ini without reading it into a dict. The file is memory mapped and only the CRC of every
+# key and the offset of its line are kept, sorted by CRC, so the few thousand lookups conversion makes don't need
+# hundreds of thousands of strings. Keys that were found are remembered, so the same keys can be taken from the other
+# languages without converting again.
+class LocalizationTable:
+    def __init__(self, path):
+        self.path = path
+        self.used_keys = set()
+
+        with open(path, "rb") as ini_file:
+            self._data = mmap.mmap(ini_file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(ini_file.fileno()).st_size else b""
+
+        hashes = array.array("L")
+        offsets = array.array("Q")
+        for match in _key_line.finditer(self._data):
+            hashes.append(zlib.crc32(match.group(1)))
+            offsets.append(match.start())
+
+        # The sort is stable, so lines with the same CRC stay in file order and later duplicates can win like they
+        # would in a dict.
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._hashes = array.array("L", (hashes[x] for x in order))
+        self._offsets = array.array("Q", (offsets[x] for x in order))
+
+    def _read_line(self, offset):
+        match = _key_line.match(self._data, offset)
+        end = self._data.find(b"\n", match.end())
+        if end < 0:
+            end = len(self._data)
+
+        return match.group(1), self._data[match.end():end].rstrip()
+
+    def get(self, key, default=None):
+        # Keys are referred to with an @ in the records, but not in the file.
+        if not key.startswith("@"):
+            return default
+
+        name = key[1:].encode("UTF-8")
+        crc = zlib.crc32(name)
+        first = bisect.bisect_left(self._hashes, crc)
+        last = bisect.bisect_right(self._hashes, crc, first)
+        for index in reversed(range(first, last)):
+            line_key, value = self._read_line(self._offsets[index])
+            if line_key == name:
+                self.used_keys.add(key)
+                return value.decode("UTF-8", errors="replace")
+
+        return default
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+# Strings the game hasn't filled in yet are placeholders starting with <=.
+def is_placeholder(localized):
+    return localized.startswith("<=")
+
+
+def localization_path(extracted_path, language="english"):
+    return os.path.join(extracted_path, "Data", "Localization", language, "global.ini")
+
+
+def used_keys_path(extracted_path):
+    return os.path.join(extracted_path, "localization_keys.json")
+
+
+def read_used_keys(extracted_path):
+    path = used_keys_path(extracted_path)
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "r", encoding="UTF-8") as keys_file:
+        return json.load(keys_file)
+
+
+def write_used_keys(extracted_path, keys):
+    with open(used_keys_path(extracted_path), "w", encoding="UTF-8") as keys_file:
+        json.dump(sorted(keys), keys_file, indent=4)
+
+
+# Writes a bundle for every extracted language with only the keys conversion used, as a script setting
+# localizationBundle like the other published data. Converted records keep their keys next to the localized strings,
+# so clients can swap in another language without converting again.
+def publish_localization_bundles(extracted_path, output_path):
+    keys = read_used_keys(extracted_path)
+    os.makedirs(output_path, exist_ok=True)
+
+    languages = []
+    for path in sorted(glob.glob(localization_path(extracted_path, "*"))):
+        language = os.path.basename(os.path.dirname(path))
+        table = LocalizationTable(path)
+        bundle = {}
+        for key in keys:
+            value = table.get(key)
+            if value and not is_placeholder(value):
+                bundle[key] = value
+        table.close()
+
+        with open(os.path.join(output_path, language + ".js"), "w", encoding="UTF-8") as js_file:
+            js_file.write("const localizationBundle = ")
+            json.dump(bundle, js_file, ensure_ascii=False)
+            js_file.write(";")
+
+        print("    " + language + ": " + str(len(bundle)) + " of " + str(len(keys)) + " keys")
+        languages.append(language)
+
+    return languages
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--version", "-v", required=True)
+    arguments = parser.parse_args()
+
+    root_path = os.path.join(os.path.dirname(__file__), "..")
+    publish_localization_bundles(os.path.join(root_path, "extracted", arguments.version), os.path.join(root_path, "data", "localization"))
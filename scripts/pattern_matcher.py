@@ -0,0 +1,66 @@
+import fnmatch
+import re
+
+
+_wildcards = re.compile(r"[*?\[]")
+
+
+# Matches names against fnmatch style patterns without trying every pattern in turn. Plain names, "prefix*" and
+# "*suffix" patterns are dictionary lookups; anything else goes through one combined regex.
+class PatternMatcher:
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self.counts = [0] * len(patterns)
+
+        self._exact = {}
+        self._prefixes = {}
+        self._suffixes = {}
+        self._others = []
+
+        for order, pattern in enumerate(patterns):
+            if not _wildcards.search(pattern):
+                self._exact.setdefault(pattern, order)
+            elif pattern.endswith("*") and not _wildcards.search(pattern[:-1]):
+                self._prefixes.setdefault(pattern[:-1], order)
+            elif pattern.startswith("*") and not _wildcards.search(pattern[1:]):
+                self._suffixes.setdefault(pattern[1:], order)
+            else:
+                self._others.append((order, re.compile(fnmatch.translate(pattern))))
+
+        self._prefix_lengths = sorted(set(len(x) for x in self._prefixes))
+        self._suffix_lengths = sorted(set(len(x) for x in self._suffixes))
+
+        self._combined = None
+        if self._others:
+            self._combined = re.compile("|".join(x[1].pattern for x in self._others))
+
+    def match(self, name):
+        orders = []
+
+        if name in self._exact:
+            orders.append(self._exact[name])
+
+        for length in self._prefix_lengths:
+            order = self._prefixes.get(name[:length])
+            if order is not None:
+                orders.append(order)
+
+        for length in self._suffix_lengths:
+            order = self._suffixes.get(name[-length:])
+            if order is not None:
+                orders.append(order)
+
+        # The combined regex only says whether one of the remaining patterns matched, so find which one after.
+        if self._combined and self._combined.match(name):
+            orders.append(next(order for order, regex in self._others if regex.match(name)))
+
+        if not orders:
+            return None
+
+        # Report the earliest pattern in the file, which is the one a sequential scan would have stopped at.
+        order = min(orders)
+        self.counts[order] += 1
+        return self.patterns[order]
+
+    def unused_patterns(self):
+        return [x for x, count in zip(self.patterns, self.counts) if count == 0]
@@ -0,0 +1,120 @@
+import contextlib
+import heapq
+import json
+import threading
+import time
+import tracemalloc
+
+
+# Collects wall time, CPU time and peak traced memory per named phase, plus the time spent converting each record.
+# Phases can nest, in which case the outer phase's numbers include the inner ones. Each thread nests its phases
+# separately, since streamed records are parsed on the process pool's task thread while the main thread writes them.
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.phases = {}
+        self.records = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def reset(self):
+        self.phases = {}
+        self.records = []
+        self._local = threading.local()
+
+    @property
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _note_peak(self):
+        # The traced peak is shared by all threads, so only the main thread resets it. Phases on other threads only
+        # see the memory in use when they start and end, which is less precise but not mixed up with other phases.
+        current, peak = tracemalloc.get_traced_memory()
+        is_main_thread = threading.current_thread() is threading.main_thread()
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak if is_main_thread else current)
+        if is_main_thread:
+            tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        self._note_peak()
+        frame = {"peak": 0}
+        self._stack.append(frame)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            self._note_peak()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], frame["peak"])
+
+            self._add_phase(name, 1, wall, cpu, frame["peak"])
+
+    @contextlib.contextmanager
+    def record(self, family, name):
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        with self.phase("convert " + family):
+            yield
+        self.records.append((time.perf_counter() - start, family, name))
+
+    def _add_phase(self, name, count, wall, cpu, peak):
+        with self._lock:
+            phase = self.phases.setdefault(name, {"count": 0, "wallSeconds": 0, "cpuSeconds": 0, "peakMemoryBytes": 0})
+            phase["count"] += count
+            phase["wallSeconds"] += wall
+            phase["cpuSeconds"] += cpu
+            phase["peakMemoryBytes"] = max(phase["peakMemoryBytes"], peak)
+
+    def take_snapshot(self):
+        snapshot = {"phases": self.phases, "records": self.records}
+        self.reset()
+        return snapshot
+
+    def merge_snapshot(self, snapshot):
+        for name, phase in snapshot["phases"].items():
+            self._add_phase(name, phase["count"], phase["wallSeconds"], phase["cpuSeconds"], phase["peakMemoryBytes"])
+        self.records.extend(snapshot["records"])
+
+    def write_report(self, path, top_count):
+        slowest = heapq.nlargest(top_count, self.records)
+
+        print("Profile:")
+        for name, phase in self.phases.items():
+            print("    " + name + ": " + str(phase["count"]) + " calls, " +
+                "{:.3f}s wall, {:.3f}s CPU, {:.1f} MB peak".format(
+                    phase["wallSeconds"], phase["cpuSeconds"], phase["peakMemoryBytes"] / (1024 * 1024)))
+
+        print("Slowest records:")
+        for seconds, family, name in slowest:
+            print("    " + family + " " + name + ": {:.3f}s".format(seconds))
+
+        report = {
+            "phases": self.phases,
+            "slowestRecords": [{"family": family, "name": name, "wallSeconds": seconds} for seconds, family, name in slowest]
+        }
+
+        with open(path, "w", encoding="UTF-8") as report_file:
+            json.dump(report, report_file, indent=4)
+
+
+profiler = Profiler()
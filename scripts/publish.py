@@ -0,0 +1,395 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+
+import binary_encoding
+from json_writer import JsonArrayWriter, JsonObjectWriter
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def read_converted_file(extracted_path, family):
+    with open(os.path.join(extracted_path, family + ".json"), "r", encoding="UTF-8") as json_file:
+        return json.load(json_file)
+
+
+def _write_hashed_file(directory, name, content):
+    serialized = json.dumps(content).encode("UTF-8")
+    file_name = name + "." + hashlib.sha256(serialized).hexdigest()[:16] + ".json"
+
+    path = os.path.join(directory, file_name)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", "wb") as shard_file:
+            shard_file.write(serialized)
+        os.replace(path + ".tmp", path)
+
+    return file_name
+
+
+def _referenced_shards(manifest):
+    referenced = set([manifest["ammoParamsShard"]])
+    referenced.update(x["shard"] for x in manifest["vehicles"].values())
+    referenced.update(manifest["itemShards"].values())
+    return referenced
+
+
+def _manifest_shards(manifest_path):
+    with open(manifest_path, "r", encoding="UTF-8") as manifest_file:
+        return _referenced_shards(json.load(manifest_file))
+
+
+def publish_shards(extracted_path, publish_path):
+    vehicles = read_converted_file(extracted_path, "vehicles")
+    items = read_converted_file(extracted_path, "items")
+    ammo_params = read_converted_file(extracted_path, "ammo_params")
+
+    # Shard names include a hash of their content, so they can be cached indefinitely and only the small manifest
+    # has to be fetched again after a data update.
+    manifest = {
+        "vehicles": {},
+        "items": {},
+        "itemShards": {},
+        "ammoParamsShard": "ammo_params/" + _write_hashed_file(os.path.join(publish_path, "ammo_params"), "ammo_params", ammo_params)
+    }
+
+    for name, vehicle in vehicles.items():
+        manifest["vehicles"][name] = {
+            "displayName": vehicle.get("displayName"),
+            "displayNameKey": vehicle.get("displayNameKey"),
+            "baseName": vehicle.get("baseName"),
+            "modificationName": vehicle.get("modificationName"),
+            "size": vehicle.get("size"),
+            "shard": "vehicles/" + _write_hashed_file(os.path.join(publish_path, "vehicles"), name, vehicle)
+        }
+
+    items_by_type = {}
+    for name, item in items.items():
+        items_by_type.setdefault(item["type"], {})[name] = item
+        manifest["items"][name] = {
+            "displayName": item.get("displayName"),
+            "displayNameKey": item.get("displayNameKey"),
+            "type": item["type"],
+            "subtype": item.get("subtype"),
+            "size": item.get("size")
+        }
+
+    for item_type, typed_items in items_by_type.items():
+        manifest["itemShards"][item_type] = "items/" + _write_hashed_file(os.path.join(publish_path, "items"), item_type, typed_items)
+
+    # Shards never change once written, so only new ones need compressed siblings. They're written before the new
+    # manifest can refer to them.
+    referenced = _referenced_shards(manifest)
+    shard_paths = [os.path.join(publish_path, x) for x in sorted(referenced)]
+    report = write_compressed_artifacts([x for x in shard_paths if not os.path.exists(x + ".gz")], os.path.dirname(publish_path))
+
+    # Clients with the previous manifest cached may still ask for its shards, so those are kept for one more
+    # generation and only older ones are dropped. The manifest is replaced in one step once its shards exist.
+    manifest_path = os.path.join(publish_path, "manifest.json")
+    kept = _manifest_shards(manifest_path) if os.path.exists(manifest_path) else set()
+
+    with open(manifest_path + ".tmp", "w", encoding="UTF-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    report.extend(write_compressed_artifacts([manifest_path], os.path.dirname(publish_path)))
+
+    kept.update(referenced)
+    for directory in ["vehicles", "items", "ammo_params"]:
+        directory_path = os.path.join(publish_path, directory)
+        if os.path.isdir(directory_path):
+            for file_name in os.listdir(directory_path):
+                shard_name = file_name[:-3] if file_name.endswith((".gz", ".br")) else file_name
+                if directory + "/" + shard_name not in kept:
+                    os.remove(os.path.join(directory_path, file_name))
+
+    print("Published " + str(len(referenced)) + " shards to " + publish_path)
+    return report
+
+
+# Wraps the writer of published vehicles and replaces their ports and default loadouts with references to shared
+# blocks. Variants of the same vehicle mostly share these, so each block is written only once to a separate file, and
+# clients expand the references again after loading. Blocks are numbered in the order they're first seen and written
+# as an array, since short sequential numbers compress far better than content hashes would.
+class VehicleBlockWriter:
+    def __init__(self, writer, blocks_path):
+        self._writer = writer
+        self._blocks = JsonArrayWriter(blocks_path, "const vehicleBlocks = ", ";")
+        self._block_ids = {}
+        self._names = set()
+
+    def _store(self, content):
+        digest = hashlib.sha256(json.dumps(content).encode("UTF-8")).digest()
+        block_id = self._block_ids.get(digest)
+        if block_id is None:
+            block_id = self._blocks.append(content)
+            self._block_ids[digest] = block_id
+        return block_id
+
+    def _store_loadout(self, loadout):
+        entries = {}
+        for port_name, entry in loadout.items():
+            entry = dict(entry)
+            entry["children"] = self._store_loadout(entry["children"])
+            entries[port_name] = self._store(entry)
+        return self._store(entries)
+
+    def write(self, key, vehicle):
+        # Like the JSON writers, the first vehicle with a given name wins, so later ones don't add unused blocks.
+        if key in self._names:
+            self._writer.write(key, vehicle)
+            return
+        self._names.add(key)
+
+        vehicle = dict(vehicle)
+        vehicle["ports"] = self._store([self._store(x) for x in vehicle["ports"]])
+        if "defaultItems" in vehicle:
+            vehicle["defaultItems"] = self._store_loadout(vehicle["defaultItems"])
+        self._writer.write(key, vehicle)
+
+    def close(self):
+        self._blocks.close()
+        self._writer.close()
+
+    def abort(self):
+        self._blocks.abort()
+        self._writer.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type:
+            self.abort()
+        else:
+            self.close()
+
+
+# Default loadouts of vehicles and items as flat rows. Each row is a parent row index, a port name id and an item name
+# id, with ids into tables of interned names shared by both. Rows are in depth first order, so clients rebuild a
+# loadout in one pass over its rows. Every writer of published records that feeds the tables opens them, and they're
+# only written once all of those closed, through a temporary file. If any of them aborts, the previous tables are
+# left alone.
+class LoadoutTables:
+    def __init__(self, path):
+        self.path = path
+        self._port_names = {}
+        self._item_names = {}
+        self._rows = {"vehicles": {}, "items": {}}
+        self._open_count = 0
+        self._aborted = False
+
+    def open(self):
+        self._open_count += 1
+
+    def add(self, family, key, loadout):
+        # Like the JSON writers, the first record with a given name wins.
+        if key in self._rows[family]:
+            return
+
+        rows = []
+
+        def add_rows(container, parent_row):
+            for port_name, entry in container.items():
+                row = len(rows) // 3
+                rows.append(parent_row)
+                rows.append(self._port_names.setdefault(port_name, len(self._port_names)))
+                rows.append(self._item_names.setdefault(entry["itemName"], len(self._item_names)))
+                add_rows(entry["children"], row)
+
+        add_rows(loadout, -1)
+        self._rows[family][key] = rows
+
+    def close(self):
+        self._open_count -= 1
+        if self._open_count or self._aborted:
+            return
+
+        tables = {
+            "portNames": list(self._port_names),
+            "itemNames": list(self._item_names),
+            "vehicles": self._rows["vehicles"],
+            "items": self._rows["items"]
+        }
+
+        with open(self.path + ".tmp", "w", encoding="UTF-8") as js_file:
+            js_file.write("const loadoutTables = ")
+            json.dump(tables, js_file)
+            js_file.write(";")
+        os.replace(self.path + ".tmp", self.path)
+
+    def abort(self):
+        self._open_count -= 1
+        self._aborted = True
+
+
+# Wraps the writer of published vehicles or items and takes their default loadouts out into the shared loadout
+# tables. Without flattening, records pass through unchanged and the tables are written empty, so no outdated rows
+# stay behind.
+class LoadoutRowWriter:
+    def __init__(self, writer, tables, family, flatten=True):
+        self._writer = writer
+        self._tables = tables
+        self._family = family
+        self._flatten = flatten
+        tables.open()
+
+    def write(self, key, record):
+        if self._flatten and "defaultItems" in record:
+            record = dict(record)
+            self._tables.add(self._family, key, record.pop("defaultItems"))
+        self._writer.write(key, record)
+
+    def close(self):
+        self._tables.close()
+        self._writer.close()
+
+    def abort(self):
+        self._tables.abort()
+        self._writer.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type:
+            self.abort()
+        else:
+            self.close()
+
+
+# Wraps the writer of published items and builds an inverted index from item type, subtype and size to item names
+# as they pass through. Names are further grouped by their sorted required tags, so clients can resolve tag
+# constraints once per group instead of once per item. The index is written when the items are complete.
+class PortIndexWriter:
+    def __init__(self, writer, index_path):
+        self._writer = writer
+        self._index_writer = JsonObjectWriter(index_path, "const portIndex = ", ";")
+        self._index = {}
+        self._names = set()
+
+    def write(self, key, item):
+        # Like the JSON writers, the first item with a given name wins.
+        if key not in self._names:
+            self._names.add(key)
+            subtypes = self._index.setdefault(item["type"], {})
+            sizes = subtypes.setdefault(item.get("subtype") or "", {})
+            tags = sizes.setdefault(str(item.get("size", 0)), {})
+            tags.setdefault(" ".join(sorted(item.get("requiredTags", []))), []).append(key)
+        self._writer.write(key, item)
+
+    def close(self):
+        for item_type, subtypes in self._index.items():
+            self._index_writer.write(item_type, subtypes)
+        self._index_writer.close()
+        self._writer.close()
+
+    def abort(self):
+        self._index_writer.abort()
+        self._writer.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        if exception_type:
+            self.abort()
+        else:
+            self.close()
+
+
+def _time_decompress(decompress, data, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decompress(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _time_parsing(paths):
+    # Parsing is timed in node when it's installed, since its engine is the one browsers use too.
+    node_path = shutil.which("node")
+    if not paths or not node_path:
+        if paths:
+            print("    Warning: Node isn't installed, skipping parse times")
+        return [None] * len(paths)
+
+    output = subprocess.check_output([node_path, os.path.join(os.path.dirname(__file__), "time_parsing.js")] + paths)
+    return json.loads(output)
+
+
+def _parse_published_file(data):
+    # Published data files are a single statement setting a variable, like const allItems = {...};
+    text = data.decode("UTF-8")
+    return text[len("const "):text.index(" = ")], json.loads(text[text.index("=") + 1:text.rindex(";")])
+
+
+def write_binary_data_files(data_path, names):
+    # Writes the binary encoding of each named data file next to it, and lists them in binary_files.js with the
+    # variable they set, so the client fetches and decodes those instead of loading the scripts. Encodings of files
+    # that aren't named any more are removed.
+    variables = {}
+    for name in names:
+        path = os.path.join(data_path, name + ".js")
+        with open(path, "rb") as js_file:
+            variable, content = _parse_published_file(js_file.read())
+
+        with open(path[:-len(".js")] + ".bin.tmp", "wb") as binary_file:
+            binary_file.write(binary_encoding.encode(content))
+        os.replace(path[:-len(".js")] + ".bin.tmp", path[:-len(".js")] + ".bin")
+        variables[name] = variable
+
+    for file_name in os.listdir(data_path):
+        if file_name.endswith((".bin", ".bin.gz", ".bin.br")) and file_name.split(".", 1)[0] not in variables:
+            os.remove(os.path.join(data_path, file_name))
+
+    with open(os.path.join(data_path, "binary_files.js.tmp"), "w", encoding="UTF-8") as js_file:
+        js_file.write("const binaryDataFiles = " + json.dumps(variables) + ";")
+    os.replace(os.path.join(data_path, "binary_files.js.tmp"), os.path.join(data_path, "binary_files.js"))
+
+    return [os.path.join(data_path, x + ".bin") for x in names]
+
+
+def write_compressed_artifacts(paths, root_path):
+    # Static hosting can serve these precompressed siblings directly instead of the plain files. Brotli is optional,
+    # so its siblings are only written when the module is installed. Every sibling of a file parses to the same
+    # content, so siblings are only timed decompressing, using the same zlib and brotli libraries browsers use, and
+    # the plain file is timed parsing.
+    compressors = [(".gz", lambda x: gzip.compress(x, 9, mtime=0), gzip.decompress)]
+    if brotli:
+        compressors.append((".br", lambda x: brotli.compress(x, quality=11), brotli.decompress))
+    elif paths:
+        print("    Warning: Brotli isn't installed, skipping .br artifacts")
+
+    report = []
+    for path, parse_seconds in zip(paths, _time_parsing(paths)):
+        with open(path, "rb") as published_file:
+            data = published_file.read()
+
+        artifact = os.path.relpath(path, root_path).replace(os.sep, "/")
+        report.append({"artifact": artifact, "bytes": len(data), "decompressSeconds": None, "parseSeconds": parse_seconds})
+        for extension, compress, decompress in compressors:
+            compressed = compress(data)
+            with open(path + extension, "wb") as artifact_file:
+                artifact_file.write(compressed)
+
+            seconds = _time_decompress(decompress, compressed)
+            report.append({"artifact": artifact + extension, "bytes": len(compressed), "decompressSeconds": seconds, "parseSeconds": None})
+
+    for entry in report:
+        line = "    " + entry["artifact"] + ": " + str(entry["bytes"]) + " bytes"
+        if entry["decompressSeconds"] is not None:
+            line += ", {:.1f} ms to decompress".format(entry["decompressSeconds"] * 1000)
+        if entry["parseSeconds"] is not None:
+            line += ", {:.1f} ms to parse".format(entry["parseSeconds"] * 1000)
+        print(line)
+
+    return report
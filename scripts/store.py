@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import sqlite3
+
+
+_schema = """
+CREATE TABLE vehicles (
+    name TEXT PRIMARY KEY,
+    display_name TEXT,
+    base_name TEXT,
+    modification_name TEXT,
+    size INTEGER,
+    mass REAL,
+    data TEXT
+);
+
+CREATE TABLE items (
+    name TEXT PRIMARY KEY,
+    display_name TEXT,
+    type TEXT,
+    subtype TEXT,
+    size INTEGER,
+    ammo_params_reference TEXT,
+    alpha REAL,
+    burst_dps REAL,
+    sustained_dps REAL,
+    range REAL,
+    data TEXT
+);
+
+CREATE TABLE ports (
+    id INTEGER PRIMARY KEY,
+    owner_kind TEXT,
+    owner_name TEXT,
+    name TEXT,
+    min_size INTEGER,
+    max_size INTEGER,
+    flags TEXT,
+    required_tags TEXT
+);
+
+CREATE TABLE port_types (
+    port_id INTEGER REFERENCES ports (id),
+    type TEXT,
+    subtype TEXT
+);
+
+CREATE TABLE loadout_edges (
+    id INTEGER PRIMARY KEY,
+    owner_kind TEXT,
+    owner_name TEXT,
+    parent_id INTEGER REFERENCES loadout_edges (id),
+    port_name TEXT,
+    item_name TEXT
+);
+
+CREATE TABLE ammo_params (
+    reference TEXT PRIMARY KEY,
+    speed REAL,
+    lifetime REAL,
+    range REAL,
+    damage_distortion REAL,
+    damage_energy REAL,
+    damage_physical REAL,
+    damage_thermal REAL,
+    data TEXT
+);
+"""
+
+# Created after the data is in, which is quicker than keeping them up to date on every insert.
+_indexes = """
+CREATE INDEX items_type ON items (type, subtype, size);
+CREATE INDEX items_ammo_params ON items (ammo_params_reference);
+CREATE INDEX ports_owner ON ports (owner_kind, owner_name);
+CREATE INDEX port_types_type ON port_types (type, subtype, port_id);
+CREATE INDEX port_types_port ON port_types (port_id);
+CREATE INDEX loadout_edges_owner ON loadout_edges (owner_kind, owner_name);
+CREATE INDEX loadout_edges_item ON loadout_edges (item_name);
+"""
+
+named_queries = {
+    # Parameters: size, minimum alpha
+    "guns-by-alpha": """
+        SELECT name, size, alpha, burst_dps FROM items
+        WHERE type = 'WeaponGun' AND size = ? AND alpha > ?
+        ORDER BY alpha DESC""",
+
+    # Parameters: port type, item size
+    "vehicles-with-port": """
+        SELECT DISTINCT ports.owner_name, ports.name, ports.min_size, ports.max_size FROM port_types
+        JOIN ports ON ports.id = port_types.port_id
+        WHERE ports.owner_kind = 'vehicle' AND port_types.type = ?1
+            AND (ports.min_size = 0 OR ports.min_size <= ?2) AND (ports.max_size = 0 OR ports.max_size >= ?2)
+        ORDER BY ports.owner_name, ports.name"""
+}
+
+
+# Normalized tables of the converted records. Like the JSON writers, the first record with a given key wins. The
+# database is built in a temporary file that only replaces the previous one once conversion finished.
+class ConvertedStore:
+    def __init__(self, path):
+        self.path = path
+        self._temporary_path = path + ".tmp"
+        if os.path.exists(self._temporary_path):
+            os.remove(self._temporary_path)
+
+        self._connection = sqlite3.connect(self._temporary_path)
+        self._connection.executescript(_schema)
+
+    def _add_ports(self, owner_kind, owner_name, ports):
+        for port in ports:
+            cursor = self._connection.execute(
+                "INSERT INTO ports (owner_kind, owner_name, name, min_size, max_size, flags, required_tags) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (owner_kind, owner_name, port["name"], port["minSize"], port["maxSize"], " ".join(port["flags"]), " ".join(port["requiredTags"])))
+            self._connection.executemany(
+                "INSERT INTO port_types (port_id, type, subtype) VALUES (?, ?, ?)",
+                [(cursor.lastrowid, x["type"], x["subtype"]) for x in port["types"]])
+
+    def _add_loadout(self, owner_kind, owner_name, loadout, parent_id=None):
+        for port_name, entry in loadout.items():
+            cursor = self._connection.execute(
+                "INSERT INTO loadout_edges (owner_kind, owner_name, parent_id, port_name, item_name) VALUES (?, ?, ?, ?, ?)",
+                (owner_kind, owner_name, parent_id, port_name, entry["itemName"]))
+            self._add_loadout(owner_kind, owner_name, entry["children"], cursor.lastrowid)
+
+    def add_vehicle(self, vehicle):
+        size = vehicle.get("size")
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO vehicles VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (vehicle["name"], vehicle.get("displayName"), vehicle.get("baseName"), vehicle.get("modificationName"),
+                int(size) if size else None, vehicle.get("mass"), json.dumps(vehicle)))
+        if not cursor.rowcount:
+            return
+
+        self._add_ports("vehicle", vehicle["name"], vehicle["ports"])
+        self._add_loadout("vehicle", vehicle["name"], vehicle.get("defaultItems", {}))
+
+    def add_item(self, item):
+        metrics = item.get("weaponMetrics") or {}
+        alpha, burst_dps, sustained_dps = [sum(metrics[x].values()) if x in metrics else None for x in ["alpha", "burstDps", "sustainedDps"]]
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (item["name"], item.get("displayName"), item["type"], item.get("subtype"), item.get("size"),
+                item.get("ammoParamsReference"), alpha, burst_dps, sustained_dps, metrics.get("range"), json.dumps(item)))
+        if not cursor.rowcount:
+            return
+
+        self._add_ports("item", item["name"], item["ports"].values())
+        self._add_loadout("item", item["name"], item.get("defaultItems", {}))
+
+    def add_ammo_params(self, ammo_params):
+        damage = ammo_params.get("damage", {})
+        self._connection.execute(
+            "INSERT OR IGNORE INTO ammo_params VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (ammo_params["reference"], ammo_params["speed"], ammo_params["lifetime"], ammo_params["speed"] * ammo_params["lifetime"],
+                damage.get("damageDistortion"), damage.get("damageEnergy"), damage.get("damagePhysical"), damage.get("damageThermal"),
+                json.dumps(ammo_params)))
+
+    def add(self, family, converted):
+        {"vehicles": self.add_vehicle, "items": self.add_item, "ammo_params": self.add_ammo_params}[family](converted)
+
+    def close(self):
+        self._connection.executescript(_indexes)
+        self._connection.commit()
+        self._connection.close()
+        os.replace(self._temporary_path, self.path)
+
+    def abort(self):
+        self._connection.close()
+        os.remove(self._temporary_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--version", "-v", required=True)
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="VALUE")
+    parser.add_argument("query", help="SQL, or one of: " + ", ".join(named_queries))
+    arguments = parser.parse_args()
+
+    database_path = os.path.join(os.path.dirname(__file__), "..", "extracted", arguments.version, "converted.sqlite")
+    connection = sqlite3.connect("file:" + database_path + "?mode=ro", uri=True)
+
+    cursor = connection.execute(named_queries.get(arguments.query, arguments.query), arguments.param)
+    print("\t".join(x[0] for x in cursor.description))
+    for row in cursor:
+        print("\t".join("" if x is None else str(x) for x in row))
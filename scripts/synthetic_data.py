@@ -0,0 +1,303 @@
+import argparse
+import os
+import random
+import zlib
+
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element, SubElement
+
+
+# Generates an extracted game data tree shaped like the parts of unforged DataForge output that the converters read.
+# None of the values are meaningful; they only need to exercise the same code paths at a configurable scale.
+
+_item_path = "libs/foundry/records/entities/scitem/ships/"
+_vehicle_path = "libs/foundry/records/entities/spaceships/"
+_ammo_params_path = "libs/foundry/records/ammoparams/vehicle/"
+_filler_path = "libs/foundry/records/entities/characters/"
+
+_definition_directory = "Scripts/Entities/Vehicles/Implementations/Xml"
+_loadout_directory = "Scripts/Loadouts/Vehicles"
+
+
+def _make_record(type, name, path):
+    return Element(type + "." + name, {
+        "__type": type,
+        "__ref": "%08x-0000-0000-0000-%012x" % (zlib.crc32(name.encode("UTF-8")), len(name)),
+        "__path": path + name.lower() + ".xml"
+    })
+
+
+def _add_damage_info(parent, tag, random_source):
+    container = SubElement(parent, tag)
+    SubElement(container, "DamageInfo", {
+        "DamagePhysical": str(random_source.choice([0, 0, 1, 5])),
+        "DamageEnergy": str(random_source.randint(1, 100)),
+        "DamageDistortion": str(random_source.choice([0, 0, 2])),
+        "DamageThermal": "0"
+    })
+
+
+def _add_port(ports_element, name, port_type, subtypes, max_size):
+    port = SubElement(ports_element, "SItemPortDef", {
+        "Name": name,
+        "Flags": "$uneditable" if max_size == 1 else "",
+        "MinSize": "1",
+        "MaxSize": str(max_size),
+        "RequiredTags": ""
+    })
+    types = SubElement(SubElement(port, "Types"), "SItemPortDefTypes", {"Type": port_type})
+    subtypes_element = SubElement(types, "SubTypes")
+    for subtype in subtypes:
+        SubElement(subtypes_element, "Enum", {"value": subtype})
+
+    connections = SubElement(port, "Connections")
+    SubElement(connections, "SItemPortConnectionParam", {"klass": "Power", "name": "MainPower"})
+
+
+def make_item_record(name, item_type, size, ammo_reference, random_source):
+    record = _make_record("EntityClassDefinition", name, _item_path)
+    components = SubElement(record, "Components")
+
+    subtype = {"WeaponGun": "Gun", "Turret": "GunTurret"}.get(item_type, "UNDEFINED")
+    attachable = SubElement(components, "SAttachableComponentParams")
+    attach_def = SubElement(attachable, "AttachDef", {"Type": item_type, "SubType": subtype, "Size": str(size), "RequiredTags": ""})
+    SubElement(attach_def, "Localization", {"Name": "@item_name_" + name})
+
+    SubElement(components, "EntityComponentPowerConnection", {
+        "PowerBase": "1", "PowerDraw": str(random_source.randint(1, 500)), "PowerToEM": "2"})
+    SubElement(components, "EntityComponentHeatConnection", {
+        "Mass": str(random_source.randint(1, 100)), "MaxTemperature": "500", "SpecificHeatCapacity": "1"})
+    SubElement(components, "SDegradationParams", {"MaxLifetimeHours": "2500"})
+
+    # Real records carry a lot of data the converters never read.
+    geometry = SubElement(components, "SGeometryResourceParams")
+    for index in range(random_source.randint(5, 20)):
+        SubElement(SubElement(geometry, "Geometry", {"index": str(index)}), "Material", {"path": "objects/" + name + ".mtl"})
+
+    if item_type == "Cooler":
+        SubElement(components, "SCItemCoolerParams", {"CoolingRate": str(random_source.randint(1000, 90000))})
+    elif item_type == "Shield":
+        SubElement(components, "SCItemShieldGeneratorParams", {
+            "MaxShieldHealth": str(random_source.randint(1000, 50000)), "MaxShieldRegen": "100",
+            "DamagedRegenDelay": "5", "DownedRegenDelay": "10"})
+    elif item_type == "WeaponGun":
+        weapon = SubElement(components, "SCItemWeaponComponentParams")
+        SubElement(weapon, "connectionParams", {"heatRateOnline": "2"})
+        regen = SubElement(weapon, "weaponRegenConsumerParams")
+        SubElement(regen, "SWeaponRegenConsumerParams", {
+            "requestedRegenPerSec": "10", "regenerationCooldown": "0.25",
+            "regenerationCostPerBullet": "0.5", "requestedAmmoLoad": "40"})
+        fire_actions = SubElement(weapon, "fireActions")
+        action = SubElement(fire_actions, "SWeaponActionFireRapidParams", {
+            "fireRate": str(random_source.randint(60, 1200)), "heatPerShot": "3"})
+        launcher = SubElement(SubElement(action, "launchParams"), "SProjectileLauncher", {"pelletCount": "1"})
+        SubElement(launcher, "spreadParams", {"min": "0", "max": "1", "attack": "0.1", "decay": "0.2"})
+        SubElement(components, "SAmmoContainerComponentParams", {
+            "ammoParamsRecord": ammo_reference, "maxAmmoCount": str(random_source.randint(100, 2000))})
+    elif item_type == "Turret":
+        container = SubElement(components, "SItemPortContainerComponentParams")
+        ports = SubElement(container, "Ports")
+        for index in range(random_source.randint(1, 4)):
+            _add_port(ports, "hardpoint_weapon_" + str(index), "WeaponGun", ["Gun", "UNDEFINED"], max(1, size - 1))
+
+        # Like the C8 Pisces, some turrets have nameless ports that get generated names.
+        if size % 2:
+            _add_port(ports, "", "WeaponGun", ["Gun"], 1)
+            _add_port(ports, "", "WeaponGun", ["Gun"], 1)
+
+    return record
+
+
+def make_ammo_params_record(name, random_source):
+    record = _make_record("AmmoParams", name, _ammo_params_path)
+    record.set("speed", str(random_source.randint(500, 2000)))
+    record.set("lifetime", str(random_source.choice([1, 2, 3])))
+
+    projectile = SubElement(SubElement(record, "projectileParams"), "BulletProjectileParams")
+    _add_damage_info(projectile, "damage", random_source)
+    SubElement(projectile, "detonationParams")
+
+    drop = SubElement(SubElement(projectile, "damageDropParams"), "BulletDamageDropParams")
+    _add_damage_info(drop, "damageDropMinDistance", random_source)
+    _add_damage_info(drop, "damageDropPerMeter", random_source)
+    _add_damage_info(drop, "damageDropMinDamage", random_source)
+
+    return record
+
+
+def make_filler_record(name, random_source):
+    record = _make_record("EntityClassDefinition", name, _filler_path)
+    components = SubElement(record, "Components")
+    for index in range(random_source.randint(10, 50)):
+        SubElement(components, "SomeComponentParams", {"index": str(index), "value": str(random_source.random())})
+    return record
+
+
+def make_vehicle_definition(name, part_count, random_source):
+    vehicle = Element("Vehicle", {"name": name, "size": str(random_source.randint(1, 6)), "itemPortTags": name})
+
+    def add_parts(parent, depth, remaining):
+        parts = SubElement(parent, "Parts")
+        count = 0
+        while remaining > 0 and (count < 6 or depth == 0):
+            index = part_count - remaining
+            part = SubElement(parts, "Part", {
+                "name": "hardpoint_" + str(index),
+                "id": "part_" + str(index),
+                "damageMax": str(random_source.randint(0, 1000)),
+                "mass": str(random_source.randint(1, 5000))})
+            remaining -= 1
+            count += 1
+
+            if index % 3 != 2:
+                part.set("class", "ItemPort")
+                port_type = random_source.choice(["Turret", "Cooler", "Shield", "WeaponGun"])
+                item_port = SubElement(part, "ItemPort", {"flags": "", "minSize": "1", "maxSize": str(random_source.randint(1, 5))})
+                SubElement(SubElement(item_port, "Types"), "Type", {"type": port_type})
+                SubElement(SubElement(item_port, "Connections"), "Connection", {"pipeClass": "Power", "pipe": "MainPower"})
+                SubElement(item_port, "Yaw", {"min": "-30", "max": "30"})
+            else:
+                SubElement(SubElement(SubElement(part, "DamageBehaviors"), "DamageBehavior"), "Group", {"name": "Destroy"})
+                if depth < 4:
+                    remaining = add_parts(part, depth + 1, remaining)
+
+        return remaining
+
+    add_parts(vehicle, 0, part_count)
+
+    modifications = SubElement(vehicle, "Modifications")
+    modification = SubElement(modifications, "Modification", {"name": "Variant"})
+    elems = SubElement(modification, "Elems")
+    for index in range(0, part_count, 4):
+        SubElement(elems, "Elem", {"idRef": "part_" + str(index), "name": "damageMax", "value": "1"})
+    SubElement(modifications, "Modification", {"name": "Patched", "patchFile": "Modifications/" + name + "_Patched"})
+
+    return vehicle
+
+
+def make_vehicle_patch(part_count, random_source):
+    patch = Element("Modifications")
+    for index in range(0, part_count, 5):
+        # Only replace leaf parts so that later entries don't target parts removed by earlier ones.
+        if index % 3 == 2:
+            continue
+        part = SubElement(patch, "Part", {"id": "part_" + str(index), "name": "hardpoint_patched_" + str(index), "class": "ItemPort"})
+        item_port = SubElement(part, "ItemPort", {"minSize": "1", "maxSize": "2"})
+        SubElement(SubElement(item_port, "Types"), "Type", {"type": "Shield"})
+    return patch
+
+
+def make_loadout_file(part_count, items_by_type, random_source):
+    loadout = Element("Loadout")
+    items = SubElement(loadout, "Items")
+    for index in range(part_count):
+        if index % 3 != 2:
+            item_type = random_source.choice(list(items_by_type))
+            item = SubElement(items, "Item", {"portName": "hardpoint_" + str(index), "itemName": random_source.choice(items_by_type[item_type])})
+            if item_type == "Turret":
+                children = SubElement(item, "Items")
+                SubElement(children, "Item", {"portName": "hardpoint_weapon_0", "itemName": random_source.choice(items_by_type["WeaponGun"])})
+    return loadout
+
+
+def make_vehicle_record(name, definition_path, modification, loadout_path, manual_items):
+    record = _make_record("EntityClassDefinition", name, _vehicle_path)
+    components = SubElement(record, "Components")
+    SubElement(components, "VehicleComponentParams", {
+        "vehicleDefinition": definition_path,
+        "modification": modification,
+        "vehicleName": "@vehicle_name_" + name})
+
+    loadout = SubElement(SubElement(components, "SEntityComponentDefaultLoadoutParams"), "loadout")
+    if loadout_path:
+        SubElement(loadout, "SItemPortLoadoutXMLParams", {"loadoutPath": loadout_path})
+    else:
+        manual = SubElement(loadout, "SItemPortLoadoutManualParams")
+        entries = SubElement(manual, "entries")
+        for port_name, item_name in manual_items:
+            entry = SubElement(entries, "SItemPortLoadoutEntryParams", {"itemPortName": port_name, "entityClassName": item_name})
+            SubElement(entry, "loadout")
+
+    return record
+
+
+def _write_xml(path, element):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    ElementTree.ElementTree(element).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def generate_corpus(extracted_path, scale, seed=0):
+    random_source = random.Random(seed)
+    data_path = os.path.join(extracted_path, "Data")
+
+    item_types = ["Cooler", "Shield", "WeaponGun", "Turret"]
+    vehicle_count = scale
+    item_count = scale * 4
+    ammo_params_count = scale
+    filler_count = scale * 10
+
+    records = []
+    localization = []
+
+    ammo_references = []
+    for index in range(ammo_params_count):
+        record = make_ammo_params_record("AMMO_" + str(index), random_source)
+        ammo_references.append(record.get("__ref"))
+        records.append(record)
+
+    items_by_type = {x: [] for x in item_types}
+    for index in range(item_count):
+        item_type = item_types[index % len(item_types)]
+        name = item_type.upper() + "_" + str(index)
+        items_by_type[item_type].append(name)
+        records.append(make_item_record(name, item_type, random_source.randint(1, 5), random_source.choice(ammo_references), random_source))
+        localization.append("item_name_" + name + "=Item " + name)
+
+    for index in range(vehicle_count):
+        name = "SHIP_" + str(index)
+        part_count = random_source.randint(10, 60)
+
+        definition_path = _definition_directory + "/" + name + ".xml"
+        _write_xml(os.path.join(data_path, definition_path), make_vehicle_definition(name, part_count, random_source))
+        _write_xml(os.path.join(data_path, _definition_directory, "Modifications", name + "_Patched.xml"), make_vehicle_patch(part_count, random_source))
+
+        loadout_path = _loadout_directory + "/Default_Loadout_" + name + ".xml"
+        _write_xml(os.path.join(data_path, loadout_path), make_loadout_file(part_count, items_by_type, random_source))
+
+        manual_items = [("hardpoint_0", random_source.choice(items_by_type["Cooler"]))]
+        records.append(make_vehicle_record(name, definition_path, "", loadout_path, None))
+        records.append(make_vehicle_record(name + "_Variant", definition_path, "Variant", None, manual_items))
+        records.append(make_vehicle_record(name + "_Patched", definition_path, "Patched", loadout_path, None))
+        records.append(make_vehicle_record(name + "_Template", definition_path, "", loadout_path, None))
+
+        for suffix in ["", "_Variant", "_Patched"]:
+            localization.append("vehicle_name_" + name + suffix + "=Vehicle " + name + suffix)
+
+    for index in range(filler_count):
+        records.append(make_filler_record("FILLER_" + str(index), random_source))
+
+    random_source.shuffle(records)
+
+    os.makedirs(data_path, exist_ok=True)
+    with open(os.path.join(data_path, "Game.xml"), "wb") as game_file:
+        game_file.write(b"<?xml version=\"1.0\" encoding=\"utf-8\"?>\n<GameData>\n")
+        for record in records:
+            game_file.write(ElementTree.tostring(record, encoding="utf-8", xml_declaration=False))
+            game_file.write(b"\n")
+        game_file.write(b"</GameData>\n")
+
+    localization_path = os.path.join(data_path, "Localization", "english", "global.ini")
+    os.makedirs(os.path.dirname(localization_path), exist_ok=True)
+    with open(localization_path, "w", encoding="UTF-8") as ini_file:
+        for line in localization:
+            ini_file.write(line + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", "-o", required=True, metavar="EXTRACTED_PATH")
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    generate_corpus(arguments.output, arguments.scale, arguments.seed)
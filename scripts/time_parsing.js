@@ -0,0 +1,34 @@
+// Prints the best of three times in seconds to parse each published data file given as an argument, as a JSON array.
+// Plain data files are timed with JSON.parse, binary ones with the decoder the client uses.
+const fs = require("fs");
+const path = require("path");
+const vm = require("vm");
+
+vm.runInThisContext(fs.readFileSync(path.join(__dirname, "..", "loader.js"), "utf8"));
+
+const makeParse = (filePath) => {
+    const data = fs.readFileSync(filePath);
+    if (filePath.endsWith(".bin")) {
+        const buffer = data.buffer.slice(data.byteOffset, data.byteOffset + data.length);
+        return () => decodeBinaryData(buffer);
+    }
+
+    // Scripts set a variable to a literal, shards are plain JSON.
+    const text = data.toString("utf8");
+    const literal = filePath.endsWith(".js") ? text.slice(text.indexOf("=") + 1, text.lastIndexOf(";")) : text;
+    return () => JSON.parse(literal);
+};
+
+const times = process.argv.slice(2).map(filePath => {
+    const parse = makeParse(filePath);
+    let best;
+    for (let i = 0; i < 3; i++) {
+        const start = process.hrtime.bigint();
+        parse();
+        const elapsed = Number(process.hrtime.bigint() - start) / 1e9;
+        best = best === undefined ? elapsed : Math.min(best, elapsed);
+    }
+    return best;
+});
+
+console.log(JSON.stringify(times));
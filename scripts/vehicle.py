@@ -2,7 +2,7 @@ import os
 import re
 
 from common import _make_item_port
-from xml_reader import read_xml_file
+from xml_reader import read_xml_file, xml_file_exists
 
 
 def make_loadout(loadout_component, extracted_path):
@@ -39,7 +39,7 @@ def make_loadout(loadout_component, extracted_path):
         path = loadout_component.single("loadout").single("sitemportloadoutxmlparams")["@loadoutpath"]
         if path:
             path = os.path.join(extracted_path, "Data", path)
-            if os.path.exists(path):
+            if xml_file_exists(path):
                 loadout = read_xml_file(path)
                 add_file_entries(result, loadout)
 
@@ -64,12 +64,14 @@ def make_vehicle(definition_element):
     damage_max = 0
     mass = 0
     control_seats = 0
+    port_count = 0
 
     def walk_parts(container_element):
         nonlocal critical_part_damage
         nonlocal damage_max
         nonlocal mass
         nonlocal control_seats
+        nonlocal port_count
         result = []
 
         parts_element = container_element.single("parts")
@@ -106,8 +108,9 @@ def make_vehicle(definition_element):
                                         "subtype": subtype
                                     })
 
-                        port = _make_item_port(item_port_element, part_element["@name"], types)
+                        port = _make_item_port(item_port_element, part_element["@name"], types, port_count)
                         result.append(port)
+                        port_count += 1
 
                         for axis in ["yaw", "pitch"]:
                             if axis in item_port_element:
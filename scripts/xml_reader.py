@@ -1,5 +1,24 @@
+import contextlib
+import functools
+import os
+
 from xml.etree import ElementTree
 
+from profiler import profiler
+
+
+_file_dependencies = None
+
+
+@contextlib.contextmanager
+def record_file_dependencies():
+    global _file_dependencies
+    _file_dependencies = []
+    try:
+        yield _file_dependencies
+    finally:
+        _file_dependencies = None
+
 
 class ElementDictionary(dict):
     def single(self, key):
@@ -20,19 +39,210 @@ class ElementDictionary(dict):
             return entry[0]
 
 
+# Translates attributes and child lists of the wrapped element only when they're first accessed. Anything that
+# needs the whole dictionary, like iteration or len(), translates this level but still not the children.
+class ElementView(ElementDictionary):
+    def __init__(self, element):
+        super().__init__()
+        self._element = element
+        self._attributes = None
+        self._children = None
+
+    def _attribute_names(self):
+        if self._attributes is None:
+            self._attributes = {k.lower(): k for k in self._element.attrib}
+        return self._attributes
+
+    def _child_elements(self):
+        if self._children is None:
+            self._children = {}
+            for child in self._element:
+                self._children.setdefault(child.tag.lower(), []).append(child)
+        return self._children
+
+    def _resolve(self, key):
+        if self._element is None:
+            return False
+
+        if key.startswith("@"):
+            name = self._attribute_names().get(key[1:])
+            if name is None:
+                return False
+            dict.__setitem__(self, key, self._element.attrib[name])
+        elif key == "#text":
+            text = self._element.text
+            if not text or text.isspace():
+                return False
+            dict.__setitem__(self, key, text)
+        else:
+            children = self._child_elements().get(key)
+            if children is None:
+                return False
+            dict.__setitem__(self, key, [ElementView(x) for x in children])
+
+        return True
+
+    def _materialize(self):
+        if self._element is None:
+            return
+
+        keys = ["@" + x for x in self._attribute_names()] + ["#text"] + list(self._child_elements())
+
+        # Rebuild in the same key order as a full translation so iteration order doesn't depend on access order.
+        existing = dict(dict.items(self))
+        dict.clear(self)
+        for key in keys:
+            if key in existing:
+                dict.__setitem__(self, key, existing.pop(key))
+            else:
+                self._resolve(key)
+        dict.update(self, existing)
+
+        self._element = None
+        self._attributes = None
+        self._children = None
+
+    def __missing__(self, key):
+        if self._resolve(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self._resolve(key)
+
+    def __bool__(self):
+        if dict.__len__(self) > 0:
+            return True
+
+        element = self._element
+        if element is None:
+            return False
+
+        return len(element.attrib) > 0 or len(element) > 0 or bool(element.text and not element.text.isspace())
+
+    def __len__(self):
+        self._materialize()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._materialize()
+        if isinstance(other, ElementView):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self._materialize()
+        return dict.__repr__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        return default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return dict.__getitem__(self, key)
+
+    def pop(self, key, *args):
+        self._materialize()
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def clear(self):
+        dict.clear(self)
+        self._element = None
+        self._attributes = None
+        self._children = None
+
+    def copy(self):
+        self._materialize()
+        return ElementDictionary(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def child_keys(self):
+        if self._element is not None:
+            return list(self._child_elements())
+        return [k for k, v in dict.items(self) if isinstance(v, list)]
+
+
 def read_xml_tree(element):
-    tag = ElementDictionary({"@" + k.lower() : v for k, v in element.attrib.items()})
-    if element.text and not element.text.isspace():
-        tag["#text"] = element.text
+    return ElementView(element)
+
+
+def walk_xml_tree(tree):
+    yield tree
+    for key in tree.child_keys():
+        for child in tree[key]:
+            yield from walk_xml_tree(child)
+
+
+def index_xml_ids(tree, ids=None):
+    if ids is None:
+        ids = {}
+
+    # Keeps the first element for each ID in the same order a recursive search over the dictionaries would find.
+    for element in walk_xml_tree(tree):
+        id = element.get("@id")
+        if id:
+            ids.setdefault(id, element)
+
+    return ids
+
+
+def unindex_xml_ids(tree, ids):
+    for element in walk_xml_tree(tree):
+        id = element.get("@id")
+        if id and ids.get(id) is element:
+            del ids[id]
+
+
+def xml_file_exists(path):
+    if _file_dependencies is not None:
+        _file_dependencies.append(path)
+    return os.path.exists(path)
+
+
+# Many vehicles share loadout, definition and patch files. Views never modify the underlying elements, so each caller
+# gets its own view over the cached root and can change it freely.
+@functools.lru_cache(maxsize=64)
+def _parse_xml_file(path, modified_time, size):
+    return ElementTree.parse(path).getroot()
+
+
+def xml_file_cache_info():
+    return _parse_xml_file.cache_info()
+
 
-    for child in element:
-        key = child.tag.lower()
-        if not key in tag:
-            tag[key] = []
-        tag[key].append(read_xml_tree(child))
-    return tag
+def clear_xml_file_cache():
+    _parse_xml_file.cache_clear()
 
 
 def read_xml_file(path):
-    root = ElementTree.parse(path).getroot()
-    return read_xml_tree(root)
\ No newline at end of file
+    if _file_dependencies is not None:
+        _file_dependencies.append(path)
+    stat = os.stat(path)
+    with profiler.phase("read_xml_file"):
+        root = _parse_xml_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    return read_xml_tree(root)
@@ -168,16 +168,20 @@ const deserialize = (str, vehicleName) => {
 const deserializeV1VehicleName = (str) => {
     const hashedbaseName = str.substr(1, 4);
     const hashedModificationName = str.substr(5, 4);
-    const match = Object.values(allVehicles).find(n =>
+    const match = Object.entries(publishedVehicles()).find(([, n]) =>
         hashAndEncode(n.baseName) == hashedbaseName &&
         hashAndEncode(n.modificationName) == hashedModificationName);
     if (match) {
-        return match.name;
+        return match[0];
     }
 }
 
 class LoadoutStorage {
     constructor() {
+        this.read();
+    }
+
+    read() {
         this._loadouts = {};
 
         try {
@@ -185,6 +189,12 @@ class LoadoutStorage {
                 try {
                     const entry = JSON.parse(value);
 
+                    // Loadouts of vehicles that weren't loaded from shards yet are read once they are.
+                    const vehicleName = entry.vehicleName || deserializeV1VehicleName(entry.value);
+                    if (vehicleName in publishedVehicles() && !(vehicleName in allVehicles)) {
+                        continue;
+                    }
+
                     // Migrate old saved loadouts.
                     if (!entry.vehicleName) {
                         entry.vehicleName = deserializeV1VehicleName(entry.value);
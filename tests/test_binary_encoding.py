@@ -0,0 +1,52 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import binary_encoding
+
+
+_root_path = os.path.join(os.path.dirname(__file__), "..")
+
+_value = {
+    "ports": [{"name": "hardpoint_weapon", "flags": ["uneditable", "invisible"], "minSize": 1, "maxSize": 3}] * 3,
+    "numbers": [0, 1, -1, 63, -64, 127, 128, -129, 2 ** 40, -(2 ** 40), 0.5, -1234.5678, 1e-9],
+    "nothing": None,
+    "switches": [True, False],
+    "names": ["", "Größe", "中文", "emoji \U0001F680"],
+    "nested": {"empty": {}, "list": [[], [{}]]}
+}
+
+
+class BinaryEncodingTest(unittest.TestCase):
+    def test_decoding_gives_the_encoded_value(self):
+        self.assertEqual(binary_encoding.decode(binary_encoding.encode(_value)), _value)
+
+    def test_repeated_strings_are_stored_once(self):
+        encoded = binary_encoding.encode(["hardpoint_weapon"] * 100)
+        self.assertEqual(encoded.count(b"hardpoint_weapon"), 1)
+
+    @unittest.skipUnless(shutil.which("node"), "node isn't installed")
+    def test_client_decodes_the_encoded_value(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "value.bin")
+            with open(path, "wb") as binary_file:
+                binary_file.write(binary_encoding.encode(_value))
+
+            script = (
+                "const fs = require('fs');" +
+                "require('vm').runInThisContext(fs.readFileSync(process.argv[1], 'utf8'));" +
+                "const data = fs.readFileSync(process.argv[2]);" +
+                "console.log(JSON.stringify(decodeBinaryData(data.buffer.slice(data.byteOffset, data.byteOffset + data.length))));")
+            output = subprocess.check_output(["node", "-e", script, os.path.join(_root_path, "loader.js"), path])
+
+        self.assertEqual(json.loads(output), _value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import contextlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import extract
+from conversion_cache import ConversionCache
+from extract import convert_game_xml, reconvert_records
+from localization import LocalizationTable, localization_path
+from store import ConvertedStore
+from synthetic_data import generate_corpus
+
+
+def _read_json(path):
+    with open(path, "r", encoding="UTF-8") as json_file:
+        return json.load(json_file)
+
+
+def _reconvert(extracted_path, pattern):
+    localization = LocalizationTable(localization_path(extracted_path))
+    with contextlib.redirect_stdout(io.StringIO()):
+        reconvert_records(os.path.join(extracted_path, "Data", "Game.xml"), extracted_path, localization, pattern)
+    localization.close()
+
+
+def _convert(extracted_path, **options):
+    localization = LocalizationTable(localization_path(extracted_path))
+    with contextlib.redirect_stdout(io.StringIO()):
+        convert_game_xml(os.path.join(extracted_path, "Data", "Game.xml"), extracted_path, localization, **options)
+    localization.close()
+
+    outputs = {}
+    for family in ["vehicles", "items", "ammo_params"]:
+        for path in [family + ".json", family + ".hashes.json"]:
+            with open(os.path.join(extracted_path, path), "rb") as json_file:
+                outputs[path] = json_file.read()
+    return outputs
+
+
+def _read_store(path):
+    connection = sqlite3.connect(path)
+    rows = {table: connection.execute("SELECT * FROM " + table + " ORDER BY 1").fetchall() for table in ["vehicles", "items", "ammo_params"]}
+    connection.close()
+    return rows
+
+
+class ConversionTest(unittest.TestCase):
+    def test_converting_twice_gives_identical_output(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+
+            first = _convert(extracted_path)
+            second = _convert(extracted_path)
+
+            self.assertEqual(first, second)
+
+            # The corpus has nameless turret ports, so the generated names are part of what's compared.
+            items = json.loads(first["items.json"])
+            generated = [[x for x in item["ports"] if x.startswith("unnamed_")] for item in items.values()]
+            generated = [x for x in generated if x]
+            self.assertTrue(generated)
+            for names in generated:
+                self.assertEqual(len(names), 2)
+
+    def test_every_mode_gives_the_same_output(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+            expected = _convert(extracted_path)
+
+            modes = {
+                "stream": {"stream": True},
+                "jobs": {"jobs": 2},
+                "stream and jobs": {"stream": True, "jobs": 2},
+                "chunked": {"chunked": True, "jobs": 2}
+            }
+            for mode, options in modes.items():
+                with self.subTest(mode=mode):
+                    self.assertEqual(_convert(extracted_path, **options), expected)
+
+            # The second conversion only has cached records.
+            for mode in ["empty cache", "filled cache"]:
+                with self.subTest(mode=mode):
+                    cache = ConversionCache(os.path.join(extracted_path, "cache.json"), extracted_path, "test")
+                    self.assertEqual(_convert(extracted_path, cache=cache), expected)
+                    cache.save()
+            self.assertEqual(cache.misses, 0)
+
+    def test_cache_keys_ignore_the_text_after_a_record(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            cache = ConversionCache(os.path.join(extracted_path, "cache.json"), extracted_path, "test")
+
+            # Streaming hands records over before the text following them may have been read.
+            streamed = ElementTree.fromstring("<EntityClassDefinition.A><Components /></EntityClassDefinition.A>")
+            parsed = ElementTree.fromstring("<EntityClassDefinition.A><Components /></EntityClassDefinition.A>")
+            parsed.tail = "\n"
+
+            self.assertEqual(cache.make_key("items", streamed), cache.make_key("items", parsed))
+            self.assertEqual(parsed.tail, "\n")
+
+    def test_first_record_with_a_key_wins(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+            expected = _convert(extracted_path, store=ConvertedStore(os.path.join(extracted_path, "expected.sqlite")))
+
+            # Follow a weapon and some ammo params with different records under the same keys. The ammo params are
+            # used by weapons after them, so their metrics would change if the duplicate won there.
+            game_xml_path = os.path.join(extracted_path, "Data", "Game.xml")
+            tree = ElementTree.parse(game_xml_path)
+            root = tree.getroot()
+            for prefix, attribute_path, attribute in [("EntityClassDefinition.WEAPONGUN_", ".//AttachDef", "Size"), ("AmmoParams.", ".", "speed")]:
+                index, original = next((i, x) for i, x in enumerate(root) if x.tag.startswith(prefix))
+                duplicate = ElementTree.fromstring(ElementTree.tostring(original))
+                duplicate.find(attribute_path).set(attribute, "7")
+                root.insert(index + 1, duplicate)
+            tree.write(game_xml_path)
+
+            actual = _convert(extracted_path, store=ConvertedStore(os.path.join(extracted_path, "actual.sqlite")))
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(_read_store(os.path.join(extracted_path, "expected.sqlite")), _read_store(os.path.join(extracted_path, "actual.sqlite")))
+
+    def test_reconverting_drops_records_that_are_now_hidden(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+            _convert(extracted_path)
+
+            name = next(iter(_read_json(os.path.join(extracted_path, "items.json"))))
+            hashes = _read_json(os.path.join(extracted_path, "items.hashes.json"))
+            self.assertIn(name, hashes)
+
+            patterns_path = os.path.join(extracted_path, "hidden_items.txt")
+            with open(patterns_path, "w", encoding="UTF-8") as patterns_file:
+                patterns_file.write(name + "\n")
+
+            with mock.patch.dict(extract._hidden_pattern_files, {"items": patterns_path}):
+                _reconvert(extracted_path, name)
+
+            self.assertNotIn(name, _read_json(os.path.join(extracted_path, "items.json")))
+            self.assertNotIn(name, _read_json(os.path.join(extracted_path, "items.hashes.json")))
+            self.assertEqual(_read_json(os.path.join(extracted_path, "hidden_records.json"))["items"][name], name)
+
+    def test_reconverting_drops_records_that_no_longer_convert(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+            _convert(extracted_path)
+
+            name = next(iter(_read_json(os.path.join(extracted_path, "items.json"))))
+            with mock.patch("extract.convert_item", return_value=None):
+                _reconvert(extracted_path, name)
+
+            self.assertNotIn(name, _read_json(os.path.join(extracted_path, "items.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from forge import build_record_offsets, load_record_offsets, read_forge_records
+from synthetic_data import generate_corpus
+
+
+# Records written as empty elements, with no text between them, with comments after them and with multibyte
+# characters before them, so byte and character offsets differ.
+_game_xml = """<?xml version="1.0" encoding="utf-8"?>
+<GameData>
+    <!-- Größe -->
+    <EntityClassDefinition.A __type="EntityClassDefinition" __ref="1" __path="a.xml"><Components name="ü" /></EntityClassDefinition.A>
+    <EntityClassDefinition.B __ref="2" __path="b.xml" /><AmmoParams.C __ref="3" __path="c.xml">中文<x /></AmmoParams.C><!-- end -->
+    <EntityClassDefinition.D __ref="4" /></GameData>"""
+
+
+def _serialize(element):
+    element.tail = None
+    return ElementTree.tostring(element)
+
+
+class RecordOffsetsTest(unittest.TestCase):
+    def assert_offsets_match_parsing(self, game_xml_path):
+        offsets = build_record_offsets(game_xml_path)
+        elements = list(ElementTree.parse(game_xml_path).getroot())
+
+        self.assertEqual([x[0] for x in offsets], [x.tag for x in elements])
+        self.assertEqual([x[1] for x in offsets], [x.get("__path") for x in elements])
+        self.assertEqual([x[2] for x in offsets], [x.get("__ref") for x in elements])
+        self.assertEqual([_serialize(x) for x in read_forge_records(game_xml_path, offsets)], [_serialize(x) for x in elements])
+
+    def test_offsets_match_parsing_the_corpus(self):
+        with tempfile.TemporaryDirectory() as extracted_path:
+            generate_corpus(extracted_path, 5)
+            self.assert_offsets_match_parsing(os.path.join(extracted_path, "Data", "Game.xml"))
+
+    def test_offsets_match_parsing_unusual_layouts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            game_xml_path = os.path.join(directory, "Game.xml")
+            with open(game_xml_path, "wb") as game_xml_file:
+                game_xml_file.write(_game_xml.encode("UTF-8"))
+
+            self.assert_offsets_match_parsing(game_xml_path)
+
+            # Nothing around a record is part of it.
+            expected = [
+                '<EntityClassDefinition.A __type="EntityClassDefinition" __ref="1" __path="a.xml"><Components name="ü" /></EntityClassDefinition.A>',
+                '<EntityClassDefinition.B __ref="2" __path="b.xml" />',
+                '<AmmoParams.C __ref="3" __path="c.xml">中文<x /></AmmoParams.C>',
+                '<EntityClassDefinition.D __ref="4" />'
+            ]
+            game_xml = _game_xml.encode("UTF-8")
+            self.assertEqual([game_xml[x[3]:x[4]].decode("UTF-8") for x in build_record_offsets(game_xml_path)], expected)
+
+    def test_unreadable_index_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as directory:
+            game_xml_path = os.path.join(directory, "Game.xml")
+            with open(game_xml_path, "wb") as game_xml_file:
+                game_xml_file.write(_game_xml.encode("UTF-8"))
+
+            index_path = os.path.join(directory, "record_index.json")
+            with open(index_path, "w", encoding="UTF-8") as index_file:
+                index_file.write('{"signature": [1, ')
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                offsets = load_record_offsets(game_xml_path, index_path)
+            self.assertEqual(offsets, build_record_offsets(game_xml_path))
+            self.assertEqual(load_record_offsets(game_xml_path, index_path), offsets)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import fnmatch
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from extract import read_lines_file
+from pattern_matcher import PatternMatcher
+
+
+def _first_match(patterns, name):
+    return next((x for x in patterns if fnmatch.fnmatchcase(name, x)), None)
+
+
+class PatternMatcherTest(unittest.TestCase):
+    def test_matches_like_trying_every_pattern_in_turn(self):
+        # A small alphabet makes names share prefixes and suffixes with the patterns, and with each other.
+        generator = random.Random(0)
+        pieces = ["a", "b", "_", "A", "*", "?", "[ab]", "[!a]"]
+
+        for _ in range(200):
+            patterns = ["".join(generator.choice(pieces) for _ in range(generator.randint(0, 4))) for _ in range(generator.randint(1, 8))]
+            matcher = PatternMatcher(patterns)
+
+            for _ in range(50):
+                name = "".join(generator.choice("ab_A") for _ in range(generator.randint(0, 6)))
+                self.assertEqual(matcher.match(name), _first_match(patterns, name), (patterns, name))
+
+    def test_matches_the_hidden_record_patterns(self):
+        scripts_path = os.path.join(os.path.dirname(__file__), "..", "scripts")
+        names = ["AEGS_Gladius", "AEGS_Gladius_Shark", "test_ship", "Ship_template", "Ship_Template", "GATS_BallisticGatling_S3",
+            "MISL_S03_CS_FSKI_Tempest", "Turret_Fake", "Dummy", "", "*"]
+
+        for file_name in ["hidden_vehicles.txt", "hidden_items.txt"]:
+            patterns = read_lines_file(os.path.join(scripts_path, file_name))
+            matcher = PatternMatcher(patterns)
+            for name in names:
+                self.assertEqual(matcher.match(name), _first_match(patterns, name), (file_name, name))
+
+    def test_reports_patterns_that_never_matched(self):
+        matcher = PatternMatcher(["a*", "*b", "c", "d?"])
+        for name in ["ab", "c"]:
+            matcher.match(name)
+
+        self.assertEqual(matcher.unused_patterns(), ["*b", "d?"])
+
+
+if __name__ == "__main__":
+    unittest.main()